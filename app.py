@@ -1,5 +1,6 @@
 import io
 import os
+import contextlib
 import re
 import sys
 import glob
@@ -20,6 +21,8 @@ from pdf_parser import (
     parse_pdf, split_articles, _detect_lang,
     extract_structured_articles, save_structured_to_excel
 )
+from parsers import profile_parsers
+from parsers.profiling import profile_rows
 from html_parser import parse_eu_html_to_dataframe, parse_china_html_to_dataframe, parse_nz_html_to_dataframe, parse_taiwan_html_to_dataframe, parse_germany_html_to_dataframe, parse_russia_html_to_dataframe
 from translator import translate_batch, _clean_translation_output
 from embedder import (
@@ -27,6 +30,7 @@ from embedder import (
     find_similar_korean_ai,
     find_similar_korean_batch,
     select_relevant_korean_laws,
+    warm_up as warm_up_embedder,
 )
 
 # ── 페이지 설정 ──────────────────────────────────────────────
@@ -37,6 +41,26 @@ st.set_page_config(
     initial_sidebar_state="expanded",
 )
 
+# ── 임베딩 모델 예열 ──────────────────────────────────────────
+def _warm_up_embedder_worker():
+    try:
+        mode = warm_up_embedder()
+        print(f"임베딩 모델 예열 완료 ({mode})")
+    except Exception as e:
+        # 예열 실패는 무시 (첫 매칭 때 다시 로드 시도)
+        print(f"⚠️ 임베딩 모델 예열 실패: {type(e).__name__}: {e}")
+
+
+@st.cache_resource(show_spinner=False)
+def _start_embedder_warm_up() -> threading.Thread:
+    """프로세스당 한 번, 첫 매칭 전에 임베딩 모델을 백그라운드에서 준비한다."""
+    thread = threading.Thread(target=_warm_up_embedder_worker, daemon=True, name="embedder-warm-up")
+    thread.start()
+    return thread
+
+
+_start_embedder_warm_up()
+
 # ── 데이터 경로 ──────────────────────────────────────────────
 PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
 
@@ -823,6 +847,13 @@ def _esc(text: str) -> str:
     return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
 
 
+def _parser_profiling(enabled: bool):
+    """enabled이면 파서 단계별 계측 블록, 아니면 빈 딕셔너리를 내주는 블록."""
+    if enabled:
+        return profile_parsers()
+    return contextlib.nullcontext({})
+
+
 # ── 공통 스타일 ──────────────────────────────────────────────
 DETAIL_STYLE = """
 <style>
@@ -1164,6 +1195,13 @@ if page == "법령 구조화":
     else:
         can_run = struct_pdf_selected is not None
 
+    struct_profile = st.checkbox(
+        "파서 단계별 실행 시간 측정",
+        value=False,
+        key="struct_profile",
+        help="PDF/RTF 구조화 시 국가별 파서의 단계(텍스트 추출, 조문 분리, 계층 감지, 항/호 파싱, 원문 정리)별 호출 수와 누적 시간을 표시합니다."
+    )
+
     struct_run = st.button(
         "🚀 구조화 실행",
         type="primary",
@@ -1174,6 +1212,7 @@ if page == "법령 구조화":
     if struct_run:
         output_dir = os.path.join(DATA_DIR, "output")
         os.makedirs(output_dir, exist_ok=True)
+        parser_profile = {}
 
         with st.status("법령 구조화 파싱 중...", expanded=True) as status:
             # 일본 HTML 파일 업로드 처리
@@ -1283,11 +1322,13 @@ if page == "법령 구조화":
                 elif file_extension == '.rtf':
                     # RTF 파일 처리 (미국법)
                     st.write("미국 법령 RTF 파싱 중...")
-                    df_structured = extract_structured_articles(struct_pdf_selected)
+                    with _parser_profiling(struct_profile) as parser_profile:
+                        df_structured = extract_structured_articles(struct_pdf_selected)
                     st.write(f"{len(df_structured)}개 항목 추출 (조/항/호 단위)")
                 else:
                     # PDF/RTF 파일 처리
-                    df_structured = extract_structured_articles(struct_pdf_selected)
+                    with _parser_profiling(struct_profile) as parser_profile:
+                        df_structured = extract_structured_articles(struct_pdf_selected)
                     st.write(f"{len(df_structured)}개 항목 추출 (조/항/호 단위)")
 
                 # 파일명 생성
@@ -1341,6 +1382,11 @@ if page == "법령 구조화":
         st.subheader("구조화 결과 미리보기")
         st.dataframe(df_structured.head(20), use_container_width=True, hide_index=True)
 
+        if parser_profile:
+            with st.expander("파서 단계별 실행 시간", expanded=True):
+                st.dataframe(pd.DataFrame(profile_rows(parser_profile)),
+                             use_container_width=True, hide_index=True)
+
         # Excel 다운로드 버튼 추가
         import io
         excel_buffer = io.BytesIO()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""조문 단위 파싱 마이크로 벤치마크.
+
+DATA/ 아래 PDF/RTF 파일마다 조문 하나씩 구조화(제목 추출, 원문 정리, 항/호 파싱)하는
+시간을 측정해 조문당 평균 시간을 출력한다. 텍스트 추출 시간은 포함하지 않는다
+(추출 텍스트 캐시를 사용하므로 두 번째 실행부터는 바로 측정된다).
+
+--purge-re-cache 옵션을 주면 조문마다 re 모듈 캐시를 비운 상태에서 측정한다.
+패턴이 많아 re 캐시가 밀려나는 상황(캐시 thrash)에서의 비용을 확인할 때 사용한다.
+
+사용법:
+    python bench_article_parsing.py [--repeat N] [--purge-re-cache] [파일 ...]
+"""
+
+import argparse
+import glob
+import os
+import re
+import time
+
+from parsers import (
+    get_parser,
+    split_articles,
+    _detect_lang,
+    _detect_format,
+    _detect_hierarchy,
+    _iter_article_rows,
+    _load_text,
+)
+
+
+def bench_file(file_path: str, repeat: int = 3, purge_re_cache: bool = False) -> dict:
+    """파일 하나의 조문당 파싱 시간을 측정한다.
+
+    Returns:
+        {"file", "articles", "rows", "per_article_ms"} 딕셔너리 (repeat 중 최솟값 기준)
+    """
+    parser = get_parser(file_path)
+    text = _load_text(file_path)
+    lang = _detect_lang(file_path)
+    fmt = _detect_format(file_path)
+    hierarchy = _detect_hierarchy(text, lang, file_path=file_path)
+    articles = split_articles(text, lang=lang, file_path=file_path)
+
+    best = None
+    rows = 0
+    for _ in range(repeat):
+        elapsed = 0.0
+        rows = 0
+        for article in articles:
+            if purge_re_cache:
+                re.purge()
+            t = time.perf_counter()
+            rows += len(list(_iter_article_rows(parser, text, [article], hierarchy, lang, fmt)))
+            elapsed += time.perf_counter() - t
+        best = elapsed if best is None else min(best, elapsed)
+
+    return {
+        "file": os.path.basename(file_path),
+        "articles": len(articles),
+        "rows": rows,
+        "per_article_ms": best * 1000 / max(len(articles), 1),
+    }
+
+
+def main():
+    ap = argparse.ArgumentParser(description="조문 단위 파싱 마이크로 벤치마크")
+    ap.add_argument("files", nargs="*", help="대상 파일 (기본: DATA/*/*.pdf, *.rtf)")
+    ap.add_argument("--repeat", type=int, default=3, help="반복 횟수 (최솟값 사용)")
+    ap.add_argument("--purge-re-cache", action="store_true", help="조문마다 re 캐시 비우기")
+    args = ap.parse_args()
+
+    files = args.files or [
+        f for f in sorted(glob.glob(os.path.join("DATA", "*", "*")))
+        if f.lower().endswith((".pdf", ".rtf"))
+    ]
+
+    total_articles = 0
+    total_ms = 0.0
+    for file_path in files:
+        try:
+            result = bench_file(file_path, args.repeat, args.purge_re_cache)
+        except Exception as e:
+            print(f"{os.path.basename(file_path)[:50]:52s} 건너뜀: {e}")
+            continue
+        total_articles += result["articles"]
+        total_ms += result["per_article_ms"] * result["articles"]
+        print(f"{result['file'][:50]:52s} 조문 {result['articles']:5d}  행 {result['rows']:5d}  "
+              f"조문당 {result['per_article_ms']:.3f} ms")
+
+    if total_articles:
+        print(f"{'전체':52s} 조문 {total_articles:5d}  조문당 {total_ms / total_articles:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""벡터 인덱스 재현율·지연 시간 비교 (vector_index).
+
+전체 검색(BruteForceIndex) 결과를 정답으로 두고, IVF 인덱스의 nprobe별
+recall@k와 질의당 검색 시간을 출력한다.
+
+말뭉치는 기본으로 합성 데이터(군집이 있는 정규화 벡터)를 쓰고,
+--cache-key를 주면 .embedding_cache/<cache_key>/ 의 실제 한국법 임베딩을 쓴다
+(질의는 말뭉치 조문에 잡음을 더해 만든다).
+
+사용법:
+    python bench_vector_index.py
+    python bench_vector_index.py --rows 100000 --nlist 1024 --nprobe 8 16 32 64
+    python bench_vector_index.py --cache-key 3f2a9c... --k 5
+"""
+
+import argparse
+import sys
+import time
+
+import numpy as np
+
+from vector_index import BruteForceIndex, IVFIndex
+
+
+def _normalize(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return (matrix / norms).astype(np.float32)
+
+
+def synthetic_corpus(rows: int, dim: int, clusters: int, seed: int) -> np.ndarray:
+    """군집 중심 주변에 흩어진 정규화 벡터 (법률·장별로 모이는 조문 임베딩을 흉내)."""
+    rng = np.random.default_rng(seed)
+    centers = rng.standard_normal((clusters, dim)).astype(np.float32)
+    labels = rng.integers(0, clusters, rows)
+    return _normalize(centers[labels] + 0.8 * rng.standard_normal((rows, dim)).astype(np.float32))
+
+
+def make_queries(corpus: np.ndarray, count: int, noise: float, seed: int) -> np.ndarray:
+    rng = np.random.default_rng(seed + 1)
+    picked = corpus[rng.choice(len(corpus), count, replace=False)]
+    return _normalize(picked + noise * rng.standard_normal(picked.shape).astype(np.float32))
+
+
+def _timed_search(index, queries: np.ndarray, k: int, **kwargs) -> tuple[np.ndarray, float]:
+    t = time.perf_counter()
+    found, _ = index.search(queries, k, **kwargs)
+    return found, (time.perf_counter() - t) / len(queries)
+
+
+def recall_at_k(found: np.ndarray, truth: np.ndarray) -> float:
+    hits = sum(len(set(f) & set(t)) for f, t in zip(found.tolist(), truth.tolist()))
+    return hits / truth.size
+
+
+def main():
+    ap = argparse.ArgumentParser(description="벡터 인덱스 재현율·지연 시간 비교")
+    ap.add_argument("--cache-key", default="", help="실제 임베딩 캐시 키 (없으면 합성 데이터)")
+    ap.add_argument("--rows", type=int, default=50000, help="합성 말뭉치 행 수")
+    ap.add_argument("--dim", type=int, default=1024, help="합성 임베딩 차원")
+    ap.add_argument("--clusters", type=int, default=200, help="합성 데이터 군집 수")
+    ap.add_argument("--queries", type=int, default=200, help="질의 수")
+    ap.add_argument("--noise", type=float, default=0.5, help="질의 생성 잡음 크기")
+    ap.add_argument("--k", type=int, default=10, help="질의당 결과 수")
+    ap.add_argument("--nlist", type=int, default=0, help="IVF 군집 수 (0이면 4·√행 수)")
+    ap.add_argument("--nprobe", type=int, nargs="+", default=[1, 4, 8, 16, 32, 64],
+                    help="비교할 nprobe 값")
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args()
+
+    if args.cache_key:
+        import embedder
+        index = embedder._load_cache(args.cache_key)
+        if index is None:
+            print(f"임베딩 캐시가 없습니다: {args.cache_key}")
+            sys.exit(2)
+        corpus = _normalize(np.asarray(index["embeddings"], dtype=np.float32))
+    else:
+        corpus = synthetic_corpus(args.rows, args.dim, args.clusters, args.seed)
+    queries = make_queries(corpus, min(args.queries, len(corpus)), args.noise, args.seed)
+    print(f"말뭉치 {corpus.shape[0]}×{corpus.shape[1]}, 질의 {len(queries)}개, k={args.k}")
+
+    brute = BruteForceIndex(corpus)
+    truth, brute_sec = _timed_search(brute, queries, args.k)
+
+    t = time.perf_counter()
+    ivf = IVFIndex(corpus, nlist=args.nlist or None, seed=args.seed)
+    build_sec = time.perf_counter() - t
+    print(f"IVF 구축 {build_sec:.2f}초 (nlist={ivf.nlist})")
+
+    print(f"{'인덱스':<14}{'recall@k':>10}{'ms/질의':>10}{'속도':>8}")
+    print(f"{'brute':<14}{1.0:>10.4f}{brute_sec * 1000:>10.3f}{1.0:>7.1f}x")
+    for nprobe in args.nprobe:
+        if nprobe > ivf.nlist:
+            continue
+        found, sec = _timed_search(ivf, queries, args.k, nprobe=nprobe)
+        print(f"{f'ivf/{nprobe}':<14}{recall_at_k(found, truth):>10.4f}"
+              f"{sec * 1000:>10.3f}{brute_sec / sec:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
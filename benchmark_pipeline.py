@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""구조화 파이프라인 벤치마크.
+
+DATA/ 아래 모든 PDF/RTF 파일(EPC, KOREA, HONGKONG, USA, NEWZEALAND, TAIWAN)과
+독일 XML 파일을 구조화하면서 단계별 실행 시간, 최대 메모리(RSS), 초당 행 수를 측정해
+JSON 기준 파일로 저장한다. 기준 파일과 비교하면 특정 국가 파서의 성능 저하를 바로 확인할 수 있다.
+
+측정 단계 (extract_structured_articles와 같은 순서):
+    text_extraction → hierarchy_detection → article_split → paragraph_parse → sort → fill → excel_write
+독일 XML: xml_parse → build_rows → excel_write
+
+파일마다 별도 프로세스에서 실행하므로 최대 RSS는 파일 단위로 측정된다.
+(RSS 값은 해당 단계가 끝난 시점까지의 프로세스 최대값)
+
+사용법:
+    python benchmark_pipeline.py                               # bench_baseline.json 생성
+    python benchmark_pipeline.py --output new.json --compare bench_baseline.json
+    python benchmark_pipeline.py --use-cache DATA/EPC/*.pdf   # 추출 텍스트 캐시 사용
+"""
+
+import argparse
+import datetime
+import glob
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+
+DEFAULT_OUTPUT = "bench_baseline.json"
+
+# 비교 시 이 비율 이상 느려지고, 차이가 MIN_REGRESSION_SECONDS 이상이면 성능 저하로 표시
+DEFAULT_TOLERANCE = 0.25
+MIN_REGRESSION_SECONDS = 0.05
+
+
+def _peak_rss_mb() -> float:
+    """현재 프로세스의 최대 RSS (MB)."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 바이트 단위
+    if sys.platform == "darwin":
+        return peak / (1024 * 1024)
+    return peak / 1024
+
+
+class _StageTimer:
+    """단계별 시간과 최대 RSS를 기록한다."""
+
+    def __init__(self):
+        self.stages = {}
+
+    def run(self, name: str, fn, *args, **kwargs):
+        t = time.perf_counter()
+        result = fn(*args, **kwargs)
+        self.stages[name] = {
+            "seconds": time.perf_counter() - t,
+            "peak_rss_mb": _peak_rss_mb(),
+        }
+        return result
+
+
+def bench_structured(file_path: str, use_cache: bool = False) -> dict:
+    """PDF/RTF 파일 하나를 단계별로 구조화하며 측정한다 (extract_structured_articles와 같은 처리)."""
+    import pandas as pd
+    from parsers import (
+        get_parser,
+        split_articles,
+        save_structured_to_excel,
+        _load_text,
+        _detect_lang,
+        _detect_format,
+        _detect_hierarchy,
+        _iter_article_rows,
+        _normalize_article_id,
+        _sort_structured,
+        _fill_missing_hierarchy,
+    )
+    from parsers.hongkong import HongkongParser
+
+    timer = _StageTimer()
+    parser = get_parser(file_path)
+    lang = _detect_lang(file_path)
+    fmt = _detect_format(file_path)
+
+    text = timer.run("text_extraction", _load_text, file_path, use_cache=use_cache)
+    hierarchy = timer.run("hierarchy_detection", _detect_hierarchy, text, lang, file_path=file_path)
+    articles = timer.run("article_split", split_articles, text, lang=lang, file_path=file_path)
+
+    def _parse():
+        df = pd.DataFrame(list(_iter_article_rows(parser, text, articles, hierarchy, lang, fmt)))
+        if '조문번호' in df.columns:
+            df['조문번호'] = df['조문번호'].apply(_normalize_article_id)
+        return df
+
+    df = timer.run("paragraph_parse", _parse)
+    df = timer.run("sort", _sort_structured, df, is_hk=isinstance(parser, HongkongParser))
+    df = timer.run("fill", _fill_missing_hierarchy, df)
+    _excel_write(timer, save_structured_to_excel, df)
+
+    return {"parser": type(parser).__name__, "articles": len(articles), "rows": len(df),
+            "stages": timer.stages}
+
+
+def bench_german_xml(file_path: str) -> dict:
+    """독일 XML 파일 하나를 단계별로 구조화하며 측정한다 (extract_structured_articles_from_xml 경로)."""
+    from parsers.base import save_structured_to_excel
+    from parsers.germany import parse_german_xml, extract_structured_articles_from_xml
+
+    timer = _StageTimer()
+    articles = timer.run("xml_parse", parse_german_xml, file_path)
+    # 행 구성 단계는 XML 파싱을 포함하므로 파싱 시간을 빼서 기록한다
+    df = timer.run("build_rows", extract_structured_articles_from_xml, file_path)
+    timer.stages["build_rows"]["seconds"] = max(
+        timer.stages["build_rows"]["seconds"] - timer.stages["xml_parse"]["seconds"], 0.0
+    )
+    _excel_write(timer, save_structured_to_excel, df)
+
+    return {"parser": "GermanyXml", "articles": len(articles), "rows": len(df),
+            "stages": timer.stages}
+
+
+def _excel_write(timer: _StageTimer, save_fn, df):
+    with tempfile.TemporaryDirectory() as tmp:
+        timer.run("excel_write", save_fn, df, os.path.join(tmp, "bench.xlsx"))
+
+
+def bench_file(file_path: str, use_cache: bool = False) -> dict:
+    """파일 하나를 측정하고 초당 행 수를 붙여 반환한다. 실패하면 status='error'."""
+    t = time.perf_counter()
+    try:
+        if file_path.lower().endswith(".xml"):
+            result = bench_german_xml(file_path)
+        else:
+            result = bench_structured(file_path, use_cache=use_cache)
+    except Exception as e:
+        return {"status": "error", "error": f"{type(e).__name__}: {e}",
+                "total_seconds": time.perf_counter() - t}
+
+    rows = result["rows"]
+    for stage in result["stages"].values():
+        stage["rows_per_sec"] = rows / stage["seconds"] if stage["seconds"] > 0 else None
+    result["status"] = "ok"
+    result["total_seconds"] = sum(s["seconds"] for s in result["stages"].values())
+    result["peak_rss_mb"] = max(s["peak_rss_mb"] for s in result["stages"].values())
+    return result
+
+
+def _default_files() -> list[str]:
+    files = [
+        f for f in sorted(glob.glob(os.path.join("DATA", "*", "*")))
+        if f.lower().endswith((".pdf", ".rtf", ".xml"))
+    ]
+    return files
+
+
+def _run_isolated(file_path: str, use_cache: bool) -> dict:
+    """파일 하나를 별도 프로세스에서 측정한다 (파일별 최대 RSS 분리)."""
+    cmd = [sys.executable, os.path.abspath(__file__), "--single", file_path]
+    if use_cache:
+        cmd.append("--use-cache")
+    proc = subprocess.run(cmd, capture_output=True, text=True)
+    try:
+        # 파서가 표준 출력에 남기는 메시지가 있을 수 있으므로 마지막 줄만 JSON으로 읽음
+        return json.loads(proc.stdout.strip().splitlines()[-1])
+    except (IndexError, json.JSONDecodeError):
+        return {"status": "error", "error": (proc.stderr or proc.stdout).strip()[-500:]}
+
+
+def compare(current: dict, baseline: dict, tolerance: float = DEFAULT_TOLERANCE) -> list[str]:
+    """기준 결과와 비교하여 성능 저하·행 수 변화 목록을 반환한다."""
+    problems = []
+    for name, base in baseline.get("files", {}).items():
+        cur = current.get("files", {}).get(name)
+        if cur is None:
+            continue
+        if base.get("status") != cur.get("status"):
+            problems.append(f"{name}: 상태 변화 {base.get('status')} → {cur.get('status')}")
+            continue
+        if cur.get("status") != "ok":
+            continue
+        if base.get("rows") != cur.get("rows"):
+            problems.append(f"{name}: 행 수 변화 {base.get('rows')} → {cur.get('rows')}")
+        for stage, b in base.get("stages", {}).items():
+            c = cur.get("stages", {}).get(stage)
+            if c is None:
+                continue
+            diff = c["seconds"] - b["seconds"]
+            if diff > MIN_REGRESSION_SECONDS and c["seconds"] > b["seconds"] * (1 + tolerance):
+                problems.append(
+                    f"{name} [{stage}]: {b['seconds']:.3f}s → {c['seconds']:.3f}s "
+                    f"(+{diff / b['seconds'] * 100 if b['seconds'] else float('inf'):.0f}%)"
+                )
+    return problems
+
+
+def _print_result(name: str, result: dict):
+    if result.get("status") != "ok":
+        print(f"{name[:60]:62s} 오류: {result.get('error', '')[:80]}")
+        return
+    print(f"{name[:60]:62s} {result['parser']:14s} 행 {result['rows']:6d}  "
+          f"{result['total_seconds']:7.2f}s  RSS {result['peak_rss_mb']:7.1f} MB")
+    for stage, s in result["stages"].items():
+        rps = f"{s['rows_per_sec']:12.0f}" if s["rows_per_sec"] else f"{'-':>12s}"
+        print(f"    {stage:22s} {s['seconds']:8.3f}s  {rps} 행/초  RSS {s['peak_rss_mb']:7.1f} MB")
+
+
+def main():
+    ap = argparse.ArgumentParser(description="구조화 파이프라인 벤치마크")
+    ap.add_argument("files", nargs="*", help="대상 파일 (기본: DATA/*/*.pdf, *.rtf, *.xml)")
+    ap.add_argument("--output", default=DEFAULT_OUTPUT, help="결과 JSON 경로")
+    ap.add_argument("--compare", help="비교할 기준 JSON 경로")
+    ap.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                    help="성능 저하 판정 비율 (기본 0.25 = 25%%)")
+    ap.add_argument("--use-cache", action="store_true", help="추출 텍스트 캐시 사용")
+    ap.add_argument("--single", help=argparse.SUPPRESS)
+    args = ap.parse_args()
+
+    if args.single:
+        # 하위 프로세스 모드: 결과 JSON 한 줄만 출력
+        print(json.dumps(bench_file(args.single, use_cache=args.use_cache), ensure_ascii=False))
+        return
+
+    results = {
+        "created": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "use_cache": args.use_cache,
+        "files": {},
+    }
+    for file_path in args.files or _default_files():
+        name = os.path.relpath(file_path).replace("\\", "/")
+        result = _run_isolated(file_path, args.use_cache)
+        results["files"][name] = result
+        _print_result(name, result)
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
+    print(f"\n결과 저장: {args.output}")
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        problems = compare(results, baseline, args.tolerance)
+        if problems:
+            print(f"\n⚠️ 기준({args.compare}) 대비 변화 {len(problems)}건:")
+            for p in problems:
+                print(f"  - {p}")
+            sys.exit(1)
+        print(f"\n✅ 기준({args.compare}) 대비 성능 저하 없음")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""임베딩 백엔드 정확도·속도 비교 (float32 torch 기준).
+
+DATA/output/구조화법률/한국/ 의 한국법 구조화 엑셀(조문 단위로 묶음)을 말뭉치로 쓰고,
+조문 제목(+ 본문 앞부분)을 질의로 하여 float32 모델과 비교 대상 백엔드(int8/onnx)의
+top-1 검색 결과 일치율, 임베딩 코사인 유사도, 초당 인코딩 수를 출력한다.
+
+일치율이 --min-agreement 미만이면 종료 코드 1을 반환한다.
+
+사용법:
+    python check_embedding_parity.py --backend int8
+    python check_embedding_parity.py --backend onnx --min-agreement 0.97 --limit 300
+"""
+
+import argparse
+import glob
+import os
+import sys
+import time
+import unicodedata
+
+import numpy as np
+import pandas as pd
+
+import embedder
+
+
+KOREA_DIR = os.path.join("DATA", "output", "구조화법률", "한국")
+
+
+def _resolve_path(path: str) -> str:
+    """한글 경로를 실제 디렉터리 항목 이름으로 바꾼다.
+
+    macOS에서 커밋된 한글 폴더명은 NFD(분해형)일 수 있으므로 경로 구성 요소마다 NFC로 비교한다.
+    """
+    resolved = ""
+    for part in path.replace("\\", "/").split("/"):
+        candidate = os.path.join(resolved, part) if resolved else part
+        if not os.path.exists(candidate) and os.path.isdir(resolved or "."):
+            target = unicodedata.normalize("NFC", part)
+            for entry in os.listdir(resolved or "."):
+                if unicodedata.normalize("NFC", entry) == target:
+                    candidate = os.path.join(resolved, entry) if resolved else entry
+                    break
+        resolved = candidate
+    return resolved
+
+
+def load_korea_articles(excel_dir: str = KOREA_DIR) -> list[dict]:
+    """한국법 구조화 엑셀을 조문 단위 dict 목록으로 읽는다 (앱의 한국법 로드와 같은 방식)."""
+    articles = []
+    excel_dir = _resolve_path(excel_dir)
+    paths = sorted(
+        p for p in glob.glob(os.path.join(excel_dir, "*.xlsx"))
+        if not os.path.basename(p).startswith("~$")
+        and unicodedata.normalize("NFC", os.path.basename(p)).startswith("구조화_한국_")
+    )
+    for path in paths:
+        df = pd.read_excel(path)
+        source = unicodedata.normalize("NFC", os.path.basename(path))
+        by_article = {}
+        for _, row in df.iterrows():
+            article_num = row.get("조문번호", "")
+            if pd.isna(article_num) or not str(article_num).strip():
+                continue
+            entry = by_article.setdefault(str(article_num), {
+                "rows": [],
+                "title": str(row.get("조문제목", "")).strip() if pd.notna(row.get("조문제목")) else "",
+            })
+            text = str(row.get("원문", "")).strip()
+            if text:
+                entry["rows"].append(text)
+        for article_num, entry in by_article.items():
+            if entry["rows"]:
+                articles.append({
+                    "id": article_num, "text": "\n".join(entry["rows"]),
+                    "source": source, "title": entry["title"],
+                })
+    return articles
+
+
+def _encode_timed(model, texts: list[str], batch_size: int) -> tuple[np.ndarray, float]:
+    t = time.perf_counter()
+    embeddings = model.encode(texts, batch_size=batch_size, normalize_embeddings=True)
+    return np.asarray(embeddings, dtype=np.float32), time.perf_counter() - t
+
+
+def main():
+    ap = argparse.ArgumentParser(description="임베딩 백엔드 정확도·속도 비교")
+    ap.add_argument("--backend", default="int8", choices=[b for b in embedder.EMBEDDING_BACKENDS if b != "torch"],
+                    help="비교할 백엔드")
+    ap.add_argument("--min-agreement", type=float, default=0.95, help="허용 최소 top-1 일치율")
+    ap.add_argument("--limit", type=int, default=0, help="말뭉치 조문 수 제한 (0이면 전체)")
+    ap.add_argument("--batch-size", type=int, default=32, help="인코딩 배치 크기")
+    args = ap.parse_args()
+
+    articles = load_korea_articles()
+    if args.limit:
+        articles = articles[:args.limit]
+    if not articles:
+        print(f"한국법 구조화 엑셀이 없습니다: {KOREA_DIR}")
+        sys.exit(2)
+
+    passages = [embedder._prepare_text(a["text"]) for a in articles]
+    queries = [
+        embedder._prepare_text(f"{a['title']} {a['text'][:200]}".strip(), is_query=True)
+        for a in articles
+    ]
+    print(f"말뭉치 {len(passages)}개 조문, 질의 {len(queries)}개")
+
+    results = {}
+    for backend in ("torch", args.backend):
+        model = embedder.load_model(embedder._MODEL_NAME, backend)
+        # 첫 호출 준비 비용은 측정에서 제외
+        model.encode(["query: warm up"], normalize_embeddings=True)
+        passage_emb, passage_sec = _encode_timed(model, passages, args.batch_size)
+        query_emb, query_sec = _encode_timed(model, queries, args.batch_size)
+        results[backend] = {
+            "passages": passage_emb,
+            "queries": query_emb,
+            "per_sec": (len(passages) + len(queries)) / (passage_sec + query_sec),
+        }
+        print(f"{backend:6s} 인코딩 {results[backend]['per_sec']:8.1f} 문장/초")
+        del model
+
+    base, cand = results["torch"], results[args.backend]
+    base_top1 = np.argmax(base["queries"] @ base["passages"].T, axis=1)
+    cand_top1 = np.argmax(cand["queries"] @ cand["passages"].T, axis=1)
+    agreement = float(np.mean(base_top1 == cand_top1))
+    cosine = float(np.mean(np.sum(base["passages"] * cand["passages"], axis=1)))
+
+    print(f"top-1 일치율      {agreement:.4f}")
+    print(f"임베딩 평균 코사인 {cosine:.4f}")
+    print(f"속도 비율          {cand['per_sec'] / base['per_sec']:.2f}x")
+
+    if agreement < args.min_agreement:
+        print(f"❌ 일치율이 기준({args.min_agreement})보다 낮습니다.")
+        sys.exit(1)
+    print("✅ 기준 통과")
+
+
+if __name__ == "__main__":
+    main()
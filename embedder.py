@@ -3,30 +3,127 @@ import json
 import os
 import pickle
 import re
+import threading
 import time
 
 import numpy as np
 from sentence_transformers import SentenceTransformer
-from sklearn.metrics.pairwise import cosine_similarity
+
+from rate_limit import get_limiter, is_transient_error
+from llm_cache import cached_call, load_cached_response, make_cache_key, save_cached_response
+from partial_json import is_complete_json, parse_partial_json
+from embedding_server import encode_remote, ping
+from embedding_cache import (
+    ArticleEmbeddingStore,
+    article_embedding_key,
+    load_index,
+    save_index,
+)
+from vector_index import BruteForceIndex, build_vector_index, load_vector_index
 
 # 모듈 레벨 캐시: 모델을 한 번만 로드
 _model = None
+_model_lock = threading.Lock()  # 예열 스레드와 첫 매칭이 동시에 로드하지 않도록
+_MODEL_NAME = "intfloat/multilingual-e5-large"
+
+# 추론 백엔드: "torch" (float32, 기본), "int8" (torch 동적 양자화), "onnx" (ONNX Runtime)
+EMBEDDING_BACKENDS = ("torch", "int8", "onnx")
+_backend = os.environ.get("EMBEDDING_BACKEND", "torch")
+if _backend not in EMBEDDING_BACKENDS:
+    raise ValueError(
+        f"EMBEDDING_BACKEND={_backend!r}는 지원하지 않는 임베딩 백엔드입니다 "
+        f"(가능: {', '.join(EMBEDDING_BACKENDS)})"
+    )
 
 # 임베딩 캐시 저장 폴더
 _CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".embedding_cache")
 
+# 캐시 임베딩 저장 dtype (np.float16이면 파일 크기 절반, 유사도 오차 ~1e-3)
+_CACHE_DTYPE = np.float32
+
+# 조문 단위 임베딩 저장소 (인덱스 재구축 시 바뀐 조문만 인코딩)
+_article_store = ArticleEmbeddingStore(os.path.join(_CACHE_DIR, "articles"), dtype=_CACHE_DTYPE)
+
+# 벡터 인덱스 종류: "auto" (조문 수에 따라), "brute" (정확), "ivf" (근사, 대규모 말뭉치)
+_VECTOR_INDEX_KIND = os.environ.get("VECTOR_INDEX", "auto")
+
+
+def load_model(model_name: str = _MODEL_NAME, backend: str = "torch") -> SentenceTransformer:
+    """임베딩 모델을 지정한 추론 백엔드로 로드한다.
+
+    Args:
+        model_name: sentence-transformers 모델 이름
+        backend: "torch" (float32), "int8" (Linear 층 동적 int8 양자화, CPU),
+            "onnx" (ONNX Runtime — sentence-transformers>=3.2, optimum[onnxruntime] 필요)
+    """
+    # 타임아웃 설정 (모델 다운로드용 - 최초 1회만)
+    os.environ['HF_HUB_TIMEOUT'] = '300'  # 5분
+    if backend == "torch":
+        return SentenceTransformer(model_name)
+    if backend == "int8":
+        import torch
+        model = SentenceTransformer(model_name, device="cpu")
+        return torch.quantization.quantize_dynamic(
+            model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True
+        )
+    if backend == "onnx":
+        return SentenceTransformer(model_name, backend="onnx")
+    raise ValueError(f"지원하지 않는 임베딩 백엔드: {backend} (가능: {', '.join(EMBEDDING_BACKENDS)})")
+
+
+def model_id(model_name: str = _MODEL_NAME, backend: str | None = None) -> str:
+    """모델 이름 + 백엔드 식별자 (캐시 키·임베딩 서버 확인용). float32 torch는 모델 이름 그대로."""
+    backend = backend or _backend
+    return model_name if backend == "torch" else f"{model_name}#{backend}"
+
+
+def set_backend(backend: str) -> None:
+    """추론 백엔드를 바꾼다 (이미 로드한 모델은 버림). 환경 변수 EMBEDDING_BACKEND로도 지정 가능."""
+    global _backend, _model
+    if backend not in EMBEDDING_BACKENDS:
+        raise ValueError(f"지원하지 않는 임베딩 백엔드: {backend} (가능: {', '.join(EMBEDDING_BACKENDS)})")
+    if backend != _backend:
+        _backend = backend
+        _model = None
+
 
 def _get_model() -> SentenceTransformer:
-    """다국어 임베딩 모델을 로드한다 (싱글턴)."""
+    """다국어 임베딩 모델을 로드한다 (싱글턴, 현재 백엔드)."""
     global _model
     if _model is None:
-        # 타임아웃 설정 (모델 다운로드용 - 최초 1회만)
-        import os
-        os.environ['HF_HUB_TIMEOUT'] = '300'  # 5분
-        _model = SentenceTransformer("intfloat/multilingual-e5-large")
+        with _model_lock:
+            if _model is None:
+                _model = load_model(_MODEL_NAME, _backend)
     return _model
 
 
+def _encode(texts: list[str], batch_size: int = 32, show_progress_bar: bool = False) -> np.ndarray:
+    """E5 인코딩 (정규화). 임베딩 서버(embedding_server.py)가 떠 있으면 서버에 요청하고,
+    없으면 프로세스 안에서 모델을 로드해 인코딩한다."""
+    if not texts:
+        return np.zeros((0, 0), dtype=np.float32)
+    if _model is None:
+        embeddings = encode_remote(texts, batch_size=batch_size, model_name=model_id())
+        if embeddings is not None:
+            return embeddings
+    return _get_model().encode(
+        texts, batch_size=batch_size, show_progress_bar=show_progress_bar,
+        normalize_embeddings=True,
+    )
+
+
+def warm_up() -> str:
+    """첫 매칭이 모델 로드를 기다리지 않도록 미리 준비한다.
+
+    Returns:
+        "server" (임베딩 서버 사용) 또는 "local" (프로세스 안에서 로드·예열)
+    """
+    if _model is None and ping() == model_id():
+        return "server"
+    _get_model().encode([_prepare_text("warm up", is_query=True)], normalize_embeddings=True)
+    return "local"
+
+
 def _prepare_text(text: str, is_query: bool = False) -> str:
     """E5 모델 입력 형식에 맞게 접두사를 추가한다."""
     prefix = "query: " if is_query else "passage: "
@@ -41,24 +138,35 @@ def _make_cache_key(korea_articles: list[dict]) -> str:
         ensure_ascii=False,
         sort_keys=True,
     )
+    if _backend != "torch":
+        # 백엔드마다 임베딩이 조금씩 다르므로 캐시를 분리 (기본 백엔드는 기존 키 유지)
+        content += model_id()
     return hashlib.sha256(content.encode("utf-8")).hexdigest()[:16]
 
 
 def _load_cache(cache_key: str) -> dict | None:
-    """캐시 파일이 존재하면 로드한다."""
-    cache_path = os.path.join(_CACHE_DIR, f"{cache_key}.pkl")
-    if os.path.exists(cache_path):
-        with open(cache_path, "rb") as f:
-            return pickle.load(f)
+    """캐시된 인덱스를 mmap으로 연다 (embedding_cache).
+
+    예전 pickle 캐시(<key>.pkl)만 있으면 읽어서 새 형식으로 옮긴 뒤 삭제한다.
+    """
+    index = load_index(_CACHE_DIR, cache_key)
+    if index is not None:
+        return index
+
+    legacy_path = os.path.join(_CACHE_DIR, f"{cache_key}.pkl")
+    if os.path.exists(legacy_path):
+        with open(legacy_path, "rb") as f:
+            legacy = pickle.load(f)
+        _save_cache(cache_key, legacy)
+        os.remove(legacy_path)
+        return load_index(_CACHE_DIR, cache_key) or legacy
     return None
 
 
 def _save_cache(cache_key: str, index: dict) -> None:
-    """임베딩 인덱스를 캐시 파일로 저장한다."""
-    os.makedirs(_CACHE_DIR, exist_ok=True)
-    cache_path = os.path.join(_CACHE_DIR, f"{cache_key}.pkl")
-    with open(cache_path, "wb") as f:
-        pickle.dump(index, f)
+    """임베딩 인덱스를 캐시 폴더에 저장한다 (임베딩 .npy + 열 단위 메타데이터)."""
+    save_index(_CACHE_DIR, cache_key, index["articles"], index["embeddings"],
+               dtype=_CACHE_DTYPE)
 
 
 def build_korea_index(korea_articles: list[dict], use_cache: bool = True) -> dict:
@@ -66,21 +174,28 @@ def build_korea_index(korea_articles: list[dict], use_cache: bool = True) -> dic
 
     Args:
         korea_articles: 한국법 조문 리스트
-        use_cache: 캐시 사용 여부 (구조화 엑셀은 계속 수정되므로 False 권장)
-
-    같은 한국법 조합이면 캐시에서 불러오고,
-    처음이면 임베딩 후 캐시에 저장한다.
+        use_cache: 캐시 사용 여부
+
+    같은 한국법 조합이면 캐시에서 불러온다.
+    조합이 바뀌었으면(조문 수정 등) 조문 단위 저장소에서 기존 임베딩을 가져오고
+    새로 생기거나 바뀐 조문만 인코딩한 뒤 캐시에 저장한다.
+    캐시에서 불러온 인덱스의 "embeddings"는 읽기 전용 mmap 배열,
+    "articles"는 조문 dict를 필요할 때 만드는 시퀀스(embedding_cache.ArticleTable)이다.
+    "vector_index"는 상위 k개 검색용 벡터 인덱스(vector_index 모듈)로, 캐시 폴더에 함께 저장된다.
     """
     cache_key = _make_cache_key(korea_articles)
 
     if use_cache:
         cached = _load_cache(cache_key)
         if cached is not None:
+            _attach_vector_index(cached, cache_key)
             return cached
 
-    model = _get_model()
     texts = [_prepare_text(a["text"]) for a in korea_articles]
-    embeddings = model.encode(texts, show_progress_bar=True, normalize_embeddings=True)
+    if use_cache:
+        embeddings = _encode_with_store(texts)
+    else:
+        embeddings = _encode(texts, show_progress_bar=True)
     index = {
         "articles": korea_articles,
         "embeddings": np.array(embeddings),
@@ -88,9 +203,155 @@ def build_korea_index(korea_articles: list[dict], use_cache: bool = True) -> dic
 
     if use_cache:
         _save_cache(cache_key, index)
+    _attach_vector_index(index, cache_key if use_cache else None)
     return index
 
 
+def _attach_vector_index(index: dict, cache_key: str | None = None) -> None:
+    """index["vector_index"]에 벡터 인덱스를 붙인다 (vector_index 모듈).
+
+    cache_key가 있으면 캐시 폴더(<cache_key>/vector_index/)에 저장된 인덱스를 불러오고,
+    없거나 종류가 다르면 새로 만들어 저장한다.
+    """
+    if "vector_index" in index:
+        return
+    embeddings = index["embeddings"]
+    kind = _VECTOR_INDEX_KIND
+    index_dir = os.path.join(_CACHE_DIR, cache_key, "vector_index") if cache_key else None
+    if index_dir is not None:
+        vector_index = load_vector_index(index_dir, embeddings)
+        if vector_index is not None and kind in ("auto", vector_index.kind):
+            index["vector_index"] = vector_index
+            return
+    vector_index = build_vector_index(embeddings, kind)
+    if index_dir is not None:
+        vector_index.save(index_dir)
+    index["vector_index"] = vector_index
+
+
+def _encode_with_store(texts: list[str]) -> np.ndarray:
+    """조문 단위 저장소에 없는 텍스트만 인코딩하고, 전체 임베딩 행렬을 입력 순서대로 반환한다."""
+    keys = [article_embedding_key(t, model_id()) for t in texts]
+    found = _article_store.lookup(keys)
+
+    # 같은 텍스트가 여러 번 나와도 한 번만 인코딩
+    missing = {}
+    for key, text in zip(keys, texts):
+        if key not in found and key not in missing:
+            missing[key] = text
+    if missing:
+        new_embeddings = _encode(list(missing.values()), show_progress_bar=True)
+        _article_store.add(list(missing), new_embeddings)
+        found.update(zip(missing, np.asarray(new_embeddings, dtype=_CACHE_DTYPE)))
+
+    if not keys:
+        return np.zeros((0, 0), dtype=_CACHE_DTYPE)
+    return np.stack([found[key] for key in keys]).astype(_CACHE_DTYPE, copy=False)
+
+
+def _normalize_rows(matrix) -> np.ndarray:
+    """행 벡터를 L2 정규화한 float32 행렬을 반환한다 (영벡터는 그대로)."""
+    matrix = np.asarray(matrix, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def _top_k_indices(scores: np.ndarray, top_k: int) -> np.ndarray:
+    """행마다 점수 상위 top_k 열 번호를 점수 내림차순으로 반환한다.
+
+    전체 정렬 대신 np.argpartition으로 상위 k개만 고른 뒤 그 안에서만 정렬한다.
+    """
+    n = scores.shape[1]
+    k = min(top_k, n)
+    if k <= 0:
+        return np.empty((scores.shape[0], 0), dtype=np.intp)
+    if k < n:
+        candidates = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    else:
+        candidates = np.tile(np.arange(n), (scores.shape[0], 1))
+    order = np.argsort(-np.take_along_axis(scores, candidates, axis=1), axis=1, kind="stable")
+    return np.take_along_axis(candidates, order, axis=1)
+
+
+def _article_sources(korea_articles) -> list[str]:
+    """조문별 source 목록. ArticleTable이면 source 열만 읽는다 (본문은 디코딩하지 않음)."""
+    if hasattr(korea_articles, "column"):
+        try:
+            return korea_articles.column("source")
+        except ValueError:
+            return [""] * len(korea_articles)
+    return [art.get("source", "") for art in korea_articles]
+
+
+def _embedding_candidates(
+    foreign_articles: list[dict],
+    korea_index: dict,
+    top_k: int,
+    batch_size: int,
+    relevant_law_sources: list[str] | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """외국법 조문 전체를 한 번에 인코딩하고 행렬곱 한 번으로 상위 top_k 한국법 조문을 찾는다.
+
+    Returns:
+        (candidates, scores)
+        candidates: (외국법 조문 수, k) — korea_index["articles"] 위치, 유사도 내림차순
+        scores: candidates와 같은 모양의 코사인 유사도
+    """
+    korea_articles = korea_index["articles"]
+    rows = np.arange(len(korea_articles))
+    if relevant_law_sources:
+        sources = np.array(_article_sources(korea_articles), dtype=object)
+        rows = np.flatnonzero(np.isin(sources, list(relevant_law_sources))).astype(np.intp)
+    if not foreign_articles or len(rows) == 0:
+        empty = np.empty((len(foreign_articles), 0))
+        return empty.astype(np.intp), empty
+
+    queries = _normalize_rows(_encode(
+        [_prepare_text(a["text"], is_query=True) for a in foreign_articles],
+        batch_size=batch_size,
+    ))
+    if not relevant_law_sources:
+        # 전체 말뭉치 검색은 벡터 인덱스 사용 (대규모 말뭉치면 IVF 근사 검색)
+        vector_index = korea_index.get("vector_index")
+        if vector_index is None:
+            vector_index = BruteForceIndex(_normalize_rows(korea_index["embeddings"]))
+        return vector_index.search(queries, top_k)
+
+    # 선택한 법률의 조문만 정확 검색 (캐시 임베딩은 이미 정규화되어 있음)
+    korea_embeddings = np.asarray(korea_index["embeddings"])[rows].astype(np.float32, copy=False)
+    scores = queries @ korea_embeddings.T
+    top = _top_k_indices(scores, top_k)
+    return rows[top], np.take_along_axis(scores, top, axis=1)
+
+
+def _embedding_top_k(
+    foreign_articles: list[dict],
+    korea_index: dict,
+    top_k: int,
+    batch_size: int,
+    relevant_law_sources: list[str] | None = None,
+) -> list[list[dict]]:
+    """_embedding_candidates 결과를 조문별 매칭 결과 dict 목록으로 만든다."""
+    candidates, scores = _embedding_candidates(
+        foreign_articles, korea_index, top_k, batch_size, relevant_law_sources
+    )
+    korea_articles = korea_index["articles"]
+    results = []
+    for row_candidates, row_scores in zip(candidates, scores):
+        matches = []
+        for idx, score in zip(row_candidates, row_scores):
+            article = korea_articles[int(idx)]
+            matches.append({
+                "korean_id": article["id"],
+                "korean_text": article["text"],
+                "score": float(score),
+                "source": article.get("source", ""),
+            })
+        results.append(matches)
+    return results
+
+
 def find_similar_korean(
     foreign_article: dict,
     korea_index: dict,
@@ -99,30 +360,125 @@ def find_similar_korean(
     """임베딩 기반 유사 조문 검색 (폴백용)."""
     if not korea_index["articles"]:
         return []
+    return _embedding_top_k([foreign_article], korea_index, top_k, batch_size=1)[0]
 
-    model = _get_model()
-    query_text = _prepare_text(foreign_article["text"], is_query=True)
-    query_embedding = model.encode([query_text], normalize_embeddings=True)
 
-    scores = cosine_similarity(query_embedding, korea_index["embeddings"])[0]
-    top_indices = np.argsort(scores)[::-1][:top_k]
+def find_similar_korean_embedding_batch(
+    foreign_articles: list[dict],
+    korea_index: dict,
+    top_k: int = 1,
+    batch_size: int = 32,
+    relevant_law_sources: list[str] | None = None,
+) -> dict[str, list[dict]]:
+    """외국법 조문 전체를 임베딩만으로 한국법과 일괄 매칭한다 (API 호출 없는 빠른 매칭).
 
-    results = []
-    for idx in top_indices:
-        article = korea_index["articles"][idx]
-        results.append({
-            "korean_id": article["id"],
-            "korean_text": article["text"],
-            "score": float(scores[idx]),
-            "source": article.get("source", ""),
-        })
-    return results
+    모든 외국법 조문을 인코딩 호출 한 번(batch_size 단위 순전파)으로 인코딩하고
+    정규화 행렬곱 한 번으로 유사도를 구한다.
+
+    Args:
+        foreign_articles: 외국법 조문 리스트 ({'id': 조문번호, 'text': 원문, ...})
+        korea_index: build_korea_index()가 만든 인덱스 ('articles', 'embeddings')
+        top_k: 조문당 반환할 한국법 조문 수
+        batch_size: 인코딩 배치 크기
+        relevant_law_sources: 매칭 대상 한국법 필터 (예: ["특허법", "실용신안법"])
+
+    Returns:
+        find_similar_korean_batch와 같은 형식의 딕셔너리
+        예: {'1': [{'korean_id': '2', 'korean_text': '...', 'score': 0.83, 'source': '...'}], ...}
+    """
+    results = _embedding_top_k(
+        foreign_articles, korea_index, top_k, batch_size, relevant_law_sources
+    )
+    return {
+        str(article["id"]): matches
+        for article, matches in zip(foreign_articles, results)
+    }
+
+
+# ── 한국법 조문 ID 인덱스 ─────────────────────────────────────
+
+_KOREAN_ARTICLE_ID = re.compile(
+    r"제?\s*(\d+)\s*(?:조\s*)?(?:의\s*(\d+)\s*)?조?\s*(?:\(.*\))?"
+)
+
+
+def normalize_korean_article_id(article_id) -> str:
+    """한국법 조문번호를 'N' 또는 'N의M' 형식으로 정규화한다.
+
+    '제2조', '2', '제2조의2', '제2조의 2(정의)', '2의2', '제2의2조' → '2' 또는 '2의2'
+    형식이 맞지 않으면(예: '전문') 앞뒤 공백만 제거해 반환한다.
+    """
+    text = str(article_id).strip()
+    m = _KOREAN_ARTICLE_ID.fullmatch(text)
+    if not m:
+        return text
+    return f"{m.group(1)}의{m.group(2)}" if m.group(2) else m.group(1)
+
+
+class KoreanArticleIndex:
+    """한국법 조문 ID → 조문 dict 조회 인덱스.
+
+    매칭 실행마다 한 번 만들고 _parse_batch_matches, match_article_with_korean_law,
+    find_similar_korean_ai가 함께 쓴다. 같은 키가 여러 번 나오면 목록에서 먼저 나온 조문을 택한다
+    (기존 선형 탐색과 같음). 여러 법을 함께 다룰 때는 (source, 조문번호) 키로 법을 구분한다.
+    """
+
+    def __init__(self, korea_articles):
+        self.articles = korea_articles
+        self._by_raw: dict[str, dict] = {}
+        self._by_id: dict[str, dict] = {}
+        self._by_source: dict[tuple[str, str], dict] = {}
+        self._by_number: dict[tuple[str, str], dict] = {}
+        for article in korea_articles:
+            raw = str(article["id"]).strip()
+            normalized = normalize_korean_article_id(raw)
+            source = article.get("source", "")
+            number = normalized.split("의")[0]
+            self._by_raw.setdefault(raw, article)
+            self._by_id.setdefault(normalized, article)
+            self._by_source.setdefault((source, normalized), article)
+            self._by_number.setdefault((source, number), article)
+            self._by_number.setdefault(("", number), article)
+
+    def __len__(self) -> int:
+        return len(self.articles)
+
+    def get(self, article_id, source: str | None = None) -> dict | None:
+        """조문번호(원문 그대로 또는 제N조의M 형식)로 조문을 찾는다.
+
+        Args:
+            article_id: 찾을 조문번호
+            source: 지정하면 해당 법(source)의 조문만 찾는다
+        """
+        if article_id is None:
+            return None
+        raw = str(article_id).strip()
+        normalized = normalize_korean_article_id(raw)
+        if source:
+            return self._by_source.get((source, normalized))
+        return self._by_raw.get(raw) or self._by_id.get(normalized)
+
+    def get_by_number(self, article_id, source: str | None = None) -> dict | None:
+        """조문 본번호(제N조의 N)만 같은 첫 조문을 찾는다 (느슨한 매칭)."""
+        numbers = re.findall(r"\d+", str(article_id))
+        if not numbers:
+            return None
+        return self._by_number.get((source or "", numbers[0]))
+
+
+def _get_article_index(korea_index: dict) -> KoreanArticleIndex:
+    """korea_index에 조문 ID 인덱스를 한 번만 만들어 붙여 두고 반환한다."""
+    article_index = korea_index.get("article_index")
+    if article_index is None or article_index.articles is not korea_index["articles"]:
+        article_index = KoreanArticleIndex(korea_index["articles"])
+        korea_index["article_index"] = article_index
+    return article_index
 
 
 # ── AI 기반 매칭 ─────────────────────────────────────────────
 
 def _call_gemini(prompt: str, system: str, max_retries: int = 3) -> str:
-    """Gemini API를 재시도 포함하여 호출한다."""
+    """Gemini API를 재시도 포함하여 호출한다 (같은 요청은 llm_cache 응답 재사용)."""
     import streamlit as st
     import google.generativeai as genai
 
@@ -130,49 +486,79 @@ def _call_gemini(prompt: str, system: str, max_retries: int = 3) -> str:
     if not api_key or api_key == "your-key-here":
         return ""
 
-    genai.configure(api_key=api_key)
-    model = genai.GenerativeModel("gemini-2.5-flash", system_instruction=system)
+    def _request() -> str:
+        genai.configure(api_key=api_key)
+        model = genai.GenerativeModel("gemini-2.5-flash", system_instruction=system)
+        limiter = get_limiter("gemini")
+
+        for attempt in range(max_retries):
+            try:
+                limiter.acquire()
+                response = model.generate_content(
+                    prompt,
+                    request_options={"timeout": 120},
+                )
+                limiter.on_success()
+                return response.text.strip()
+            except Exception as e:
+                wait = limiter.on_error(e, attempt)
+                if attempt < max_retries - 1:
+                    time.sleep(wait)
+                else:
+                    return ""
+
+    return cached_call("gemini", "gemini-2.5-flash", system, prompt, _request)
 
-    for attempt in range(max_retries):
-        try:
-            response = model.generate_content(
-                prompt,
-                request_options={"timeout": 120},
-            )
-            time.sleep(1)
-            return response.text.strip()
-        except Exception:
-            if attempt < max_retries - 1:
-                time.sleep(3 * (attempt + 1))
-            else:
-                return ""
+
+# API 키별 Claude 클라이언트 (연결 풀을 호출 간에 재사용)
+_claude_clients: dict = {}
+
+
+def _claude_client(api_key: str):
+    """API 키별로 하나의 동기 Claude 클라이언트를 반환한다.
+
+    SDK 자체 재시도(max_retries)는 끄고, 429 재시도·대기는 rate_limit 제한기가 맡는다.
+    """
+    import anthropic
+
+    client = _claude_clients.get(api_key)
+    if client is None:
+        client = _claude_clients.setdefault(api_key, anthropic.Anthropic(api_key=api_key, max_retries=0))
+    return client
 
 
 def _call_claude(prompt: str, system: str, max_retries: int = 3) -> str:
-    """Claude API를 재시도 포함하여 호출한다."""
+    """Claude API를 재시도 포함하여 호출한다 (같은 요청은 llm_cache 응답 재사용)."""
     import streamlit as st
-    import anthropic
 
     api_key = st.secrets.get("ANTHROPIC_API_KEY", "")
     if not api_key or api_key == "your-key-here":
         return ""
 
-    for attempt in range(max_retries):
-        try:
-            client = anthropic.Anthropic(api_key=api_key)
-            message = client.messages.create(
-                model="claude-sonnet-4-5-20250929",
-                max_tokens=2048,
-                system=system,
-                messages=[{"role": "user", "content": prompt}],
-            )
-            time.sleep(1)
-            return message.content[0].text.strip()
-        except Exception:
-            if attempt < max_retries - 1:
-                time.sleep(3 * (attempt + 1))
-            else:
-                return ""
+    def _request() -> str:
+        client = _claude_client(api_key)
+        limiter = get_limiter("claude")
+
+        for attempt in range(max_retries):
+            try:
+                limiter.acquire()
+                message = client.messages.create(
+                    model="claude-sonnet-4-5-20250929",
+                    max_tokens=2048,
+                    system=system,
+                    messages=[{"role": "user", "content": prompt}],
+                )
+                limiter.on_success()
+                return message.content[0].text.strip()
+            except Exception as e:
+                wait = limiter.on_error(e, attempt)
+                if attempt < max_retries - 1:
+                    time.sleep(wait)
+                else:
+                    return ""
+
+    return cached_call("claude", "claude-sonnet-4-5-20250929", system, prompt, _request,
+                       max_tokens=2048)
 
 
 def select_relevant_korean_laws(
@@ -230,6 +616,7 @@ def match_article_with_korean_law(
     korean_articles: list[dict],
     korean_law_name: str,
     foreign_article_title: str = "",
+    article_index: KoreanArticleIndex | None = None,
 ) -> dict | None:
     """[2단계] AI가 해외법 번역문을 읽고 한국법 조문 목록에서 매칭한다.
 
@@ -239,6 +626,8 @@ def match_article_with_korean_law(
         korean_articles: 해당 한국법의 조문 리스트 [{'id':..., 'text':...}, ...]
         korean_law_name: 한국법 파일명
         foreign_article_title: 해외법 조문 제목 (있는 경우)
+        article_index: korean_articles(또는 이를 포함하는 여러 법 조문)의 조문 ID 인덱스.
+            주면 korean_law_name(source) 기준으로 조회하고, 없으면 korean_articles로 만든다.
 
     Returns:
         {'korean_id', 'korean_text', 'score', 'source', 'ai_reason'} or None
@@ -263,26 +652,28 @@ def match_article_with_korean_law(
                 ai_reason = line.replace("이유:", "").strip()
         return chosen_id, ai_reason
 
+    # 조문 ID 인덱스 (공유 인덱스가 있으면 이 법(source)으로 한정해 조회)
+    source = None
+    if article_index is None:
+        article_index = KoreanArticleIndex(korean_articles)
+    elif article_index.articles is not korean_articles:
+        source = korean_law_name
+
     # 조문 찾기 헬퍼 함수
     def find_korean_article(chosen_id, korean_articles):
         """선택된 조문 ID로 한국법 조문 찾기"""
         if not chosen_id:
             return None
-        # 정확히 일치
-        for a in korean_articles:
-            if a["id"] == chosen_id:
-                return a
+        # 정확히 일치 (제N조의M 표기 차이 포함)
+        article = article_index.get(chosen_id, source)
+        if article:
+            return article
         # 부분 매칭
         for a in korean_articles:
             if chosen_id in a["id"] or a["id"] in chosen_id:
                 return a
         # 숫자만 추출해서 비교
-        chosen_nums = re.findall(r"\d+", chosen_id)
-        for a in korean_articles:
-            article_nums = re.findall(r"\d+", a["id"])
-            if chosen_nums and article_nums and chosen_nums[0] == article_nums[0]:
-                return a
-        return None
+        return article_index.get_by_number(chosen_id, source)
 
     # 1단계: 조문 제목 기반 AI 매칭 (Gemini + Claude)
     if foreign_article_title and foreign_article_title.strip():
@@ -426,6 +817,9 @@ def find_similar_korean_ai(
     if not foreign_article_title and "조문제목" in foreign_article:
         foreign_article_title = str(foreign_article.get("조문제목", ""))
 
+    # 매칭 실행 동안 korea_index에 붙여 두고 재사용
+    article_index = _get_article_index(korea_index)
+
     for law_source, articles in articles_by_law.items():
         result = match_article_with_korean_law(
             translated_text,
@@ -433,6 +827,7 @@ def find_similar_korean_ai(
             articles,
             law_source,
             foreign_article_title,
+            article_index=article_index,
         )
         if result:
             best_match = result
@@ -445,32 +840,41 @@ def find_similar_korean_ai(
     return []
 
 
-def _parse_batch_matches(response_text: str, korea_articles: list[dict]) -> dict[str, list[dict]]:
-    """AI 응답 텍스트를 파싱하여 매칭 결과 딕셔너리를 반환한다."""
-    # JSON 파싱
-    if "```json" in response_text:
-        json_start = response_text.find("```json") + 7
-        json_end = response_text.find("```", json_start)
-        json_text = response_text[json_start:json_end].strip()
-    else:
-        json_text = response_text
+def _parse_batch_matches(
+    response_text: str,
+    korea_articles: list[dict],
+    article_index: KoreanArticleIndex | None = None,
+) -> dict[str, list[dict]]:
+    """AI 응답 텍스트를 파싱하여 매칭 결과 딕셔너리를 반환한다.
 
-    result = json.loads(json_text)
+    응답이 출력 한도에서 잘렸거나 앞뒤에 설명이 붙어도 완성된 매칭 항목만 돌려준다
+    (partial_json). JSON 객체를 찾지 못하면 ValueError.
+    article_index를 주면(매칭 실행마다 한 번 생성) 조문 조회에 그대로 쓴다.
+    """
+    result = parse_partial_json(response_text)
+    if not isinstance(result, dict):
+        raise ValueError("매칭 응답에서 JSON을 찾지 못했습니다")
     matches = result.get('matches', [])
+    if not isinstance(matches, list):
+        matches = []
+
+    if article_index is None:
+        article_index = KoreanArticleIndex(korea_articles)
 
     result_dict = {}
     for match in matches:
+        if not isinstance(match, dict) or 'foreign_id' not in match:
+            continue
         foreign_id = str(match.get('foreign_id', ''))
         korean_id = match.get('korean_id')
 
         if korean_id and korean_id != "null":
             korean_text = ""
             korean_source = ""
-            for k_art in korea_articles:
-                if str(k_art['id']) == str(korean_id):
-                    korean_text = k_art.get('text', '')
-                    korean_source = k_art.get('source', '')
-                    break
+            k_art = article_index.get(korean_id, match.get('source')) or article_index.get(korean_id)
+            if k_art is not None:
+                korean_text = k_art.get('text', '')
+                korean_source = k_art.get('source', '')
 
             result_dict[foreign_id] = [{
                 'korean_id': str(korean_id),
@@ -486,28 +890,80 @@ def _parse_batch_matches(response_text: str, korea_articles: list[dict]) -> dict
     return result_dict
 
 
+# 일괄 매칭 배치 하나의 최대 시도 횟수 (속도 제한·과부하·연결 오류일 때만 재시도)
+_MATCH_MAX_ATTEMPTS = 3
+
+# 응답이 잘려 빠진 외국법 조문을 다시 요청하는 최대 횟수
+_MATCH_MAX_ROUNDS = 2
+
+_MATCH_MODEL = "claude-sonnet-4-5-20250929"
+_MATCH_MAX_TOKENS = 16000
+
+# 일괄 매칭 구조화 출력 (Claude 도구 호출 입력으로 받는다)
+_MATCH_TOOL = {
+    "name": "record_matches",
+    "description": "외국법 조문별로 가장 유사한 한국법 조문을 기록한다.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "matches": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "foreign_id": {"type": "string"},
+                        "korean_id": {"type": ["string", "null"]},
+                        "korean_title": {"type": "string"},
+                        "score": {"type": "number"},
+                        "reason": {"type": "string"},
+                    },
+                    "required": ["foreign_id", "korean_id"],
+                },
+            },
+        },
+        "required": ["matches"],
+    },
+}
+
+
+def _format_korea_titles(korea_articles) -> str:
+    """프롬프트용 한국법 조문 제목 목록 ("제N조: 제목" 줄 단위)."""
+    return "\n".join([
+        f"제{art['id']}조: {art.get('title', '')}"
+        for art in korea_articles
+    ])
+
+
 def find_similar_korean_batch(
     foreign_articles: list[dict],
     korea_index: dict,
     relevant_law_sources: list[str] | None = None,
     batch_size: int = 30,
+    shortlist_k: int | None = None,
+    max_concurrency: int = 4,
 ) -> dict[str, list[dict]]:
     """외국법 조문들을 한국법과 일괄 매칭한다.
 
-    조문 수가 많으면 배치로 나누어 처리한다.
+    조문 수가 많으면 배치로 나누어 최대 max_concurrency개씩 동시에 처리한다.
+
+    shortlist_k를 주면 하이브리드 모드로 동작한다: E5 임베딩 인덱스로 외국법 조문마다
+    유사한 한국법 조문 shortlist_k개를 먼저 고르고, 프롬프트에는 배치 안 조문들의 후보 합집합만 넣는다.
+    여러 법을 함께 매칭할 때 프롬프트 크기가 크게 줄어든다.
 
     Args:
         foreign_articles: 외국법 조문 리스트
             각 조문은 {'id': 조문번호, 'text': 원문, '조문제목': 제목, 'translated': 번역문} 포함
         korea_index: 한국법 인덱스 {'articles': [...]}
+            ('embeddings'가 없으면 하이브리드 모드에서 build_korea_index로 만든다)
         relevant_law_sources: 매칭 대상 한국법 필터 (예: ["특허법", "실용신안법"])
         batch_size: 한 번에 매칭할 외국법 조문 수 (기본 30개)
+        shortlist_k: 외국법 조문당 임베딩 후보 수 (None이면 필터된 한국법 조문 전체를 전달)
+        max_concurrency: 동시에 실행할 배치 수 (호출 속도는 rate_limit.get_limiter("claude")로 조절)
 
     Returns:
         조문 ID를 키로, 매칭 결과 리스트를 값으로 하는 딕셔너리
         예: {'1': [{'korean_id': '2', 'score': 0.95, ...}], '2': [...], ...}
     """
-    import anthropic
     import streamlit as st
 
     # API 키 확인
@@ -516,6 +972,16 @@ def find_similar_korean_batch(
         st.error("❌ ANTHROPIC_API_KEY가 설정되지 않았습니다.")
         return {}
 
+    # 하이브리드 모드: 외국법 조문별 임베딩 후보 (korea_index["articles"] 위치)
+    shortlists = None
+    if shortlist_k:
+        if "embeddings" not in korea_index:
+            korea_index = build_korea_index(list(korea_index.get("articles", [])))
+        shortlists, _ = _embedding_candidates(
+            foreign_articles, korea_index, shortlist_k,
+            batch_size=32, relevant_law_sources=relevant_law_sources,
+        )
+
     # 한국법 조문 필터링
     korea_articles = korea_index.get("articles", [])
 
@@ -530,13 +996,14 @@ def find_similar_korean_batch(
         st.warning("⚠️ 필터링 후 한국법 조문이 없습니다. 매칭을 건너뜁니다.")
         return {}
 
-    # 한국법 조문 리스트 (전체 전달)
-    korea_list_str = "\n".join([
-        f"제{art['id']}조: {art.get('title', '')}"
-        for art in korea_articles
-    ])
+    # 조문 ID 인덱스 (모든 배치가 공유)
+    article_index = KoreanArticleIndex(korea_articles)
 
-    client = anthropic.Anthropic(api_key=api_key)
+    # 한국법 조문 리스트 (전체 전달, 하이브리드 모드에서는 배치마다 후보만)
+    korea_list_str = _format_korea_titles(korea_articles)
+    all_korea_articles = korea_index.get("articles", [])
+
+    client = _claude_client(api_key)
 
     # 배치 분할
     batches = [
@@ -544,65 +1011,106 @@ def find_similar_korean_batch(
         for i in range(0, len(foreign_articles), batch_size)
     ]
 
-    all_results = {}
-    total_batches = len(batches)
-
-    for batch_idx, batch in enumerate(batches):
+    def _match_prompt(batch: list[dict], batch_korea_list_str: str) -> str:
         foreign_list_str = "\n".join([
             f"{art['id']}: {art.get('조문제목', '')}"
             for art in batch
         ])
-
-        prompt = f"""당신은 특허법 전문가입니다. 외국 특허법 조문들과 한국 특허법 조문들이 주어졌습니다.
+        return f"""당신은 특허법 전문가입니다. 외국 특허법 조문들과 한국 특허법 조문들이 주어졌습니다.
 
 **외국법 조문 제목:**
 {foreign_list_str}
 
 **한국 특허법 조문 제목:**
-{korea_list_str}
-
-각 외국법 조문에 대해 가장 유사한 한국 특허법 조문을 찾아주세요.
-
-**응답 형식 (JSON):**
-```json
-{{
-  "matches": [
-    {{
-      "foreign_id": "1",
-      "korean_id": "2",
-      "korean_title": "...",
-      "score": 0.95,
-      "reason": "매칭 이유"
-    }},
-    ...
-  ]
-}}
-```
-
-매칭이 없으면 korean_id를 null로 설정하세요. JSON 형식으로만 응답해주세요."""
-
-        try:
+{batch_korea_list_str}
+
+각 외국법 조문에 대해 가장 유사한 한국 특허법 조문을 찾아 record_matches 도구로 기록해주세요.
+모든 외국법 조문에 대해 하나씩 기록하고, 매칭이 없으면 korean_id를 null로 설정하세요."""
+
+    def _request_matches(prompt: str) -> str:
+        """도구 호출을 강제해 매칭 JSON을 스트리밍으로 받는다 (같은 프롬프트는 캐시 재사용)."""
+        cache_key = make_cache_key("claude", _MATCH_MODEL, "", prompt,
+                                   max_tokens=_MATCH_MAX_TOKENS, tool=_MATCH_TOOL["name"])
+        cached_response = load_cached_response(cache_key)
+        if cached_response is not None:
+            return cached_response
+
+        # 배치 간 고정 대기 대신 제공자 공용 적응형 제한기로 호출 속도 조절
+        limiter = get_limiter("claude")
+        for attempt in range(_MATCH_MAX_ATTEMPTS):
             response_text = ""
-            with client.messages.stream(
-                model="claude-sonnet-4-5-20250929",
-                max_tokens=16000,
-                messages=[{"role": "user", "content": prompt}]
-            ) as stream:
-                for text in stream.text_stream:
-                    response_text += text
-
-            batch_results = _parse_batch_matches(response_text, korea_articles)
-            all_results.update(batch_results)
-
+            limiter.acquire()
+            try:
+                with client.messages.stream(
+                    model=_MATCH_MODEL,
+                    max_tokens=_MATCH_MAX_TOKENS,
+                    messages=[{"role": "user", "content": prompt}],
+                    tools=[_MATCH_TOOL],
+                    tool_choice={"type": "tool", "name": _MATCH_TOOL["name"]},
+                ) as stream:
+                    for event in stream:
+                        if event.type == "content_block_delta" and event.delta.type == "input_json_delta":
+                            response_text += event.delta.partial_json
+            except Exception as e:
+                # SDK 자체 재시도는 꺼 두었으므로 429·5xx·연결 오류는 여기서 재시도한다
+                if not is_transient_error(e) or attempt == _MATCH_MAX_ATTEMPTS - 1:
+                    raise
+                time.sleep(limiter.on_error(e, attempt))
+                continue
+            limiter.on_success()
+            break
+
+        # 끝까지 받은 응답만 저장 (잘린 응답은 다음 실행에서 다시 요청)
+        if is_complete_json(response_text):
+            save_cached_response(cache_key, response_text, "claude", _MATCH_MODEL)
+        return response_text
+
+    def _match_one(batch_idx: int, batch: list[dict]):
+        """배치 하나를 매칭한다. (결과, 오류, 응답 앞부분, traceback)을 반환한다.
+
+        응답이 잘려 일부 조문의 매칭이 빠지면 빠진 조문만 다시 요청한다 (최대 _MATCH_MAX_ROUNDS번).
+        """
+        batch_korea_list_str = korea_list_str
+        if shortlists is not None:
+            start = batch_idx * batch_size
+            candidate_rows = sorted(set(shortlists[start:start + len(batch)].ravel().tolist()))
+            batch_korea_list_str = _format_korea_titles([all_korea_articles[i] for i in candidate_rows])
+
+        results = {}
+        pending = batch
+        response_text = ""
+        try:
+            for _ in range(_MATCH_MAX_ROUNDS):
+                response_text = _request_matches(_match_prompt(pending, batch_korea_list_str))
+                results.update(_parse_batch_matches(response_text, korea_articles, article_index))
+                remaining = [art for art in pending if str(art['id']) not in results]
+                if not remaining or len(remaining) == len(pending):
+                    break
+                pending = remaining
+            return results, None, None, None
         except Exception as e:
-            st.error(f"❌ 배치 {batch_idx + 1} 매칭 오류: {type(e).__name__}: {e}")
-            if 'response_text' in locals():
-                st.write("API 응답 내용 (처음 500자):", response_text[:500])
             import traceback
-            st.code(traceback.format_exc())
+            return results or None, e, response_text[:500], traceback.format_exc()
+
+    # 배치를 병렬로 실행하고, 결과는 배치 순서대로 합친다 (같은 조문 ID는 뒤 배치가 우선)
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_concurrency, len(batches) or 1))) as executor:
+        futures = [
+            executor.submit(_match_one, batch_idx, batch)
+            for batch_idx, batch in enumerate(batches)
+        ]
+        outcomes = [future.result() for future in futures]
 
-        # 배치 간 대기 (rate limit 방지)
-        if batch_idx < total_batches - 1:
-            time.sleep(2)
+    all_results = {}
+    for batch_idx, (batch_results, error, response_head, tb) in enumerate(outcomes):
+        if batch_results:
+            all_results.update(batch_results)
+        if error is None:
+            continue
+        st.error(f"❌ 배치 {batch_idx + 1} 매칭 오류: {type(error).__name__}: {error}")
+        if response_head:
+            st.write("API 응답 내용 (처음 500자):", response_head)
+        st.code(tb)
 
     return all_results
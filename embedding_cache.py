@@ -0,0 +1,360 @@
+"""한국법 임베딩 인덱스 디스크 캐시.
+
+인덱스 하나를 폴더 하나에 저장한다:
+
+    .embedding_cache/<cache_key>/
+        meta.json        조문 수, 임베딩 차원/dtype, 메타데이터 열 이름
+        embeddings.npy   (조문 수, 차원) float32 또는 float16 행렬
+        offsets.npy      (열 수, 조문 수 + 1) int64 — 열별 UTF-8 바이트 경계
+        present.npy      (열 수, 조문 수) bool — 조문 dict에 해당 키가 있었는지
+        col<i>.utf8      i번째 열(id, text, source, ...) 문자열을 이어 붙인 UTF-8 바이트
+
+불러올 때 임베딩 행렬과 열 파일은 mmap으로 열기만 하므로(np.load(mmap_mode='r'))
+조문 수와 관계없이 수 ms 안에 끝나고, 같은 파일을 여는 여러 프로세스가 페이지 캐시를 공유한다.
+조문 dict는 접근할 때 필요한 항목만 디코딩한다 (ArticleTable).
+같은 프로세스 안에서는 한 번 연 인덱스를 재사용한다 (Streamlit 세션 간 공유).
+
+조문 단위 임베딩 저장소(ArticleEmbeddingStore)는 인덱스와 별도로
+hash(모델 이름 + 접두사 포함 입력 텍스트)를 키로 조문 임베딩을 보관한다.
+한국법 엑셀에서 조문 몇 개만 고치면 인덱스 키는 바뀌지만,
+나머지 조문은 저장소에서 가져오고 바뀐 조문만 다시 인코딩한다.
+"""
+
+import glob
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+from collections.abc import Sequence
+
+import numpy as np
+
+CACHE_FORMAT_VERSION = 1
+
+_open_indexes: dict[str, dict] = {}
+_open_lock = threading.Lock()
+
+
+class ArticleTable(Sequence):
+    """열 단위로 저장된 조문 메타데이터를 조문 dict 목록처럼 읽는 읽기 전용 시퀀스.
+
+    table[i]는 {'id': ..., 'text': ..., 'source': ...} 딕셔너리를 새로 만들어 반환한다.
+    """
+
+    def __init__(self, columns: list[str], offsets: np.ndarray, present: np.ndarray,
+                 blobs: list):
+        self.columns = list(columns)
+        self._offsets = offsets
+        self._present = present
+        self._blobs = blobs
+
+    def __len__(self) -> int:
+        return self._offsets.shape[1] - 1
+
+    def _value(self, col: int, i: int) -> str:
+        start, end = self._offsets[col, i], self._offsets[col, i + 1]
+        return bytes(self._blobs[col][start:end]).decode("utf-8")
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        n = len(self)
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError("ArticleTable index out of range")
+        return {
+            name: self._value(col, i)
+            for col, name in enumerate(self.columns)
+            if self._present[col, i]
+        }
+
+    def column(self, name: str, default: str = "") -> list[str]:
+        """한 열 전체를 문자열 목록으로 반환한다 (키가 없던 조문은 default)."""
+        col = self.columns.index(name)
+        blob = bytes(self._blobs[col])
+        offsets = self._offsets[col].tolist()
+        present = self._present[col].tolist()
+        return [
+            blob[offsets[i]:offsets[i + 1]].decode("utf-8") if present[i] else default
+            for i in range(len(self))
+        ]
+
+
+def _index_dir(cache_dir: str, cache_key: str) -> str:
+    return os.path.join(cache_dir, cache_key)
+
+
+def _open_blob(path: str):
+    # 길이 0인 파일은 mmap할 수 없음
+    if os.path.getsize(path) == 0:
+        return b""
+    return np.memmap(path, dtype=np.uint8, mode="r")
+
+
+def save_index(cache_dir: str, cache_key: str, articles: list[dict], embeddings,
+               dtype=np.float32) -> None:
+    """임베딩 인덱스를 캐시 폴더에 저장한다.
+
+    Args:
+        cache_dir: 캐시 루트 폴더
+        cache_key: 인덱스 키 (폴더 이름)
+        articles: 조문 dict 목록 (값은 문자열)
+        embeddings: (조문 수, 차원) 임베딩 행렬
+        dtype: 저장 dtype (np.float32 또는 np.float16)
+    """
+    embeddings = np.asarray(embeddings, dtype=dtype)
+    if embeddings.ndim != 2 or embeddings.shape[0] != len(articles):
+        raise ValueError(
+            f"임베딩 행렬 크기 {embeddings.shape}가 조문 수 {len(articles)}와 맞지 않습니다."
+        )
+
+    columns = []
+    for article in articles:
+        for name in article:
+            if name not in columns:
+                columns.append(name)
+
+    os.makedirs(cache_dir, exist_ok=True)
+    final_dir = _index_dir(cache_dir, cache_key)
+    tmp_dir = f"{final_dir}.{os.getpid()}.{threading.get_ident()}.tmp"
+    os.makedirs(tmp_dir, exist_ok=True)
+    try:
+        np.save(os.path.join(tmp_dir, "embeddings.npy"), embeddings)
+
+        offsets = np.zeros((len(columns), len(articles) + 1), dtype=np.int64)
+        present = np.zeros((len(columns), len(articles)), dtype=bool)
+        for col, name in enumerate(columns):
+            parts = []
+            pos = 0
+            for i, article in enumerate(articles):
+                if name in article:
+                    value = article[name]
+                    data = ("" if value is None else str(value)).encode("utf-8")
+                    parts.append(data)
+                    pos += len(data)
+                    present[col, i] = True
+                offsets[col, i + 1] = pos
+            with open(os.path.join(tmp_dir, f"col{col}.utf8"), "wb") as f:
+                f.write(b"".join(parts))
+        np.save(os.path.join(tmp_dir, "offsets.npy"), offsets)
+        np.save(os.path.join(tmp_dir, "present.npy"), present)
+
+        # meta.json을 마지막에 써서, 이것이 있으면 완전한 인덱스로 본다
+        meta = {
+            "version": CACHE_FORMAT_VERSION,
+            "count": len(articles),
+            "dim": int(embeddings.shape[1]),
+            "dtype": embeddings.dtype.name,
+            "columns": columns,
+        }
+        with open(os.path.join(tmp_dir, "meta.json"), "w", encoding="utf-8") as f:
+            json.dump(meta, f, ensure_ascii=False)
+
+        if os.path.isdir(final_dir):
+            shutil.rmtree(final_dir, ignore_errors=True)
+        try:
+            os.replace(tmp_dir, final_dir)
+        except OSError:
+            # 다른 프로세스가 같은 키를 먼저 저장한 경우 (내용이 같으므로 그대로 사용)
+            pass
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    with _open_lock:
+        _open_indexes.pop(final_dir, None)
+
+
+def load_index(cache_dir: str, cache_key: str) -> dict | None:
+    """캐시된 임베딩 인덱스를 mmap으로 연다. 없거나 형식이 다르면 None.
+
+    Returns:
+        {"articles": ArticleTable, "embeddings": 읽기 전용 np.memmap}
+    """
+    index_dir = _index_dir(cache_dir, cache_key)
+    with _open_lock:
+        cached = _open_indexes.get(index_dir)
+    if cached is not None:
+        return cached
+
+    try:
+        with open(os.path.join(index_dir, "meta.json"), "r", encoding="utf-8") as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if meta.get("version") != CACHE_FORMAT_VERSION:
+        return None
+
+    try:
+        embeddings = np.load(os.path.join(index_dir, "embeddings.npy"), mmap_mode="r")
+        offsets = np.load(os.path.join(index_dir, "offsets.npy"), mmap_mode="r")
+        present = np.load(os.path.join(index_dir, "present.npy"), mmap_mode="r")
+        blobs = [
+            _open_blob(os.path.join(index_dir, f"col{col}.utf8"))
+            for col in range(len(meta["columns"]))
+        ]
+    except (OSError, ValueError):
+        return None
+    if embeddings.shape != (meta["count"], meta["dim"]):
+        return None
+
+    index = {
+        "articles": ArticleTable(meta["columns"], offsets, present, blobs),
+        "embeddings": embeddings,
+    }
+    with _open_lock:
+        index = _open_indexes.setdefault(index_dir, index)
+    return index
+
+
+# ══════════════════════════════════════════════════════════════
+# 조문 단위 임베딩 저장소
+# ══════════════════════════════════════════════════════════════
+
+def article_embedding_key(text: str, model_name: str) -> bytes:
+    """조문 임베딩 키: sha256(모델 이름 + 모델 입력 텍스트) 다이제스트 (32바이트).
+
+    text는 모델에 넣는 그대로(E5 접두사 "passage: " 포함)여야 한다.
+    """
+    h = hashlib.sha256(model_name.encode("utf-8"))
+    h.update(b"\0")
+    h.update(text.encode("utf-8"))
+    return h.digest()
+
+
+# 조문 임베딩 키 길이 (sha256 다이제스트)
+_KEY_BYTES = 32
+
+
+def _encode_keys(keys: list[bytes]) -> np.ndarray:
+    """키 목록을 (n, 32) uint8 배열로 만든다.
+
+    "S32" 문자열 배열은 읽을 때 끝의 NUL 바이트가 잘려 다이제스트가 바뀌므로 쓰지 않는다.
+    """
+    return np.frombuffer(b"".join(keys), dtype=np.uint8).reshape(len(keys), _KEY_BYTES)
+
+
+def _decode_keys(keys: np.ndarray) -> list[bytes] | None:
+    """_encode_keys의 역변환. 형식이 맞지 않으면 None."""
+    if keys.dtype.kind == "S":
+        # 예전 "S32" 샤드: 잘린 NUL 바이트를 다시 채운다
+        return [key.ljust(_KEY_BYTES, b"\0") for key in keys.tolist()]
+    if keys.dtype != np.uint8 or keys.ndim != 2 or keys.shape[1] != _KEY_BYTES:
+        return None
+    data = keys.tobytes()
+    return [data[i:i + _KEY_BYTES] for i in range(0, len(data), _KEY_BYTES)]
+
+
+class ArticleEmbeddingStore:
+    """조문 단위 임베딩 저장소.
+
+    새로 인코딩한 조문을 add()할 때마다 샤드 하나(<id>.emb.npy + <id>.keys.npy)를 추가하고,
+    샤드가 max_shards를 넘으면 하나로 합친다. 임베딩은 mmap으로 읽는다.
+
+    Args:
+        store_dir: 저장 폴더
+        dtype: 임베딩 저장 dtype
+        max_shards: 샤드 병합 기준 개수
+    """
+
+    def __init__(self, store_dir: str, dtype=np.float32, max_shards: int = 16):
+        self.store_dir = store_dir
+        self.dtype = np.dtype(dtype)
+        self.max_shards = max_shards
+        self._lock = threading.Lock()
+        self._shard_names: tuple[str, ...] = ()
+        self._positions: dict[bytes, tuple[int, int]] = {}  # 키 → (샤드 번호, 행)
+        self._shards: list[np.ndarray] = []
+
+    def _list_shards(self) -> tuple[str, ...]:
+        paths = glob.glob(os.path.join(self.store_dir, "*.keys.npy"))
+        return tuple(sorted(os.path.basename(p)[:-len(".keys.npy")] for p in paths))
+
+    def _refresh(self) -> None:
+        """샤드 목록이 바뀌었으면 키 위치표를 다시 만든다 (다른 프로세스의 추가 반영)."""
+        names = self._list_shards()
+        if names == self._shard_names:
+            return
+        positions = {}
+        shards = []
+        for name in names:
+            try:
+                keys = np.load(os.path.join(self.store_dir, f"{name}.keys.npy"))
+                emb = np.load(os.path.join(self.store_dir, f"{name}.emb.npy"), mmap_mode="r")
+            except (OSError, ValueError):
+                continue
+            keys = _decode_keys(keys)
+            if keys is None or emb.ndim != 2 or emb.shape[0] != len(keys):
+                continue
+            shard_no = len(shards)
+            shards.append(emb)
+            for row, key in enumerate(keys):
+                positions[key] = (shard_no, row)
+        self._shard_names = names
+        self._positions = positions
+        self._shards = shards
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._refresh()
+            return len(self._positions)
+
+    def lookup(self, keys: list[bytes]) -> dict[bytes, np.ndarray]:
+        """저장된 키의 임베딩을 {키: 벡터}로 반환한다 (없는 키는 빠짐)."""
+        with self._lock:
+            self._refresh()
+            found = {}
+            for key in keys:
+                pos = self._positions.get(key)
+                if pos is not None:
+                    shard_no, row = pos
+                    found[key] = self._shards[shard_no][row]
+            return found
+
+    def add(self, keys: list[bytes], embeddings) -> None:
+        """새 조문 임베딩을 샤드로 추가한다 (이미 있는 키는 건너뜀)."""
+        embeddings = np.asarray(embeddings, dtype=self.dtype)
+        with self._lock:
+            self._refresh()
+            rows = {}
+            for i, key in enumerate(keys):
+                if key not in self._positions and key not in rows:
+                    rows[key] = i
+            if not rows:
+                return
+            new_keys = list(rows)
+            self._write_shard(new_keys, embeddings[list(rows.values())])
+            if len(self._list_shards()) > self.max_shards:
+                self._compact()
+            self._refresh()
+
+    def _write_shard(self, keys: list[bytes], embeddings: np.ndarray) -> None:
+        os.makedirs(self.store_dir, exist_ok=True)
+        name = f"{time.time_ns():020d}_{os.getpid()}_{threading.get_ident()}"
+        base = os.path.join(self.store_dir, name)
+        # 임베딩을 먼저 쓰고 키 파일을 마지막에 만들어, 키 파일이 있으면 완전한 샤드로 본다
+        tmp = f"{base}.tmp.npy"
+        np.save(tmp, embeddings)
+        os.replace(tmp, f"{base}.emb.npy")
+        np.save(tmp, _encode_keys(keys))
+        os.replace(tmp, f"{base}.keys.npy")
+
+    def _compact(self) -> None:
+        """모든 샤드를 하나로 합친다."""
+        self._refresh()
+        if not self._shards:
+            return
+        keys = list(self._positions)
+        embeddings = np.stack([
+            self._shards[shard_no][row] for shard_no, row in self._positions.values()
+        ])
+        old_names = self._shard_names
+        self._write_shard(keys, embeddings)
+        for name in old_names:
+            for suffix in (".keys.npy", ".emb.npy"):
+                try:
+                    os.remove(os.path.join(self.store_dir, name + suffix))
+                except OSError:
+                    pass
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""E5 임베딩 모델 서버.
+
+multilingual-e5-large 모델을 프로세스 하나에서 한 번만 로드하고, 유닉스 소켓으로
+인코딩 요청을 받는다. 여러 Streamlit 프로세스/세션이 모델 사본(약 2GB)을 따로 들고 있지 않고
+이미 예열된 모델 하나를 함께 쓴다. embedder는 서버가 떠 있으면 서버에 요청하고,
+없으면 기존처럼 프로세스 안에서 모델을 로드한다.
+
+프로토콜 (요청/응답 모두 4바이트 빅엔디언 길이 + JSON 헤더):
+    요청:  {"op": "encode", "texts": [...], "batch_size": 32} 또는 {"op": "ping"}
+    응답:  {"ok": true, "model": 모델 이름, "shape": [n, d], "dtype": "float32"}
+           + encode이면 헤더 뒤에 n*d 개 float32 (정규화된 임베딩)
+           실패 시 {"ok": false, "error": "..."}
+
+사용법:
+    python embedding_server.py                       # 기본 소켓 (.embedding_cache/e5.sock)
+    python embedding_server.py --socket /tmp/e5.sock # 앱 실행 시 EMBEDDING_SERVER_SOCKET=/tmp/e5.sock
+    python embedding_server.py --backend int8        # 앱 실행 시 EMBEDDING_BACKEND=int8
+"""
+
+import argparse
+import json
+import os
+import socket
+import socketserver
+import struct
+import threading
+
+import numpy as np
+
+DEFAULT_MODEL_NAME = "intfloat/multilingual-e5-large"
+
+DEFAULT_SOCKET = os.environ.get(
+    "EMBEDDING_SERVER_SOCKET",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".embedding_cache", "e5.sock"),
+)
+
+# 서버 연결 대기 시간 (초). 인코딩 응답은 시간 제한 없이 기다린다.
+CONNECT_TIMEOUT = 1.0
+
+_HEADER = struct.Struct(">I")
+
+
+# ══════════════════════════════════════════════════════════════
+# 메시지 송수신
+# ══════════════════════════════════════════════════════════════
+
+def _recv_exact(sock, size: int) -> bytes:
+    chunks = []
+    while size:
+        chunk = sock.recv(min(size, 1 << 20))
+        if not chunk:
+            raise ConnectionError("연결이 끊겼습니다.")
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
+
+
+def _send_message(sock, header: dict, payload: bytes = b"") -> None:
+    data = json.dumps(header, ensure_ascii=False).encode("utf-8")
+    sock.sendall(_HEADER.pack(len(data)) + data + payload)
+
+
+def _recv_header(sock) -> dict:
+    (size,) = _HEADER.unpack(_recv_exact(sock, _HEADER.size))
+    return json.loads(_recv_exact(sock, size).decode("utf-8"))
+
+
+# ══════════════════════════════════════════════════════════════
+# 클라이언트
+# ══════════════════════════════════════════════════════════════
+
+def _request(header: dict, socket_path: str | None = None):
+    """서버에 요청을 보내고 (응답 헤더, 소켓)을 반환한다. 서버가 없으면 None."""
+    socket_path = socket_path or DEFAULT_SOCKET
+    if not hasattr(socket, "AF_UNIX") or not os.path.exists(socket_path):
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(CONNECT_TIMEOUT)
+        sock.connect(socket_path)
+        sock.settimeout(None)
+        _send_message(sock, header)
+        return _recv_header(sock), sock
+    except (OSError, ValueError, ConnectionError):
+        sock.close()
+        return None
+
+
+def ping(socket_path: str | None = None) -> str | None:
+    """서버가 응답하면 서버의 모델 이름을, 아니면 None을 반환한다."""
+    response = _request({"op": "ping"}, socket_path)
+    if response is None:
+        return None
+    header, sock = response
+    sock.close()
+    return header.get("model") if header.get("ok") else None
+
+
+def encode_remote(
+    texts: list[str],
+    batch_size: int = 32,
+    model_name: str = DEFAULT_MODEL_NAME,
+    socket_path: str | None = None,
+) -> np.ndarray | None:
+    """임베딩 서버로 인코딩한다 (정규화된 float32 행렬).
+
+    서버가 없거나, 다른 모델을 쓰고 있거나, 오류가 나면 None을 반환한다
+    (호출하는 쪽에서 프로세스 내 모델로 처리).
+    """
+    response = _request(
+        {"op": "encode", "texts": list(texts), "batch_size": batch_size}, socket_path
+    )
+    if response is None:
+        return None
+    header, sock = response
+    try:
+        if not header.get("ok") or header.get("model") != model_name:
+            return None
+        rows, dim = header["shape"]
+        payload = _recv_exact(sock, rows * dim * 4)
+        return np.frombuffer(payload, dtype=np.float32).reshape(rows, dim)
+    except (OSError, ValueError, KeyError, ConnectionError):
+        return None
+    finally:
+        sock.close()
+
+
+# ══════════════════════════════════════════════════════════════
+# 서버
+# ══════════════════════════════════════════════════════════════
+
+class _EncodeHandler(socketserver.BaseRequestHandler):
+    def handle(self):
+        server = self.server
+        try:
+            request = _recv_header(self.request)
+        except (OSError, ValueError, ConnectionError):
+            return
+
+        if request.get("op") == "ping":
+            _send_message(self.request, {"ok": True, "model": server.model_name})
+            return
+        if request.get("op") != "encode":
+            _send_message(self.request, {"ok": False, "error": f"알 수 없는 요청: {request.get('op')}"})
+            return
+
+        try:
+            # 모델 하나를 여러 요청이 함께 쓰므로 인코딩은 한 번에 하나씩
+            with server.encode_lock:
+                embeddings = server.model.encode(
+                    request.get("texts", []),
+                    batch_size=int(request.get("batch_size", 32)),
+                    normalize_embeddings=True,
+                )
+            embeddings = np.ascontiguousarray(embeddings, dtype=np.float32)
+            if embeddings.ndim != 2:
+                embeddings = embeddings.reshape(len(request.get("texts", [])), -1)
+        except Exception as e:
+            _send_message(self.request, {"ok": False, "error": f"{type(e).__name__}: {e}"})
+            return
+
+        _send_message(
+            self.request,
+            {"ok": True, "model": server.model_name, "shape": list(embeddings.shape),
+             "dtype": "float32"},
+            embeddings.tobytes(),
+        )
+
+
+class _EmbeddingServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def serve(socket_path: str = DEFAULT_SOCKET, model_name: str = DEFAULT_MODEL_NAME,
+          backend: str = "torch") -> None:
+    """모델을 로드·예열하고 socket_path에서 요청을 받는다 (Ctrl+C로 종료)."""
+    from embedder import load_model, model_id
+
+    print(f"모델 로드 중: {model_name} ({backend})")
+    model = load_model(model_name, backend)
+    # 첫 요청이 느리지 않도록 한 번 인코딩해 둔다
+    model.encode(["query: warm up"], normalize_embeddings=True)
+
+    os.makedirs(os.path.dirname(os.path.abspath(socket_path)), exist_ok=True)
+    if os.path.exists(socket_path):
+        if ping(socket_path) is not None:
+            raise SystemExit(f"이미 임베딩 서버가 실행 중입니다: {socket_path}")
+        os.remove(socket_path)  # 이전 실행이 남긴 소켓 파일
+
+    with _EmbeddingServer(socket_path, _EncodeHandler) as server:
+        server.model = model
+        # 클라이언트는 같은 모델·백엔드일 때만 서버 결과를 사용한다
+        server.model_name = model_id(model_name, backend)
+        server.encode_lock = threading.Lock()
+        print(f"임베딩 서버 시작: {socket_path}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            try:
+                os.remove(socket_path)
+            except OSError:
+                pass
+
+
+def main():
+    ap = argparse.ArgumentParser(description="E5 임베딩 모델 서버")
+    ap.add_argument("--socket", default=DEFAULT_SOCKET, help="유닉스 소켓 경로")
+    ap.add_argument("--model", default=DEFAULT_MODEL_NAME, help="sentence-transformers 모델 이름")
+    ap.add_argument("--backend", default="torch", choices=["torch", "int8", "onnx"],
+                    help="추론 백엔드 (embedder.EMBEDDING_BACKENDS)")
+    args = ap.parse_args()
+    serve(args.socket, args.model, args.backend)
+
+
+if __name__ == "__main__":
+    main()
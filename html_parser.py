@@ -3,10 +3,33 @@
 유럽 법령, 중국 법령 등 HTML 형식으로 제공되는 법령을 파싱합니다.
 """
 import re
+from types import MappingProxyType
 import requests
 from bs4 import BeautifulSoup
 import pandas as pd
 
+from parsers.hierarchy_index import HierarchyIndex
+
+
+# ══════════════════════════════════════════════════════════════
+# 정규식 패턴 (import 시 한 번 컴파일, 읽기 전용)
+# ══════════════════════════════════════════════════════════════
+
+PATTERNS = MappingProxyType({
+    "eu_preamble_block": re.compile(r'(THE CONTRACTING MEMBER STATES.*?HAVE AGREED AS FOLLOWS:)', re.DOTALL | re.IGNORECASE),
+    "eu_preamble_parties": re.compile(r'^(THE CONTRACTING MEMBER STATES,?)', re.IGNORECASE),
+    "eu_preamble_recital": re.compile(r'(CONSIDERING|RECALLING|WISHING|HAVING|NOTING|DESIRING|RECOGNIZING|CONVINCED|AWARE)\s+that\s+(.*?)(?=(?:CONSIDERING|RECALLING|WISHING|HAVING|NOTING|DESIRING|RECOGNIZING|CONVINCED|AWARE)\s+that|HAVE AGREED AS FOLLOWS|$)', re.DOTALL | re.IGNORECASE),
+    "eu_trailing_punct": re.compile(r'[;:]\s*$'),
+    "whitespace": re.compile(r'\s+'),
+    "eu_article": re.compile(r'\n(Article\s+\d+[a-z]*)\n(.*?)(?=\nArticle\s+\d+|$)', re.DOTALL | re.IGNORECASE),
+    "eu_content_start": re.compile(r'^[\d\(]'),
+    "eu_paragraph": re.compile(r'(?:^|\n)\s*(\d+)\.\s+(.*?)(?=(?:\n\s*\d+\.|$))', re.DOTALL | re.MULTILINE),
+    "eu_item": re.compile(r'\n\s*\(([a-z])\)\s*\n\s*(.*?)(?=\n\s*\([a-z]\)|$)', re.DOTALL),
+    "hk_item": re.compile(r'\((\d+)\)\s+(.+?)(?=\(\d+\)\s+|\Z)', re.DOTALL),
+    "hk_paragraph": re.compile(r'\(([a-z])\)\s+(.+?)(?=\([a-z]\)\s+|\Z)', re.DOTALL),
+    "hk_subparagraph": re.compile(r'\((i{1,3}|iv|v|vi{0,3}|ix|x)\)\s+(.+?)(?=\((?:i{1,3}|iv|v|vi{0,3}|ix|x)\)\s+|\Z)', re.DOTALL),
+})
+
 
 def parse_eu_html(url: str) -> dict:
     """유럽 법령 HTML을 파싱하여 구조화된 데이터를 반환한다.
@@ -46,11 +69,7 @@ def parse_eu_html(url: str) -> dict:
 def _parse_html_preamble(text: str) -> list[dict]:
     """HTML 텍스트에서 전문을 파싱한다."""
     # "THE CONTRACTING MEMBER STATES" 부터 "HAVE AGREED AS FOLLOWS" 까지 추출
-    preamble_match = re.search(
-        r'(THE CONTRACTING MEMBER STATES.*?HAVE AGREED AS FOLLOWS:)',
-        text,
-        re.DOTALL | re.IGNORECASE
-    )
+    preamble_match = PATTERNS["eu_preamble_block"].search(text)
 
     if not preamble_match:
         return []
@@ -60,7 +79,7 @@ def _parse_html_preamble(text: str) -> list[dict]:
     results = []
 
     # 서두
-    header_match = re.search(r'^(THE CONTRACTING MEMBER STATES,?)', preamble_text, re.IGNORECASE)
+    header_match = PATTERNS["eu_preamble_parties"].search(preamble_text)
     if header_match:
         results.append({
             'type': '서두',
@@ -68,18 +87,15 @@ def _parse_html_preamble(text: str) -> list[dict]:
         })
 
     # CONSIDERING, RECALLING, WISHING 등 각 문단
-    pattern = re.compile(
-        r'(CONSIDERING|RECALLING|WISHING|HAVING|NOTING|DESIRING|RECOGNIZING|CONVINCED|AWARE)\s+that\s+(.*?)(?=(?:CONSIDERING|RECALLING|WISHING|HAVING|NOTING|DESIRING|RECOGNIZING|CONVINCED|AWARE)\s+that|HAVE AGREED AS FOLLOWS|$)',
-        re.DOTALL | re.IGNORECASE
-    )
+    pattern = PATTERNS["eu_preamble_recital"]
 
     for match in pattern.finditer(preamble_text):
         keyword = match.group(1).upper()
         content = match.group(2).strip()
         # 끝의 세미콜론 제거
-        content = re.sub(r'[;:]\s*$', '', content)
+        content = PATTERNS["eu_trailing_punct"].sub('', content)
         # 줄바꿈을 공백으로 변환
-        content = re.sub(r'\s+', ' ', content)
+        content = PATTERNS["whitespace"].sub(' ', content)
 
         results.append({
             'type': keyword,
@@ -100,14 +116,11 @@ def _parse_html_articles(text: str) -> list[dict]:
     """HTML 텍스트에서 조문을 파싱한다."""
     articles = []
 
-    # 계층 구조 추출 (PART, CHAPTER)
-    hierarchy = _extract_html_hierarchy(text)
+    # 계층 구조 추출 (PART, CHAPTER) — 위치 조회용 인덱스는 문서당 한 번 생성
+    hierarchy = HierarchyIndex(_extract_html_hierarchy(text))
 
     # Article 패턴: "Article N" + 제목 (선택)
-    article_pattern = re.compile(
-        r'\n(Article\s+\d+[a-z]*)\n(.*?)(?=\nArticle\s+\d+|$)',
-        re.DOTALL | re.IGNORECASE
-    )
+    article_pattern = PATTERNS["eu_article"]
 
     for match in article_pattern.finditer(text):
         article_id = match.group(1).strip()
@@ -121,7 +134,7 @@ def _parse_html_articles(text: str) -> list[dict]:
         if lines:
             first_line = lines[0].strip()
             # 첫 줄이 제목인지 확인 (숫자나 (a) 등으로 시작하지 않음)
-            if first_line and not re.match(r'^[\d\(]', first_line):
+            if first_line and not PATTERNS["eu_content_start"].match(first_line):
                 title = first_line
                 content_start = 1
 
@@ -192,19 +205,17 @@ def _extract_html_hierarchy(text: str) -> list[dict]:
     return hierarchy
 
 
-def _find_hierarchy_at_position(hierarchy: list[dict], position: int) -> dict:
-    """특정 위치에서의 계층 정보를 반환한다."""
-    current_part = ""
-    current_chapter = ""
+def _find_hierarchy_at_position(hierarchy, position: int) -> dict:
+    """특정 위치에서의 계층 정보를 반환한다.
 
-    for h in hierarchy:
-        if h['start_pos'] > position:
-            break
-        if h['type'] == 'part':
-            current_part = h['title']
-            current_chapter = ""  # 새 Part에서 Chapter 초기화
-        elif h['type'] == 'chapter':
-            current_chapter = h['title']
+    Args:
+        hierarchy: HierarchyIndex 또는 _extract_html_hierarchy 결과 목록
+        position: 텍스트 내 위치
+    """
+    if not isinstance(hierarchy, HierarchyIndex):
+        hierarchy = HierarchyIndex(hierarchy)
+    # 새 Part가 나오면 이전 Chapter는 초기화됨
+    current_part, current_chapter, _ = hierarchy.lookup(position)
 
     return {
         'part': current_part,
@@ -250,13 +261,13 @@ def parse_eu_html_to_dataframe(url: str) -> pd.DataFrame:
 
         # 항/호 파싱
         # 1. 2. 3. 패턴으로 항 분리 (유럽 법령 스타일)
-        para_pattern = re.compile(r'(?:^|\n)\s*(\d+)\.\s+(.*?)(?=(?:\n\s*\d+\.|$))', re.DOTALL | re.MULTILINE)
+        para_pattern = PATTERNS["eu_paragraph"]
         paragraphs = list(para_pattern.finditer(text))
 
         if not paragraphs:
             # 항이 없는 경우 - (a), (b) 패턴만 확인
             # 여러 줄바꿈과 공백을 허용하는 패턴
-            item_pattern = re.compile(r'\n\s*\(([a-z])\)\s*\n\s*(.*?)(?=\n\s*\([a-z]\)|$)', re.DOTALL)
+            item_pattern = PATTERNS["eu_item"]
             items = list(item_pattern.finditer(text))
 
             if not items:
@@ -316,7 +327,7 @@ def parse_eu_html_to_dataframe(url: str) -> pd.DataFrame:
                 para_text = para_match.group(2).strip()
 
                 # (a), (b) 패턴으로 호 분리
-                item_pattern = re.compile(r'\n\s*\(([a-z])\)\s*\n\s*(.*?)(?=\n\s*\([a-z]\)|$)', re.DOTALL)
+                item_pattern = PATTERNS["eu_item"]
                 items = list(item_pattern.finditer(para_text))
 
                 if not items:
@@ -444,8 +455,8 @@ def _parse_china_articles(text: str) -> list[dict]:
     """
     articles = []
 
-    # 계층 구조 추출 (章)
-    hierarchy = _extract_china_hierarchy(text)
+    # 계층 구조 추출 (章) — 위치 조회용 인덱스는 문서당 한 번 생성
+    hierarchy = HierarchyIndex(_extract_china_hierarchy(text))
 
     # 조문 패턴: 第X条 (X는 한자 숫자 또는 아라비아 숫자)
     # 한자 숫자: 一二三四五六七八九十百千
@@ -500,17 +511,16 @@ def _extract_china_hierarchy(text: str) -> list[dict]:
     return hierarchy
 
 
-def _find_china_chapter_at_position(hierarchy: list[dict], position: int) -> str:
-    """특정 위치에서의 장(章) 정보를 반환한다."""
-    current_chapter = ""
-
-    for h in hierarchy:
-        if h['start_pos'] > position:
-            break
-        if h['type'] == 'chapter':
-            current_chapter = h['title']
+def _find_china_chapter_at_position(hierarchy, position: int) -> str:
+    """특정 위치에서의 장(章) 정보를 반환한다.
 
-    return current_chapter
+    Args:
+        hierarchy: HierarchyIndex 또는 _extract_china_hierarchy 결과 목록
+        position: 텍스트 내 위치
+    """
+    if not isinstance(hierarchy, HierarchyIndex):
+        hierarchy = HierarchyIndex(hierarchy)
+    return hierarchy.at(position)['chapter']
 
 
 def parse_china_html_to_dataframe(url: str) -> pd.DataFrame:
@@ -1494,7 +1504,7 @@ def _parse_hongkong_items(text: str) -> list[dict]:
     items = []
 
     # (1), (2), (3) 형식의 subsection 찾기
-    subsection_pattern = re.compile(r'\((\d+)\)\s+(.+?)(?=\(\d+\)\s+|\Z)', re.DOTALL)
+    subsection_pattern = PATTERNS["hk_item"]
     subsection_matches = list(subsection_pattern.finditer(text))
 
     if subsection_matches:
@@ -1531,7 +1541,7 @@ def _parse_hongkong_paragraphs(text: str) -> list[dict]:
     items = []
 
     # (a), (b), (c) 형식의 paragraph 찾기
-    para_pattern = re.compile(r'\(([a-z])\)\s+(.+?)(?=\([a-z]\)\s+|\Z)', re.DOTALL)
+    para_pattern = PATTERNS["hk_paragraph"]
     para_matches = list(para_pattern.finditer(text))
 
     if para_matches:
@@ -1569,7 +1579,7 @@ def _parse_hongkong_subparagraphs(text: str) -> list[dict]:
 
     # (i), (ii), (iii), (iv), (v) 형식의 subparagraph 찾기
     # 로마숫자 패턴
-    roman_pattern = re.compile(r'\((i{1,3}|iv|v|vi{0,3}|ix|x)\)\s+(.+?)(?=\((?:i{1,3}|iv|v|vi{0,3}|ix|x)\)\s+|\Z)', re.DOTALL)
+    roman_pattern = PATTERNS["hk_subparagraph"]
     roman_matches = list(roman_pattern.finditer(text))
 
     if roman_matches:
@@ -0,0 +1,194 @@
+"""LLM 응답 디스크 캐시 (SQLite).
+
+번역·매칭 API 응답을 (제공자, 모델, 시스템 프롬프트, 사용자 입력, 호출 파라미터)의 해시를 키로 저장한다.
+바뀌지 않은 조문을 다시 번역하거나 앱 재시작 후 재매칭할 때 이미 받은 응답은 API를 호출하지 않는다.
+
+- 여러 Streamlit 프로세스·스레드가 같은 파일을 함께 쓴다 (WAL 모드, 스레드별 연결).
+- 저장 후 LLM_CACHE_TTL_SECONDS가 지난 항목은 만료된다.
+- 총 크기가 LLM_CACHE_MAX_BYTES를 넘으면 가장 오래 사용하지 않은 항목부터 삭제한다 (LRU).
+- 환경 변수 LLM_CACHE=0이면 캐시를 사용하지 않는다.
+
+캐시 파일에 문제가 있으면(잠김, 손상 등) 캐시 없이 API를 호출한다.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+# 캐시 파일 (프로젝트 루트 .llm_cache/)
+_CACHE_PATH = os.environ.get(
+    "LLM_CACHE_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".llm_cache", "responses.sqlite3"),
+)
+
+# 항목 유효 기간 (초, 기본 30일)
+LLM_CACHE_TTL_SECONDS = int(os.environ.get("LLM_CACHE_TTL_SECONDS", 30 * 24 * 3600))
+
+# 캐시 최대 크기 (바이트)
+LLM_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+# 저장 몇 번마다 만료·크기 정리를 할지
+_EVICT_EVERY = 32
+
+_local = threading.local()
+_put_count = [0]
+_put_lock = threading.Lock()
+
+
+def is_enabled() -> bool:
+    return os.environ.get("LLM_CACHE", "1") != "0"
+
+
+def _connect() -> sqlite3.Connection:
+    """현재 스레드의 캐시 DB 연결 (없으면 만든다)."""
+    conn = getattr(_local, "conn", None)
+    if conn is not None and getattr(_local, "path", None) == _CACHE_PATH:
+        return conn
+    os.makedirs(os.path.dirname(_CACHE_PATH), exist_ok=True)
+    conn = sqlite3.connect(_CACHE_PATH, timeout=30, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS responses ("
+        " key TEXT PRIMARY KEY,"
+        " provider TEXT NOT NULL,"
+        " model TEXT NOT NULL,"
+        " response TEXT NOT NULL,"
+        " size INTEGER NOT NULL,"
+        " created_at REAL NOT NULL,"
+        " accessed_at REAL NOT NULL)"
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed_at)")
+    _local.conn = conn
+    _local.path = _CACHE_PATH
+    return conn
+
+
+def make_cache_key(provider: str, model: str, system: str, content: str, **params) -> str:
+    """호출 내용 전체로 캐시 키(SHA-256)를 만든다.
+
+    Args:
+        provider: "gemini", "claude" 등
+        model: 모델 이름
+        system: 시스템 프롬프트 (없으면 "")
+        content: 사용자 입력
+        **params: 응답에 영향을 주는 호출 파라미터 (max_tokens 등)
+    """
+    payload = json.dumps(
+        [provider, model, system or "", content, params],
+        ensure_ascii=False, sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def load_cached_response(key: str) -> str | None:
+    """캐시된 응답을 반환한다. 없거나 만료되었으면 None."""
+    if not is_enabled():
+        return None
+    now = time.time()
+    try:
+        conn = _connect()
+        row = conn.execute(
+            "SELECT response, created_at FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        if now - row[1] > LLM_CACHE_TTL_SECONDS:
+            conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            return None
+        # 사용 시각 갱신 (LRU 기준)
+        conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+        return row[0]
+    except sqlite3.Error:
+        return None
+
+
+def save_cached_response(key: str, response: str, provider: str = "", model: str = "") -> None:
+    """응답을 캐시에 저장하고, 주기적으로 만료·크기 제한을 적용한다."""
+    if not is_enabled():
+        return
+    now = time.time()
+    try:
+        conn = _connect()
+        conn.execute(
+            "INSERT OR REPLACE INTO responses"
+            " (key, provider, model, response, size, created_at, accessed_at)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (key, provider, model, response, len(response.encode("utf-8")), now, now),
+        )
+    except sqlite3.Error:
+        return
+
+    with _put_lock:
+        _put_count[0] += 1
+        evict = _put_count[0] % _EVICT_EVERY == 1
+    if evict:
+        _evict(LLM_CACHE_MAX_BYTES)
+
+
+def cached_call(provider: str, model: str, system: str, content: str, call_fn,
+                cacheable=bool, **params) -> str:
+    """캐시에 있으면 캐시 응답을, 없으면 call_fn()을 실행해 저장 후 반환한다.
+
+    Args:
+        provider, model, system, content, **params: 캐시 키 구성 요소 (make_cache_key)
+        call_fn: 실제 API 호출 (인자 없음, 응답 문자열 반환)
+        cacheable: 응답을 저장할지 판단하는 함수 (기본: 빈 응답 제외).
+            오류 메시지 응답은 저장하지 않도록 호출하는 쪽에서 지정한다.
+    """
+    key = make_cache_key(provider, model, system, content, **params)
+    response = load_cached_response(key)
+    if response is not None:
+        return response
+    response = call_fn()
+    if isinstance(response, str) and cacheable(response):
+        save_cached_response(key, response, provider, model)
+    return response
+
+
+def invalidate_llm_cache(provider: str | None = None) -> int:
+    """캐시 항목을 삭제한다.
+
+    Args:
+        provider: 지정하면 해당 제공자의 항목만 삭제, None이면 전체 삭제
+
+    Returns:
+        삭제한 항목 수
+    """
+    try:
+        conn = _connect()
+        if provider is None:
+            cursor = conn.execute("DELETE FROM responses")
+        else:
+            cursor = conn.execute("DELETE FROM responses WHERE provider = ?", (provider,))
+        return cursor.rowcount
+    except sqlite3.Error:
+        return 0
+
+
+def _evict(max_bytes: int) -> None:
+    """만료 항목을 지우고, 총 크기가 max_bytes 이하가 될 때까지 오래된 항목부터 삭제한다."""
+    try:
+        conn = _connect()
+        conn.execute(
+            "DELETE FROM responses WHERE created_at < ?",
+            (time.time() - LLM_CACHE_TTL_SECONDS,),
+        )
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= max_bytes:
+            return
+        # 오래 사용하지 않은 순으로 누적 크기를 세어 초과분만큼 삭제
+        excess = total - max_bytes
+        freed = 0
+        keys = []
+        for key, size in conn.execute("SELECT key, size FROM responses ORDER BY accessed_at"):
+            if freed >= excess:
+                break
+            keys.append(key)
+            freed += size
+        conn.executemany("DELETE FROM responses WHERE key = ?", [(k,) for k in keys])
+    except sqlite3.Error:
+        pass
@@ -9,10 +9,12 @@
 import os
 import re
 import time
+from types import MappingProxyType
 import pandas as pd
 
 from parsers.base import (
     BaseParser,
+    TEXT_EXTRACTOR_VERSION,
     parse_pdf,
     parse_rtf,
     _parse_preamble,
@@ -20,6 +22,21 @@ from parsers.base import (
     _clean_english_article,
     save_structured_to_excel,
 )
+from parsers.text_cache import cached_extract, invalidate_text_cache
+from parsers import profiling
+from parsers.profiling import profile_parsers, get_profile, reset_profile
+
+# ══════════════════════════════════════════════════════════════
+# 정규식 패턴 (import 시 한 번 컴파일, 읽기 전용)
+# ══════════════════════════════════════════════════════════════
+
+_PATTERNS = MappingProxyType({
+    "single_newline": re.compile(r'(?<!\n)\n(?!\n)'),
+    "multi_space": re.compile(r' {2,}'),
+    "space_around_newline": re.compile(r' *\n *'),
+    "article_prefix": re.compile(r'^(?:Section|Article|Rule|§)\s*(.+)$', re.IGNORECASE),
+})
+
 
 # ══════════════════════════════════════════════════════════════
 # 레지스트리
@@ -29,8 +46,11 @@ _REGISTRY: list[type[BaseParser]] = []
 
 
 def register(parser_cls):
-    """데코레이터: 파서 클래스를 레지스트리에 등록한다."""
-    _REGISTRY.append(parser_cls)
+    """데코레이터: 파서 클래스를 레지스트리에 등록한다.
+
+    단계 메서드는 계측 래퍼로 감싼다 (parsers.profiling — 꺼져 있으면 그대로 호출).
+    """
+    _REGISTRY.append(profiling.instrument(parser_cls))
     return parser_cls
 
 
@@ -145,40 +165,49 @@ def split_articles(text: str, lang: str = None, file_path: str = None) -> list[d
     return _split_english(text)
 
 
-def extract_structured_articles(
-    file_path: str,
-    progress_callback=None
-) -> pd.DataFrame:
-    """PDF에서 법조문을 계층 구조(편/장/절/조/항/호)로 추출하여 DataFrame으로 반환한다.
-
-    Args:
-        file_path: PDF 파일 경로
-        progress_callback: 진행률 콜백 함수 (current, total, message)
-
-    Returns:
-        DataFrame with columns: ['편', '장', '절', '조문번호', '조문제목', '항', '호', '목', '세목', '원문']
-    """
-    # 0. 파서 인스턴스 가져오기
-    parser = get_parser(file_path)
-
-    # 1. 텍스트 추출 (PDF 또는 RTF)
+def _load_text(file_path: str, progress_callback=None, workers: int = 1,
+               use_cache: bool = True) -> str:
+    """PDF 또는 RTF에서 원문 텍스트를 추출한다 (추출 텍스트 캐시 사용)."""
     file_ext = os.path.splitext(file_path)[1].lower()
     if file_ext == ".rtf":
-        text = parse_rtf(file_path)
+        extract_fn = lambda: parse_rtf(file_path)
+        options = {"format": "rtf", "extractor_version": TEXT_EXTRACTOR_VERSION}
     else:
         # use_layout=False: 2단 구성 처리 비활성화 (단어 잘림 방지)
-        text = parse_pdf(file_path, use_layout=False)
-    lang = _detect_lang(file_path)
-    fmt = _detect_format(file_path)
-
-    # 2. 계층 구조 감지 (편/장/절)
-    hierarchy = _detect_hierarchy(text, lang, file_path=file_path)
-
-    # 3. 조문 추출
-    articles = split_articles(text, lang=lang, file_path=file_path)
-
-    # 4. 각 조문의 항/호 파싱 및 DataFrame 생성
-    rows = []
+        extract_fn = lambda: parse_pdf(
+            file_path, use_layout=False,
+            workers=workers, progress_callback=progress_callback,
+        )
+        options = {
+            "format": "pdf", "filter_superscript": True, "use_layout": False,
+            "extractor_version": TEXT_EXTRACTOR_VERSION,
+        }
+
+    if use_cache:
+        return cached_extract(file_path, extract_fn, **options)
+    return extract_fn()
+
+
+def _remove_line_breaks(text: str, lang: str) -> str:
+    """조문 내 줄바꿈을 공백으로 변경 (영문 전용)"""
+    if lang not in ["english", None]:
+        return text
+    # 단일 줄바꿈을 공백으로 변경, 연속 줄바꿈은 유지
+    text = _PATTERNS["single_newline"].sub(' ', text)
+    # 연속된 공백을 하나로 정리
+    text = _PATTERNS["multi_space"].sub(' ', text)
+    # 줄바꿈 주변 공백 정리
+    text = _PATTERNS["space_around_newline"].sub('\n', text)
+    return text.strip()
+
+
+def _iter_article_rows(parser, text: str, articles, hierarchy: list[dict],
+                       lang: str, fmt: str):
+    """조문 목록을 순서대로 돌며 구조화 행(dict)을 하나씩 생성한다.
+
+    조문마다 계층(편/장/절)을 찾고 항/호를 파싱하여 행을 만든다.
+    정렬·편/장 보완은 하지 않는다 (호출하는 쪽에서 처리).
+    """
     current_part = ""
     current_chapter = ""
     current_section = ""
@@ -208,7 +237,7 @@ def extract_structured_articles(
             # EPC는 전문을 문단별로 나누지 않음 (전체를 하나로 유지)
             from parsers.epc import EpcParser
             if isinstance(parser, EpcParser):
-                rows.append({
+                yield {
                     "편": "",
                     "장": "",
                     "절": "",
@@ -219,13 +248,13 @@ def extract_structured_articles(
                     "목": "",
                     "세목": "",
                     "원문": article_text
-                })
+                }
             else:
                 # 다른 국가는 전문을 문단별로 파싱
                 preamble_paras = _parse_preamble(article_text)
                 if preamble_paras:
                     for para in preamble_paras:
-                        rows.append({
+                        yield {
                             "편": "",
                             "장": "",
                             "절": "",
@@ -236,9 +265,9 @@ def extract_structured_articles(
                             "목": "",
                             "세목": "",
                             "원문": para["text"]
-                        })
+                        }
                 else:
-                    rows.append({
+                    yield {
                         "편": "",
                         "장": "",
                         "절": "",
@@ -249,7 +278,7 @@ def extract_structured_articles(
                         "목": "",
                         "세목": "",
                         "원문": article_text
-                    })
+                    }
             continue
 
         # 현재 조문이 속한 계층 정보 업데이트
@@ -397,8 +426,8 @@ def extract_structured_articles(
         # 한국법: 조문번호/제목/원문 분리
         if lang == "korean":
             from parsers.korea import _clean_korean_article
-            article_id, title, article_text = _clean_korean_article(
-                article_id, article_text
+            article_id, title, article_text = profiling.call(
+                parser, "clean_article", _clean_korean_article, article_id, article_text
             )
         else:
             # 조문 제목 추출
@@ -421,27 +450,15 @@ def extract_structured_articles(
             display_article_id = parser.format_article_id(article_id)
 
         # 항/호 파싱
-        paragraphs = _parse_paragraphs_and_items(article_text, lang, fmt=fmt, article_id=article_id)
+        paragraphs = profiling.call(parser, "parse_paragraphs", _parse_paragraphs_and_items,
+                                    article_text, lang, fmt=fmt, article_id=article_id)
 
         # EPC Article 178: 서명/날짜 부분 분리
         if hasattr(parser, 'split_final_signature'):
             paragraphs = parser.split_final_signature(article_id, paragraphs)
 
-        # 줄바꿈 제거 함수 (영문 전용)
-        def remove_line_breaks(text):
-            """조문 내 줄바꿈을 공백으로 변경 (영문 전용)"""
-            if lang not in ["english", None]:
-                return text
-            # 단일 줄바꿈을 공백으로 변경, 연속 줄바꿈은 유지
-            text = re.sub(r'(?<!\n)\n(?!\n)', ' ', text)
-            # 연속된 공백을 하나로 정리
-            text = re.sub(r' {2,}', ' ', text)
-            # 줄바꿈 주변 공백 정리
-            text = re.sub(r' *\n *', '\n', text)
-            return text.strip()
-
         if not paragraphs:
-            rows.append({
+            yield {
                 "편": current_part,
                 "장": current_chapter,
                 "절": current_section,
@@ -451,11 +468,11 @@ def extract_structured_articles(
                 "호": "",
                 "목": "",
                 "세목": "",
-                "원문": remove_line_breaks(article_text)
-            })
+                "원문": _remove_line_breaks(article_text, lang)
+            }
         else:
             for para in paragraphs:
-                rows.append({
+                yield {
                     "편": current_part,
                     "장": current_chapter,
                     "절": current_section,
@@ -465,140 +482,443 @@ def extract_structured_articles(
                     "호": para.get("item", ""),
                     "목": para.get("subitem", ""),
                     "세목": para.get("subsubitem", ""),
-                    "원문": remove_line_breaks(para["text"])
-                })
+                    "원문": _remove_line_breaks(para["text"], lang)
+                }
 
-    df = pd.DataFrame(rows)
 
-    # 조문번호 정규화: 'Section N' / 'Article N' / 'Rule N' / '§ N' → 'N'
-    # 한국법(숫자만), 중문(第N条), 전문/삭제 등은 그대로 유지
-    def _strip_article_prefix(val):
-        s = str(val).strip()
-        m = re.match(r'^(?:Section|Article|Rule|§)\s*(.+)$', s, re.IGNORECASE)
-        return m.group(1).strip() if m else s
+def _strip_article_prefix(val):
+    """조문번호 정규화: 'Section N' / 'Article N' / 'Rule N' / '§ N' → 'N'"""
+    s = str(val).strip()
+    m = _PATTERNS["article_prefix"].match(s)
+    return m.group(1).strip() if m else s
 
-    if '조문번호' in df.columns:
-        df['조문번호'] = df['조문번호'].apply(
-            lambda x: _strip_article_prefix(x) if pd.notna(x) and str(x).strip() not in ('전문', '') else x
-        )
 
-    # 조문 번호로 정렬 (항/호/목 순서도 포함)
-    # 1. 전문이 맨 앞
-    # 2. 홍콩 파서: Part 번호 → 조문 번호 → 항 → 호 → 목 순서대로
-    # 3. 기타: 조문 번호 → 항 → 호 → 목 순서대로
-    def get_sort_key(row):
-        import re
-        from parsers.hongkong import HongkongParser
+def _normalize_article_id(val):
+    """한국법(숫자만), 중문(第N条), 전문/삭제 등은 그대로 유지한다."""
+    if pd.notna(val) and str(val).strip() not in ('전문', ''):
+        return _strip_article_prefix(val)
+    return val
 
-        article_id = row['조문번호']
 
-        if article_id == "전문":
-            return (-1, 0, 0, "", 0, "", "", 0, "", "")
-
-        # 홍콩 파서: Part 번호 추출
-        part_num = 0
-        part_name = str(row['편']) if pd.notna(row['편']) else ""
-        if isinstance(parser, HongkongParser) and part_name:
-            # "Part N" 또는 "부칙 (Schedule N)" 패턴에서 숫자 추출
-            if part_name.startswith('부칙'):
-                part_num = 9999  # 부칙은 맨 뒤로
-            else:
-                part_match = re.search(r'Part (\d+)', part_name)
-                if part_match:
-                    part_num = int(part_match.group(1))
-
-        # 조문 번호 파싱 (31ZC, 31ZD 등 알파벳 여러 개 지원)
-        match = re.match(r'(\d+)([A-Z]*)', str(article_id))
-        if match:
-            article_num = int(match.group(1))
-            article_letter = match.group(2) or ""
+_ROMAN_VALUES = {'i': 1, 'v': 5, 'x': 10, 'l': 50, 'c': 100, 'd': 500, 'm': 1000}
+
+
+def _roman_to_int(roman: str) -> int:
+    """소문자 로마 숫자를 아라비아 숫자로 변환한다 (비표준 표기도 감산 규칙으로 계산)."""
+    total = 0
+    prev_value = 0
+    for char in reversed(roman):
+        value = _ROMAN_VALUES.get(char, 0)
+        if value < prev_value:
+            total -= value
         else:
-            # 기타 (삭제 등)
-            return (1, part_num, 0, str(article_id), 0, "", "", 0, "", "")
-
-        # 항 번호 파싱: (1), (2), (3), (1A), (1B) 등
-        para = str(row['항']) if pd.notna(row['항']) else ""
-        para_num = 999999  # 빈 항 번호는 맨 뒤로 (서명/날짜 등)
-        para_letter = ""
-        if para and para.strip():
-            para_match = re.search(r'\(?(\d+)([a-zA-Z]?)\)?', para)
-            if para_match:
-                para_num = int(para_match.group(1))
-                para_letter = para_match.group(2) or ""
-
-        # 호 번호 파싱: (a), (b), (c) 등
-        item = str(row['호']) if pd.notna(row['호']) else ""
-        item_letter = ""
-        if item:
-            item_match = re.search(r'\(?([a-z])\)?', item)
-            if item_match:
-                item_letter = item_match.group(1)
-
-        # 목 번호 파싱: (i), (ii), (iii) 등
-        subitem = str(row['목']) if pd.notna(row['목']) else ""
-        subitem_roman = ""
-        subitem_num = 0
-        if subitem:
-            subitem_match = re.search(r'\(?([ivxlcdm]+)\)?', subitem, re.IGNORECASE)
-            if subitem_match:
-                subitem_roman = subitem_match.group(1).lower()
-                # 로마 숫자를 아라비아 숫자로 변환
-                roman_values = {'i': 1, 'v': 5, 'x': 10, 'l': 50, 'c': 100, 'd': 500, 'm': 1000}
-                total = 0
-                prev_value = 0
-                for char in reversed(subitem_roman):
-                    value = roman_values.get(char, 0)
-                    if value < prev_value:
-                        total -= value
-                    else:
-                        total += value
-                    prev_value = value
-                subitem_num = total
+            total += value
+        prev_value = value
+    return total
+
 
-        # 세목 번호 파싱: (A), (B), (C) 등
-        subsubitem = str(row['세목']) if pd.notna(row['세목']) else ""
-        subsubitem_letter = ""
-        if subsubitem:
-            subsubitem_match = re.search(r'\(?([A-Z])\)?', subsubitem)
-            if subsubitem_match:
-                subsubitem_letter = subsubitem_match.group(1)
+def _int_to_roman(num: int) -> str:
+    """아라비아 숫자를 소문자 로마 숫자로 변환한다."""
+    pairs = [(1000, 'm'), (900, 'cm'), (500, 'd'), (400, 'cd'), (100, 'c'), (90, 'xc'),
+             (50, 'l'), (40, 'xl'), (10, 'x'), (9, 'ix'), (5, 'v'), (4, 'iv'), (1, 'i')]
+    out = []
+    for value, numeral in pairs:
+        count, num = divmod(num, value)
+        out.append(numeral * count)
+    return "".join(out)
 
-        return (0, part_num, article_num, article_letter, para_num, para_letter, item_letter, subitem_num, subitem_roman, subsubitem_letter)
 
-    df['_sort_key'] = df.apply(get_sort_key, axis=1)
-    df = df.sort_values('_sort_key').drop('_sort_key', axis=1).reset_index(drop=True)
+# 목 번호용 로마 숫자 변환표 (1~399). 표에 없는 표기만 _roman_to_int로 계산한다.
+_ROMAN_LOOKUP = {_int_to_roman(n): n for n in range(1, 400)}
+
+
+def _row_sort_key(row, is_hk: bool = False) -> tuple:
+    """구조화 행의 정렬 키를 계산한다.
+
+    1. 전문이 맨 앞
+    2. 홍콩 파서(is_hk): Part 번호 → 조문 번호 → 항 → 호 → 목 순서대로
+    3. 기타: 조문 번호 → 항 → 호 → 목 순서대로
+
+    Args:
+        row: 구조화 행 (dict 또는 DataFrame 행)
+        is_hk: 홍콩 파서 여부 (Part 번호를 정렬 키에 포함)
+    """
+    article_id = row['조문번호']
+
+    if article_id == "전문":
+        return (-1, 0, 0, "", 0, "", "", 0, "", "")
+
+    # 홍콩 파서: Part 번호 추출
+    part_num = 0
+    part_name = str(row['편']) if pd.notna(row['편']) else ""
+    if is_hk and part_name:
+        # "Part N" 또는 "부칙 (Schedule N)" 패턴에서 숫자 추출
+        if part_name.startswith('부칙'):
+            part_num = 9999  # 부칙은 맨 뒤로
+        else:
+            part_match = re.search(r'Part (\d+)', part_name)
+            if part_match:
+                part_num = int(part_match.group(1))
+
+    # 조문 번호 파싱 (31ZC, 31ZD 등 알파벳 여러 개 지원)
+    match = re.match(r'(\d+)([A-Z]*)', str(article_id))
+    if match:
+        article_num = int(match.group(1))
+        article_letter = match.group(2) or ""
+    else:
+        # 기타 (삭제 등)
+        return (1, part_num, 0, str(article_id), 0, "", "", 0, "", "")
+
+    # 항 번호 파싱: (1), (2), (3), (1A), (1B) 등
+    para = str(row['항']) if pd.notna(row['항']) else ""
+    para_num = 999999  # 빈 항 번호는 맨 뒤로 (서명/날짜 등)
+    para_letter = ""
+    if para and para.strip():
+        para_match = re.search(r'\(?(\d+)([a-zA-Z]?)\)?', para)
+        if para_match:
+            para_num = int(para_match.group(1))
+            para_letter = para_match.group(2) or ""
+
+    # 호 번호 파싱: (a), (b), (c) 등
+    item = str(row['호']) if pd.notna(row['호']) else ""
+    item_letter = ""
+    if item:
+        item_match = re.search(r'\(?([a-z])\)?', item)
+        if item_match:
+            item_letter = item_match.group(1)
+
+    # 목 번호 파싱: (i), (ii), (iii) 등
+    subitem = str(row['목']) if pd.notna(row['목']) else ""
+    subitem_roman = ""
+    subitem_num = 0
+    if subitem:
+        subitem_match = re.search(r'\(?([ivxlcdm]+)\)?', subitem, re.IGNORECASE)
+        if subitem_match:
+            subitem_roman = subitem_match.group(1).lower()
+            # 로마 숫자를 아라비아 숫자로 변환
+            subitem_num = _roman_to_int(subitem_roman)
+
+    # 세목 번호 파싱: (A), (B), (C) 등
+    subsubitem = str(row['세목']) if pd.notna(row['세목']) else ""
+    subsubitem_letter = ""
+    if subsubitem:
+        subsubitem_match = re.search(r'\(?([A-Z])\)?', subsubitem)
+        if subsubitem_match:
+            subsubitem_letter = subsubitem_match.group(1)
+
+    return (0, part_num, article_num, article_letter, para_num, para_letter, item_letter, subitem_num, subitem_roman, subsubitem_letter)
+
+
+def _sort_structured(df: pd.DataFrame, is_hk: bool = False) -> pd.DataFrame:
+    """구조화 DataFrame을 _row_sort_key와 같은 순서로 정렬한다 (벡터화 버전).
+
+    행마다 정규식을 돌리는 대신 열 단위 Series.str.extract로 키 열을 만들고
+    sort_values 한 번으로 정렬한다. 안정 정렬이므로 키가 같은 행은 원래(문서) 순서를 유지한다.
+    """
+    if df.empty:
+        return df
+
+    def _text(col):
+        # str(x) if pd.notna(x) else ""
+        return df[col].where(df[col].notna(), "").astype(str)
+
+    def _to_int(values, default):
+        return values.map(int, na_action="ignore").fillna(default).astype("int64")
+
+    article_id = df['조문번호'].astype(str)
+    is_preamble = df['조문번호'] == "전문"
+
+    # 조문 번호 파싱 (31ZC, 31ZD 등 알파벳 여러 개 지원)
+    article_match = article_id.str.extract(r'^(\d+)([A-Z]*)')
+    is_numbered = article_match[0].notna() & ~is_preamble
+    is_other = ~is_numbered & ~is_preamble  # 삭제 등
+
+    # 홍콩 파서: Part 번호 ("부칙"은 맨 뒤로)
+    if is_hk:
+        part_name = _text('편')
+        part_num = _to_int(part_name.str.extract(r'Part (\d+)')[0], 0)
+        part_num = part_num.mask(part_name.str.startswith('부칙'), 9999)
+        part_num = part_num.mask(is_preamble, 0)
+    else:
+        part_num = pd.Series(0, index=df.index, dtype="int64")
+
+    # 항 번호: (1), (2), (1A) 등 — 빈 항 번호는 맨 뒤로 (서명/날짜 등)
+    para = _text('항')
+    para_match = para.str.extract(r'\(?(\d+)([a-zA-Z]?)\)?')
+    has_para = (para.str.strip() != "") & para_match[0].notna()
+    para_num = _to_int(para_match[0].where(has_para), 999999)
+    para_letter = para_match[1].where(has_para, "").fillna("")
+
+    # 호 (a), 목 (i) 로마 숫자, 세목 (A)
+    item_letter = _text('호').str.extract(r'\(?([a-z])\)?')[0].fillna("")
+    subitem_roman = (
+        _text('목').str.extract(r'\(?([ivxlcdm]+)\)?', flags=re.IGNORECASE)[0]
+        .str.lower().fillna("")
+    )
+    subitem_num = subitem_roman.map(
+        lambda r: _ROMAN_LOOKUP.get(r) or _roman_to_int(r)
+    ).astype("int64")
+    subsubitem_letter = _text('세목').str.extract(r'\(?([A-Z])\)?')[0].fillna("")
+
+    numbered_only = ~is_numbered
+    keys = pd.DataFrame({
+        "group": (is_other.astype("int64") - is_preamble.astype("int64")),
+        "part_num": part_num,
+        "article_num": _to_int(article_match[0].where(is_numbered), 0),
+        # 번호가 없는 조문(삭제 등)은 조문번호 문자열 자체로 정렬
+        "article_letter": article_match[1].where(is_numbered, article_id.where(is_other, "")),
+        "para_num": para_num.mask(numbered_only, 0),
+        "para_letter": para_letter.mask(numbered_only, ""),
+        "item_letter": item_letter.mask(numbered_only, ""),
+        "subitem_num": subitem_num.mask(numbered_only, 0),
+        "subitem_roman": subitem_roman.mask(numbered_only, ""),
+        "subsubitem_letter": subsubitem_letter.mask(numbered_only, ""),
+    }, index=df.index)
+
+    order = keys.sort_values(list(keys.columns), kind="stable").index
+    return df.loc[order].reset_index(drop=True)
+
+
+def _fill_missing_hierarchy(df: pd.DataFrame, window: int = 5) -> pd.DataFrame:
+    """편 정보가 없는 행을 인접 행의 편/장으로 채운다 (열 단위 처리).
+
+    규칙 (행 단위 루프로 처리하던 것과 같은 결과):
+    1. 전문이나 삭제 조문은 건너뛴다.
+    2. 다음 window-1개 행 중 가장 가까운 편이 있는 행에서 가져온다.
+    3. 없으면 이전 window-1개 행 중 가장 가까운 편이 있는 행에서 가져온다.
+       이전 행은 이미 채워진 값 기준이므로, 이전 방향 채우기는 연쇄적으로 이어진다.
+
+    다음 방향은 limit이 있는 bfill, 이전 방향은 연쇄가 끊기는 지점을 구한 뒤 ffill로 처리한다.
+    """
+    if df.empty or '편' not in df.columns or window < 2:
+        return df
+
+    limit = window - 1
+    n = len(df)
+    positions = pd.Series(range(n), index=df.index, dtype="float64")
+
+    part = df['편']
+    article_id = df['조문번호']
+    has_part = part.notna() & (part != '')
+    skip = (article_id == '전문') | article_id.astype(str).str.contains('삭제', regex=False)
+    target = ~has_part & ~skip
+
+    # 1) 다음 행에서 채우기: 편이 있는 행의 위치를 limit개까지 뒤로 전파
+    next_source = positions.where(has_part).bfill(limit=limit)
+    from_next = target & next_source.notna()
+
+    # 편을 가진 행(원래 값 + 다음 행에서 채운 값)과 그 값의 출처 위치
+    carrier = has_part | from_next
+    carrier_source = positions.where(has_part, next_source.where(from_next))
+
+    # 2) 이전 행에서 채우기: 직전 기준점(carrier 또는 남은 대상 행)과의 거리가 limit 이하이면 성공.
+    #    한 번 실패하면 다음 carrier가 나올 때까지 뒤의 대상 행도 모두 실패한다.
+    remaining = target & ~from_next
+    anchor = positions.where(carrier | remaining).ffill().shift(1)
+    within = remaining & ((positions - anchor) <= limit)
+    segment = carrier.cumsum()
+    broken = (remaining & ~within).astype("int64").groupby(segment).cumsum() > 0
+    from_prev = within & ~broken & (segment > 0)
+
+    prev_source = carrier_source.ffill()
+    source = next_source.where(from_next, prev_source.where(from_prev))
+    fill_rows = source.notna()
+    if not fill_rows.any():
+        return df
+
+    df = df.copy()
+    src = source[fill_rows].astype("int64").to_numpy()
+    for col in ('편', '장'):
+        values = df[col].to_numpy(dtype=object)
+        values[fill_rows.to_numpy()] = values[src]
+        df[col] = values
+    return df
+
+
+def extract_structured_articles(
+    file_path: str,
+    progress_callback=None,
+    workers: int = 1,
+    use_cache: bool = True,
+) -> pd.DataFrame:
+    """PDF에서 법조문을 계층 구조(편/장/절/조/항/호)로 추출하여 DataFrame으로 반환한다.
+
+    Args:
+        file_path: PDF 파일 경로
+        progress_callback: 진행률 콜백 함수 (current, total, message)
+        workers: PDF 페이지 병렬 추출에 사용할 프로세스 수 (1이면 직렬)
+        use_cache: True이면 추출 텍스트 캐시(parsers.text_cache)를 사용한다.
+            파일 내용이 같으면 PDF/RTF 추출을 건너뛴다.
+
+    Returns:
+        DataFrame with columns: ['편', '장', '절', '조문번호', '조문제목', '항', '호', '목', '세목', '원문']
+    """
+    # 0. 파서 인스턴스 가져오기
+    parser = get_parser(file_path)
+
+    # 1. 텍스트 추출 (PDF 또는 RTF)
+    text = profiling.call(parser, "extract_text", _load_text,
+                          file_path, progress_callback, workers, use_cache)
+    lang = _detect_lang(file_path)
+    fmt = _detect_format(file_path)
+
+    # 2. 계층 구조 감지 (편/장/절)
+    hierarchy = profiling.call(parser, "detect_hierarchy", _detect_hierarchy,
+                               text, lang, file_path=file_path)
+
+    # 3. 조문 추출
+    articles = profiling.call(parser, "split_articles", split_articles,
+                              text, lang=lang, file_path=file_path)
+
+    # 4. 각 조문의 항/호 파싱 및 DataFrame 생성
+    rows = list(_iter_article_rows(parser, text, articles, hierarchy, lang, fmt))
+    df = pd.DataFrame(rows)
+
+    # 조문번호 정규화: 'Section N' / 'Article N' / 'Rule N' / '§ N' → 'N'
+    if '조문번호' in df.columns:
+        df['조문번호'] = df['조문번호'].apply(_normalize_article_id)
+
+    # 조문 번호로 정렬 (항/호/목 순서도 포함)
+    from parsers.hongkong import HongkongParser
+    df = _sort_structured(df, is_hk=isinstance(parser, HongkongParser))
 
     # 편/장 정보가 없는 조문을 인접 조문의 정보로 채우기
     # (삭제된 조문 제외)
-    for idx in df.index:
-        row = df.loc[idx]
-        # 전문이나 삭제 조문은 건너뛰기
-        if row['조문번호'] == '전문' or '삭제' in str(row['조문번호']):
-            continue
+    df = _fill_missing_hierarchy(df)
 
-        # 편 정보가 없는 경우
-        if pd.isna(row['편']) or row['편'] == '':
-            # 이전/다음 조문에서 찾기
-            found = False
+    return df
+
+
+def iter_structured_articles(
+    file_path: str,
+    progress_callback=None,
+    workers: int = 1,
+    use_cache: bool = True,
+    sort_window: int | None = 1000,
+):
+    """extract_structured_articles의 스트리밍 버전. 구조화 행(dict)을 하나씩 반환한다.
+
+    조문을 분리하는 대로 행을 만들어 내보내므로 DataFrame 전체를 메모리에 두지 않고
+    대형 통합 법전(프랑스 LEGI 코드, 미국 연방법전 Title 등)을 파싱하면서 바로 기록할 수 있다.
+
+    정렬은 입력이 대부분 이미 정렬되어 있다고 보고 sort_window 크기의 버퍼 안에서만
+    삽입 정렬한다. 원래 위치에서 sort_window 행 이상 밀려난 행은 완전히 정렬되지 않을 수 있다.
+    sort_window=None이면 전체 행을 모은 뒤 정렬한다 (extract_structured_articles와 같은 순서).
+
+    Args:
+        file_path: PDF/RTF 파일 경로
+        progress_callback: 진행률 콜백 함수 (current, total, message)
+        workers: PDF 페이지 병렬 추출에 사용할 프로세스 수 (1이면 직렬)
+        use_cache: True이면 추출 텍스트 캐시를 사용한다.
+        sort_window: 증분 정렬 버퍼 크기 (None이면 전체 정렬)
+
+    Yields:
+        {'편', '장', '절', '조문번호', '조문제목', '항', '호', '목', '세목', '원문'} 딕셔너리
+
+    사용 예:
+        with open("out.jsonl", "w", encoding="utf-8") as f:
+            for row in iter_structured_articles(path):
+                f.write(json.dumps(row, ensure_ascii=False) + "\n")
+    """
+    parser = get_parser(file_path)
+    text = profiling.call(parser, "extract_text", _load_text,
+                          file_path, progress_callback, workers, use_cache)
+    lang = _detect_lang(file_path)
+    fmt = _detect_format(file_path)
+    hierarchy = profiling.call(parser, "detect_hierarchy", _detect_hierarchy,
+                               text, lang, file_path=file_path)
+    articles = profiling.call(parser, "split_articles", split_articles,
+                              text, lang=lang, file_path=file_path)
+
+    from parsers.hongkong import HongkongParser
+    is_hk = isinstance(parser, HongkongParser)
+
+    def _normalized_rows():
+        for row in _iter_article_rows(parser, text, articles, hierarchy, lang, fmt):
+            row["조문번호"] = _normalize_article_id(row["조문번호"])
+            yield row
+
+    sorted_rows = _incremental_sort(
+        _normalized_rows(), key=lambda row: _row_sort_key(row, is_hk), window=sort_window
+    )
+    yield from _fill_missing_hierarchy_stream(sorted_rows)
+
+
+def _incremental_sort(items, key, window: int | None = 1000):
+    """대부분 정렬된 입력을 위한 증분 정렬 (안정 정렬).
+
+    새 항목을 정렬된 버퍼에 이진 탐색으로 삽입하고(대부분 맨 뒤라 비용이 작다),
+    버퍼가 window를 넘으면 가장 작은 항목부터 내보낸다.
+    window=None이면 전체를 모아 정렬한다.
+    """
+    if window is None:
+        yield from sorted(items, key=key)
+        return
+
+    import bisect
+    from collections import deque
+
+    keys = deque()
+    buffer = deque()
+    for item in items:
+        k = key(item)
+        if not keys or not k < keys[-1]:
+            # 이미 순서대로인 경우 (가장 흔함)
+            keys.append(k)
+            buffer.append(item)
+        else:
+            pos = bisect.bisect_right(keys, k)
+            keys.insert(pos, k)
+            buffer.insert(pos, item)
+        if len(buffer) > window:
+            keys.popleft()
+            yield buffer.popleft()
+    yield from buffer
+
+
+def _fill_missing_hierarchy_stream(rows, window: int = 5):
+    """편 정보가 없는 행을 인접 행(다음 우선, 없으면 이전)의 편/장으로 채운다.
+
+    extract_structured_articles의 보완 규칙과 같으며, 앞뒤 window-1개 행만 들고 있으면 된다.
+    전문이나 삭제 조문은 건너뛴다.
+    """
+    from collections import deque
+
+    it = iter(rows)
+    ahead = deque()
+    previous = deque(maxlen=window - 1)  # 보완이 끝난 이전 행들
+    for row in it:
+        ahead.append(row)
+        if len(ahead) >= window:
+            break
+
+    while ahead:
+        row = ahead.popleft()
+        next_row = next(it, None)
+        if next_row is not None:
+            ahead.append(next_row)
+
+        article_id = row['조문번호']
+        if not (article_id == '전문' or '삭제' in str(article_id)) and \
+                (pd.isna(row['편']) or row['편'] == ''):
+            source = None
             # 먼저 다음 조문 확인 (같은 Part일 가능성 높음)
-            for next_idx in range(idx + 1, min(idx + 5, len(df))):
-                next_row = df.loc[next_idx]
-                if next_row['편'] and next_row['편'] != '':
-                    df.loc[idx, '편'] = next_row['편']
-                    df.loc[idx, '장'] = next_row['장']
-                    found = True
+            for candidate in list(ahead)[:window - 1]:
+                if candidate['편'] and candidate['편'] != '':
+                    source = candidate
                     break
-
             # 다음 조문에서 못 찾으면 이전 조문 확인
-            if not found:
-                for prev_idx in range(idx - 1, max(idx - 5, -1), -1):
-                    prev_row = df.loc[prev_idx]
-                    if prev_row['편'] and prev_row['편'] != '':
-                        df.loc[idx, '편'] = prev_row['편']
-                        df.loc[idx, '장'] = prev_row['장']
+            if source is None:
+                for candidate in reversed(previous):
+                    if candidate['편'] and candidate['편'] != '':
+                        source = candidate
                         break
+            if source is not None:
+                row['편'] = source['편']
+                row['장'] = source['장']
 
-    return df
+        previous.append(row)
+        yield row
 
 
 def _detect_hierarchy(text: str, lang: str, file_path: str = None) -> list[dict]:
@@ -6,14 +6,37 @@
 
 import os
 import re
+from types import MappingProxyType
 import sys
 import time
 import subprocess
+import numpy as np
 import pdfplumber
 import pandas as pd
 # import google.generativeai as genai  # Removed: Gemini title extraction no longer used
 
 
+# ══════════════════════════════════════════════════════════════
+# 정규식 패턴 (import 시 한 번 컴파일, 읽기 전용)
+# ══════════════════════════════════════════════════════════════
+
+PATTERNS = MappingProxyType({
+    "preamble_recital": re.compile(r'\b(CONSIDERING|RECALLING|WISHING|HAVING|NOTING|DESIRING|RECOGNIZING|CONVINCED|AWARE)\s+', re.IGNORECASE),
+    "preamble_parties": re.compile(r'^(THE\s+CONTRACTING\s+MEMBER\s+STATES,?|THE\s+PARTIES,?)', re.IGNORECASE | re.MULTILINE),
+    "preamble_have_agreed": re.compile(r'\b(HAVE\s+AGREED\s+AS\s+FOLLOWS:?)', re.IGNORECASE),
+    "preamble_trailing_punct": re.compile(r'[;:]\s*$'),
+    "preamble_have_agreed_colon": re.compile(r'\bHAVE\s+AGREED\s+AS\s+FOLLOWS:'),
+    "chinese_article_title": re.compile(r"第\s*(?:\d+|[一二三四五六七八九十百千]+)\s*條(?:\s*之\s*\d+)?\s*\(([^)]+)\)"),
+    "korean_article_title": re.compile(r"제\s*\d+\s*조(?:의\s*\d+)?\s*\(([^)]+)\)"),
+    "title_trailing_rule_ref": re.compile(r'\s+R\.(\s*[\d\-,\s]*)?$'),
+    "title_rule_ref": re.compile(r'\s+R\.\s*[\d\-,\s]+'),
+    "title_article_ref": re.compile(r'\s+Art\.\s*[\d\-,\s]+', re.IGNORECASE),
+    "title_trailing_number_ref": re.compile(r'\s+\d+[\-,\s\da-z]*$'),
+    "title_trailing_page_number": re.compile(r'\s+\d{1,3}$'),
+    "reference_line": re.compile(r"^(?:Art\.|R\.|Rule|Reg\.)\s*[\d,\s-]+$", re.IGNORECASE),
+})
+
+
 # ══════════════════════════════════════════════════════════════
 # BaseParser — 국가별 파서의 기본 클래스
 # ══════════════════════════════════════════════════════════════
@@ -75,7 +98,18 @@ class BaseParser:
 # 공통 유틸리티 함수
 # ══════════════════════════════════════════════════════════════
 
-def parse_pdf(file_path: str, filter_superscript: bool = True, use_layout: bool = True) -> str:
+# 추출 텍스트 형식 버전 (parsers.text_cache 키에 포함).
+# parse_pdf / parse_rtf의 출력이 달라질 수 있는 수정(위첨자 필터, 2단 분리 등)을 하면 올린다.
+TEXT_EXTRACTOR_VERSION = 2
+
+
+def parse_pdf(
+    file_path: str,
+    filter_superscript: bool = True,
+    use_layout: bool = True,
+    workers: int = 1,
+    progress_callback=None,
+) -> str:
     """PDF 파일에서 전체 텍스트를 추출한다.
 
     Args:
@@ -83,83 +117,202 @@ def parse_pdf(file_path: str, filter_superscript: bool = True, use_layout: bool
         filter_superscript: True이면 위첨자(superscript) 문자를 제거한다.
             EPC 등 조문 번호 옆에 옛 번호가 위첨자로 붙는 PDF에 유용하다.
         use_layout: True이면 2단 구성 등 레이아웃을 고려하여 텍스트를 추출한다.
+        workers: 2 이상이면 페이지 범위를 나누어 프로세스 풀에서 병렬 추출한다.
+            각 워커가 PDF를 직접 열고, 결과는 페이지 순서대로 합쳐지므로
+            직렬 추출과 동일한 텍스트를 반환한다.
+        progress_callback: 진행률 콜백 함수 (current, total, message)
     """
-    texts = []
     with pdfplumber.open(file_path) as pdf:
-        for page in pdf.pages:
-            if use_layout:
-                # 2단 구성 처리: 컬럼별로 텍스트 추출
-                page_text = _extract_text_with_layout(page, filter_superscript)
-            elif filter_superscript and page.chars:
-                page_text = _extract_without_superscript(page)
-            else:
-                page_text = page.extract_text()
-            if page_text:
-                texts.append(page_text)
-    return "\n".join(texts)
+        total_pages = len(pdf.pages)
+        if workers <= 1 or total_pages < 2:
+            page_texts = []
+            for i, page in enumerate(pdf.pages):
+                page_texts.append(_extract_page_text(page, filter_superscript, use_layout))
+                if progress_callback:
+                    progress_callback(i + 1, total_pages, f"PDF 텍스트 추출 중... ({i + 1}/{total_pages} 페이지)")
+            return "\n".join(t for t in page_texts if t)
+
+    page_texts = _extract_pages_parallel(
+        file_path, total_pages, filter_superscript, use_layout, workers, progress_callback
+    )
+    return "\n".join(t for t in page_texts if t)
 
 
-def _extract_text_with_layout(page, filter_superscript: bool = True) -> str:
-    """2단 구성 등 레이아웃을 고려하여 텍스트를 추출한다.
+def _extract_page_text(page, filter_superscript: bool, use_layout: bool) -> str:
+    """한 페이지의 텍스트를 추출한다 (parse_pdf의 페이지 단위 처리)."""
+    if use_layout:
+        # 2단 구성 처리: 컬럼별로 텍스트 추출
+        return _extract_text_with_layout(page, filter_superscript)
+    elif filter_superscript and page.chars:
+        return _extract_without_superscript(page)
+    else:
+        return page.extract_text()
 
-    페이지를 좌우로 나누어 왼쪽 컬럼을 먼저 읽고, 오른쪽 컬럼을 읽는다.
-    단어가 잘리지 않도록 layout=True 옵션을 사용한다.
+
+def _extract_page_range(file_path: str, start: int, end: int,
+                        filter_superscript: bool, use_layout: bool) -> list[str]:
+    """프로세스 풀 워커: PDF를 직접 열어 [start, end) 페이지의 텍스트를 반환한다."""
+    with pdfplumber.open(file_path) as pdf:
+        return [
+            _extract_page_text(pdf.pages[i], filter_superscript, use_layout)
+            for i in range(start, end)
+        ]
+
+
+def _extract_pages_parallel(file_path: str, total_pages: int, filter_superscript: bool,
+                            use_layout: bool, workers: int, progress_callback=None) -> list[str]:
+    """페이지 범위를 샤드로 나누어 프로세스 풀에서 추출하고 페이지 순서대로 반환한다."""
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    workers = min(workers, total_pages)
+    # 워커당 4개 정도의 샤드로 나누어 부하를 고르게 하고 진행률을 자주 갱신한다
+    shard_size = max(1, -(-total_pages // (workers * 4)))
+    shards = [(s, min(s + shard_size, total_pages)) for s in range(0, total_pages, shard_size)]
+
+    results: list[list[str] | None] = [None] * len(shards)
+    done_pages = 0
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        future_to_idx = {
+            executor.submit(_extract_page_range, file_path, start, end, filter_superscript, use_layout): idx
+            for idx, (start, end) in enumerate(shards)
+        }
+        for future in as_completed(future_to_idx):
+            idx = future_to_idx[future]
+            results[idx] = future.result()
+            done_pages += shards[idx][1] - shards[idx][0]
+            if progress_callback:
+                progress_callback(done_pages, total_pages, f"PDF 텍스트 추출 중... ({done_pages}/{total_pages} 페이지)")
+
+    return [text for shard_texts in results for text in shard_texts]
+
+
+def _char_array(chars) -> np.ndarray:
+    """문자 목록을 (x0, x1, top, bottom, size) 열의 NumPy 배열로 변환한다."""
+    return np.array(
+        [(c["x0"], c["x1"], c["top"], c["bottom"], c["size"]) for c in chars],
+        dtype=np.float64,
+    ).reshape(-1, 5)
+
+
+def _superscript_threshold(sizes: np.ndarray) -> float | None:
+    """주요 폰트 크기(최빈값)의 75%를 위첨자 판정 기준으로 반환한다.
+
+    크기는 소수 첫째 자리로 반올림해 집계하며, 최빈값이 여럿이면
+    먼저 나온 크기를 택한다 (Counter.most_common과 같은 결과).
     """
-    if not page.chars:
-        return page.extract_text() or ""
+    if sizes.size == 0:
+        return None
+    uniq, first_idx, counts = np.unique(sizes, return_index=True, return_counts=True)
+
+    # 반올림은 고유값에만 파이썬 round로 적용 (np.round와 경계값 결과가 다를 수 있음)
+    rounded = {}
+    for size, first, count in zip(uniq.tolist(), first_idx.tolist(), counts.tolist()):
+        key = round(size, 1)
+        if key in rounded:
+            prev_count, prev_first = rounded[key]
+            rounded[key] = (prev_count + count, min(prev_first, first))
+        else:
+            rounded[key] = (count, first)
+
+    dominant_size = max(rounded, key=lambda k: (rounded[k][0], -rounded[k][1]))
+    return dominant_size * 0.75
 
-    # 페이지 너비의 중간점 계산
+
+def _region_stats(arr: np.ndarray, mask: np.ndarray) -> dict:
+    """영역 내 문자의 위첨자 기준 크기와 남는 문자 존재 여부를 계산한다."""
+    sizes = arr[mask, 4]
+    threshold = _superscript_threshold(sizes)
+    return {
+        "has_chars": sizes.size > 0,
+        "threshold": threshold,
+        "has_regular": threshold is not None and bool((sizes >= threshold).any()),
+    }
+
+
+def _analyze_page(page) -> dict:
+    """페이지 문자 배열을 한 번만 만들어 컬럼 구분과 위첨자 기준을 함께 계산한다.
+
+    Returns:
+        {"is_two_column", "mid_x", "regions"} 딕셔너리.
+        regions는 단일 컬럼이면 {"page": ...}, 2단이면 {"left": ..., "right": ...}이며
+        각 값은 _region_stats 결과다.
+    """
+    arr = _char_array(page.chars)
     page_width = page.width
     page_height = page.height
     mid_x = page_width / 2
 
     # 문자들의 x 좌표 분포를 확인하여 2단 구성인지 판단
-    x_coords = [c["x0"] for c in page.chars]
-    left_chars = sum(1 for x in x_coords if x < mid_x)
-    right_chars = sum(1 for x in x_coords if x >= mid_x)
-
-    # 양쪽에 문자가 골고루 분포되어 있으면 2단 구성으로 판단
     # (왼쪽/오른쪽 각각 전체의 30% 이상)
-    total_chars = len(x_coords)
+    x0 = arr[:, 0]
+    total_chars = len(x0)
+    left_chars = int((x0 < mid_x).sum())
+    right_chars = total_chars - left_chars
     is_two_column = (
         total_chars > 0 and
         left_chars / total_chars > 0.3 and
         right_chars / total_chars > 0.3
     )
 
-    if is_two_column:
-        # 2단 구성: 왼쪽 컬럼과 오른쪽 컬럼을 별도로 추출
-        # 실제 컬럼 경계 찾기 (중간 공백 영역)
-        # x 좌표를 정렬하여 가장 큰 간격 찾기
-        sorted_x = sorted(set([c["x0"] for c in page.chars]))
-        max_gap = 0
-        gap_pos = mid_x
-
-        for i in range(len(sorted_x) - 1):
-            gap = sorted_x[i + 1] - sorted_x[i]
-            # mid_x 근처(±20%)에서 가장 큰 간격 찾기
-            if (abs(sorted_x[i] - mid_x) < page_width * 0.2 and gap > max_gap):
-                max_gap = gap
-                gap_pos = (sorted_x[i] + sorted_x[i + 1]) / 2
-
+    if not is_two_column:
+        return {
+            "is_two_column": False,
+            "mid_x": mid_x,
+            "regions": {"page": _region_stats(arr, np.ones(total_chars, dtype=bool))},
+        }
+
+    # 실제 컬럼 경계 찾기: mid_x 근처(±20%)에서 x 좌표 간 가장 큰 간격
+    sorted_x = np.unique(x0)
+    if len(sorted_x) > 1:
+        gaps = np.diff(sorted_x)
+        near = np.abs(sorted_x[:-1] - mid_x) < page_width * 0.2
+        gaps = np.where(near, gaps, 0.0)
+        i = int(np.argmax(gaps))
         # 찾은 간격이 충분히 크면 사용, 아니면 mid_x 사용
-        if max_gap > page_width * 0.05:
-            mid_x = gap_pos
+        if gaps[i] > page_width * 0.05:
+            mid_x = (sorted_x[i] + sorted_x[i + 1]) / 2
+
+    # page.crop과 같은 규칙(겹침 폭/높이 >= 0, 합 > 0)으로 컬럼별 문자 선택
+    x1, top, bottom = arr[:, 1], arr[:, 2], arr[:, 3]
+    o_height = np.minimum(bottom, page_height) - np.maximum(top, 0)
 
-        # 왼쪽 컬럼 (0 ~ mid_x)
-        left_bbox = (0, 0, mid_x, page_height)
-        left_crop = page.crop(left_bbox)
+    def _in_bbox(bx0, bx1):
+        o_width = np.minimum(x1, bx1) - np.maximum(x0, bx0)
+        return (o_width >= 0) & (o_height >= 0) & (o_width + o_height > 0)
 
-        # 오른쪽 컬럼 (mid_x ~ page_width)
-        right_bbox = (mid_x, 0, page_width, page_height)
-        right_crop = page.crop(right_bbox)
+    return {
+        "is_two_column": True,
+        "mid_x": float(mid_x),
+        "regions": {
+            "left": _region_stats(arr, _in_bbox(0, mid_x)),
+            "right": _region_stats(arr, _in_bbox(mid_x, page_width)),
+        },
+    }
+
+
+def _extract_text_with_layout(page, filter_superscript: bool = True) -> str:
+    """2단 구성 등 레이아웃을 고려하여 텍스트를 추출한다.
+
+    페이지를 좌우로 나누어 왼쪽 컬럼을 먼저 읽고, 오른쪽 컬럼을 읽는다.
+    단어가 잘리지 않도록 layout=True 옵션을 사용한다.
+    컬럼 구분·위첨자 기준은 _analyze_page에서 한 번에 계산해 재사용한다.
+    """
+    if not page.chars:
+        return page.extract_text() or ""
+
+    analysis = _analyze_page(page)
+
+    if analysis["is_two_column"]:
+        # 2단 구성: 왼쪽 컬럼과 오른쪽 컬럼을 별도로 추출
+        mid_x = analysis["mid_x"]
+        left_crop = page.crop((0, 0, mid_x, page.height))
+        right_crop = page.crop((mid_x, 0, page.width, page.height))
 
         # 각 컬럼에서 텍스트 추출 (layout=True로 단어 보존)
         if filter_superscript:
-            left_text = _extract_without_superscript(left_crop)
-            right_text = _extract_without_superscript(right_crop)
+            left_text = _extract_without_superscript(left_crop, analysis["regions"]["left"])
+            right_text = _extract_without_superscript(right_crop, analysis["regions"]["right"])
         else:
-            # layout=True 옵션으로 단어가 잘리지 않도록 함
             left_text = left_crop.extract_text(layout=True) or ""
             right_text = right_crop.extract_text(layout=True) or ""
 
@@ -168,31 +321,28 @@ def _extract_text_with_layout(page, filter_superscript: bool = True) -> str:
     else:
         # 단일 컬럼: 일반 추출
         if filter_superscript:
-            return _extract_without_superscript(page)
+            return _extract_without_superscript(page, analysis["regions"]["page"])
         else:
             return page.extract_text(layout=True) or ""
 
 
-def _extract_without_superscript(page) -> str:
-    """위첨자 문자를 제거한 텍스트를 추출한다."""
-    chars = page.chars
-    if not chars:
-        return page.extract_text(layout=True) or ""
+def _extract_without_superscript(page, stats: dict | None = None) -> str:
+    """위첨자 문자를 제거한 텍스트를 추출한다.
 
-    # 페이지 내 주요 폰트 크기 판별 (최빈값)
-    from collections import Counter
-    sizes = [round(c["size"], 1) for c in chars]
-    if not sizes:
-        return page.extract_text(layout=True) or ""
-    dominant_size = Counter(sizes).most_common(1)[0][0]
+    Args:
+        page: pdfplumber 페이지 (또는 crop된 페이지)
+        stats: _analyze_page가 계산한 해당 영역 통계. 없으면 여기서 계산한다.
+    """
+    if stats is None:
+        chars = page.chars
+        if not chars:
+            return page.extract_text(layout=True) or ""
+        stats = _region_stats(_char_array(chars), np.ones(len(chars), dtype=bool))
 
     # 주요 크기의 75% 미만인 문자는 위첨자로 간주하여 제거
-    threshold = dominant_size * 0.75
-    filtered = [c for c in chars if c["size"] >= threshold]
-
-    # 필터링된 문자로 텍스트 재구성 (pdfplumber의 기본 extract_text 로직 활용)
-    if not filtered:
+    if not stats["has_chars"] or not stats["has_regular"]:
         return page.extract_text(layout=True) or ""
+    threshold = stats["threshold"]
 
     # 필터링된 chars만으로 페이지 텍스트 재추출
     filtered_page = page.filter(
@@ -262,17 +412,10 @@ def _parse_preamble(preamble_text: str) -> list[dict]:
 
     # 전문 패턴: CONSIDERING, RECALLING, WISHING, HAVING 등으로 시작하는 문단
     # 각 문단은 대문자 키워드로 시작하고 세미콜론 또는 콜론으로 끝남
-    preamble_pattern = re.compile(
-        r'\b(CONSIDERING|RECALLING|WISHING|HAVING|NOTING|DESIRING|RECOGNIZING|CONVINCED|AWARE)\s+',
-        re.IGNORECASE
-    )
+    preamble_pattern = PATTERNS["preamble_recital"]
 
     # "THE CONTRACTING MEMBER STATES," 등 서두 추출
-    header_match = re.search(
-        r'^(THE\s+CONTRACTING\s+MEMBER\s+STATES,?|THE\s+PARTIES,?)',
-        preamble_text,
-        re.IGNORECASE | re.MULTILINE
-    )
+    header_match = PATTERNS["preamble_parties"].search(preamble_text)
     if header_match:
         results.append({
             "paragraph": "서두",
@@ -289,7 +432,7 @@ def _parse_preamble(preamble_text: str) -> list[dict]:
             end = matches[i + 1].start()
         else:
             # "HAVE AGREED" 찾기
-            agreed_match = re.search(r'\bHAVE\s+AGREED\s+AS\s+FOLLOWS:', preamble_text[start:])
+            agreed_match = PATTERNS["preamble_have_agreed_colon"].search(preamble_text[start:])
             if agreed_match:
                 end = start + agreed_match.start()
             else:
@@ -297,7 +440,7 @@ def _parse_preamble(preamble_text: str) -> list[dict]:
 
         para_text = preamble_text[start:end].strip()
         # 끝의 세미콜론 제거
-        para_text = re.sub(r'[;:]\s*$', '', para_text)
+        para_text = PATTERNS["preamble_trailing_punct"].sub('', para_text)
 
         if para_text:
             results.append({
@@ -306,7 +449,7 @@ def _parse_preamble(preamble_text: str) -> list[dict]:
             })
 
     # "HAVE AGREED AS FOLLOWS:" 추가
-    agreed_match = re.search(r'\b(HAVE\s+AGREED\s+AS\s+FOLLOWS:?)', preamble_text, re.IGNORECASE)
+    agreed_match = PATTERNS["preamble_have_agreed"].search(preamble_text)
     if agreed_match:
         results.append({
             "paragraph": "합의",
@@ -320,12 +463,12 @@ def _extract_article_title(text: str, lang: str) -> str:
     """조문 텍스트에서 제목을 추출한다."""
     if lang == "chinese":
         # 第N條 (제목)
-        match = re.match(r"第\s*(?:\d+|[一二三四五六七八九十百千]+)\s*條(?:\s*之\s*\d+)?\s*\(([^)]+)\)", text)
+        match = PATTERNS["chinese_article_title"].match(text)
         if match:
             return match.group(1)
     elif lang == "korean":
         # 제N조(제목)
-        match = re.match(r"제\s*\d+\s*조(?:의\s*\d+)?\s*\(([^)]+)\)", text)
+        match = PATTERNS["korean_article_title"].match(text)
         if match:
             return match.group(1)
     else:
@@ -344,18 +487,18 @@ def _extract_article_title(text: str, lang: str) -> str:
         # 제목 정제
         # 1. 참조 번호 제거
         # "R. 39", "R. 9-13", "R." 등 (끝에 있는 경우)
-        title_line = re.sub(r'\s+R\.(\s*[\d\-,\s]*)?$', '', title_line)
+        title_line = PATTERNS["title_trailing_rule_ref"].sub('', title_line)
         # 중간의 R. 참조도 제거
-        title_line = re.sub(r'\s+R\.\s*[\d\-,\s]+', '', title_line)
+        title_line = PATTERNS["title_rule_ref"].sub('', title_line)
 
         # 2. "Art. X" 참조 제거
-        title_line = re.sub(r'\s+Art\.\s*[\d\-,\s]+', '', title_line, flags=re.IGNORECASE)
+        title_line = PATTERNS["title_article_ref"].sub('', title_line)
 
         # 3. 끝의 숫자 나열 제거 "70, 99-105c, 142" 또는 "70, 99-105c,"
-        title_line = re.sub(r'\s+\d+[\-,\s\da-z]*$', '', title_line)
+        title_line = PATTERNS["title_trailing_number_ref"].sub('', title_line)
 
         # 4. 끝의 페이지 번호 제거 (숫자 1-3개만)
-        title_line = re.sub(r'\s+\d{1,3}$', '', title_line)
+        title_line = PATTERNS["title_trailing_page_number"].sub('', title_line)
 
         title_line = title_line.strip()
 
@@ -490,7 +633,7 @@ def _clean_english_article(article_id: str, article_text: str, article_title: st
         # 초반 몇 줄: 제목이나 참조번호 포함 시 제거
         if i < 3:
             # 참조번호 패턴 (Art. 79, 149 / R. 39 등)
-            if re.match(r"^(?:Art\.|R\.|Rule|Reg\.)\s*[\d,\s-]+$", line_stripped, re.IGNORECASE):
+            if PATTERNS["reference_line"].match(line_stripped):
                 skip_lines += 1
                 continue
 
@@ -1,9 +1,42 @@
 """유럽(EPC) 법령 파서."""
 
 import re
+from types import MappingProxyType
 from parsers.base import BaseParser, _extract_article_title, _clean_english_article
 
 
+# ══════════════════════════════════════════════════════════════
+# 정규식 패턴 (import 시 한 번 컴파일, 읽기 전용)
+# ══════════════════════════════════════════════════════════════
+
+PATTERNS = MappingProxyType({
+    "paragraph_number": re.compile(r"(?:^|\n|[.!?])\s*\((\d+)\)\s+"),
+    "item_letter": re.compile(r"(?:^|\n)\s*\(([a-hj-uw-z])\)\s+"),
+    "means_word": re.compile(r'\bmeans\b'),
+    "subitem_roman": re.compile(r"(?:^|\n)\s*\(([ivxlcdm]+)\)\s+"),
+    "note_enlarged_board": re.compile(r'\s*See decisions?/opinions? of the Enlarged Board of Appeal[^.]*\.?\s*', re.IGNORECASE),
+    "note_information_from": re.compile(r'\s*See information from[^.]*\.\s*', re.IGNORECASE),
+    "note_see_decision": re.compile(r'\s*See (?:decision|opinion|notice)(?:s)?(?:/(?:decision|opinion|notice)(?:s)?)?(?: of| from)[^.]*\.\s*', re.IGNORECASE),
+    "note_amended_by_act": re.compile(r'\s*(?:Amended|Inserted|Deleted) by the Act[^.]*\.\s*', re.IGNORECASE),
+    "note_amended_by": re.compile(r'\s*(?:Title )?(?:Amended|Inserted|Deleted) by[^.]*\.\s*', re.IGNORECASE),
+    "note_see_decision_paren": re.compile(r'\s*\(See (?:decision|opinion|notice)(?:s)?[^)]*\)\s*', re.IGNORECASE),
+    "note_annex": re.compile(r'\s*\(Annex [IVX]+\)\s*', re.IGNORECASE),
+    "note_date_reference": re.compile(r'\s*\d{1,2}\.\d{4}\.?\s*(?:\([^)]*\))?\s*'),
+    "note_concerning": re.compile(r'\s*(?:notice|decision|information) from the [^.]*concerning[^.]*\.\s*', re.IGNORECASE),
+    "running_header": re.compile(r'\s*European Patent Convention\s+(?:April|January|February|March|May|June|July|August|September|October|November|December)\s+\d{4}\s*'),
+    "page_number_line": re.compile(r'(?m)^\d{1,3}\s*$'),
+    "page_number_after_sentence": re.compile(r'([.!?])\s*\d{1,3}\s+(?=\(\d+\))'),
+    "page_number_before_paragraph": re.compile(r'\n\s*\d{1,3}\s+(?=\(\d+\))'),
+    "multi_space": re.compile(r' {2,}'),
+    "trailing_heading": re.compile(r'\s*\n[ \t]*(?:Part|PART|Chapter|CHAPTER|Section|SECTION)\s+[IVX0-9]+[^\n]*$'),
+    "trailing_heading_two_lines": re.compile(r'\s*\n[ \t]*(?:Part|PART|Chapter|CHAPTER|Section|SECTION)\s+[IVX0-9]+[ \t]*$\n[ \t]*[A-Za-z ]+$', re.MULTILINE),
+    "reference_line": re.compile(r'^(?:Art\.|R\.|Rule|Reg\.)\s*[\d,\s\-a-zA-Z]+$'),
+    "title_reference_suffix": re.compile(r'^(?:Art\.|R\.|Rule)(?:\s*[\d,\s\-a-zA-Z]*)?$'),
+    "witness_clause": re.compile(r'(.*?)\s+(IN WITNESS WHEREOF.*)', re.DOTALL),
+    "done_at_munich": re.compile(r'\s+(Done at Munich.*)'),
+})
+
+
 class EpcParser(BaseParser):
     """유럽 특허 조약(EPC) 파서."""
 
@@ -60,11 +93,11 @@ class EpcParser(BaseParser):
                     # 참조 패턴 확인 (줄 끝 부분에 Art. 또는 R. 있음)
                     # 제목 길이를 고려하여 제목 이후의 텍스트만 확인
                     after_title = line_stripped[len(title):].strip()
-                    if re.match(r'^(?:Art\.|R\.|Rule)(?:\s*[\d,\s\-a-zA-Z]*)?$', after_title):
+                    if PATTERNS["title_reference_suffix"].match(after_title):
                         continue
 
                 # 참조번호만 있는 줄
-                if re.match(r'^(?:Art\.|R\.|Rule|Reg\.)\s*[\d,\s\-a-zA-Z]+$', line_stripped):
+                if PATTERNS["reference_line"].match(line_stripped):
                     continue
 
             # 실제 내용 추가
@@ -79,59 +112,50 @@ class EpcParser(BaseParser):
 
         # 개정 이력 제거 (본문 끝에 붙어있는 경우)
         # 1. "See decisions/opinions of the Enlarged Board of Appeal..." (판례 참조)
-        clean_text = re.sub(r'\s*See decisions?/opinions? of the Enlarged Board of Appeal[^.]*\.?\s*', ' ', clean_text, flags=re.IGNORECASE)
+        clean_text = PATTERNS["note_enlarged_board"].sub(' ', clean_text)
 
         # 2. "See information from..." 패턴
-        clean_text = re.sub(r'\s*See information from[^.]*\.\s*', ' ', clean_text, flags=re.IGNORECASE)
+        clean_text = PATTERNS["note_information_from"].sub(' ', clean_text)
 
         # 3. 일반적인 "See decision/opinion/notice..." 패턴
-        clean_text = re.sub(r'\s*See (?:decision|opinion|notice)(?:s)?(?:/(?:decision|opinion|notice)(?:s)?)?(?: of| from)[^.]*\.\s*', ' ', clean_text, flags=re.IGNORECASE)
+        clean_text = PATTERNS["note_see_decision"].sub(' ', clean_text)
 
         # 4. "Amended/Inserted/Deleted by..." 패턴
-        clean_text = re.sub(r'\s*(?:Amended|Inserted|Deleted) by the Act[^.]*\.\s*', ' ', clean_text, flags=re.IGNORECASE)
-        clean_text = re.sub(r'\s*(?:Title )?(?:Amended|Inserted|Deleted) by[^.]*\.\s*', ' ', clean_text, flags=re.IGNORECASE)
+        clean_text = PATTERNS["note_amended_by_act"].sub(' ', clean_text)
+        clean_text = PATTERNS["note_amended_by"].sub(' ', clean_text)
 
         # 5. 괄호 안의 개정 이력: "(See decision...)" 또는 "(Annex I)"
-        clean_text = re.sub(r'\s*\(See (?:decision|opinion|notice)(?:s)?[^)]*\)\s*', ' ', clean_text, flags=re.IGNORECASE)
-        clean_text = re.sub(r'\s*\(Annex [IVX]+\)\s*', ' ', clean_text, flags=re.IGNORECASE)
+        clean_text = PATTERNS["note_see_decision_paren"].sub(' ', clean_text)
+        clean_text = PATTERNS["note_annex"].sub(' ', clean_text)
 
         # 6. 날짜 형식의 참조: "11.2000.", "11.2022", "05.2011 (OJ EPO...)" 등
-        clean_text = re.sub(r'\s*\d{1,2}\.\d{4}\.?\s*(?:\([^)]*\))?\s*', ' ', clean_text)
+        clean_text = PATTERNS["note_date_reference"].sub(' ', clean_text)
 
         # 7. "concerning..." 형식의 notice/decision 참조
-        clean_text = re.sub(r'\s*(?:notice|decision|information) from the [^.]*concerning[^.]*\.\s*', ' ', clean_text, flags=re.IGNORECASE)
+        clean_text = PATTERNS["note_concerning"].sub(' ', clean_text)
 
         # "European Patent Convention April 2025" 같은 헤더 제거
-        clean_text = re.sub(r'\s*European Patent Convention\s+(?:April|January|February|March|May|June|July|August|September|October|November|December)\s+\d{4}\s*', ' ', clean_text)
+        clean_text = PATTERNS["running_header"].sub(' ', clean_text)
 
         # 단독 페이지 번호 줄 제거 (예: "61" 또는 "61 ")
-        clean_text = re.sub(r'(?m)^\d{1,3}\s*$', '', clean_text)
+        clean_text = PATTERNS["page_number_line"].sub('', clean_text)
 
         # 항 번호 "(숫자)" 앞에 있는 페이지 번호 제거
         # "this Convention.61 (2)" → "this Convention.\n(2)"
         # 마침표/개행 뒤의 페이지 번호와 공백을 제거
-        clean_text = re.sub(r'([.!?])\s*\d{1,3}\s+(?=\(\d+\))', r'\1\n', clean_text)
+        clean_text = PATTERNS["page_number_after_sentence"].sub(r'\1\n', clean_text)
         # 줄바꿈 뒤의 페이지 번호와 공백을 제거
-        clean_text = re.sub(r'\n\s*\d{1,3}\s+(?=\(\d+\))', '\n', clean_text)
+        clean_text = PATTERNS["page_number_before_paragraph"].sub('\n', clean_text)
 
         # 연속 공백 정리
-        clean_text = re.sub(r' {2,}', ' ', clean_text)
+        clean_text = PATTERNS["multi_space"].sub(' ', clean_text)
 
         # 본문 마지막에 잘못 포함된 Chapter/Part/Section 제목 제거
         # 한 줄 형태: "...조문내용.\nChapter III The European Patent Office"
-        clean_text = re.sub(
-            r'\s*\n[ \t]*(?:Part|PART|Chapter|CHAPTER|Section|SECTION)\s+[IVX0-9]+[^\n]*$',
-            '',
-            clean_text
-        )
+        clean_text = PATTERNS["trailing_heading"].sub('', clean_text)
         # 두 줄 형태: "...조문내용.\nChapter III\nThe European Patent Office"
         # ($\n 패턴: 첫 줄 끝 + 개행 + 두 번째 제목 줄 끝)
-        clean_text = re.sub(
-            r'\s*\n[ \t]*(?:Part|PART|Chapter|CHAPTER|Section|SECTION)\s+[IVX0-9]+[ \t]*$\n[ \t]*[A-Za-z ]+$',
-            '',
-            clean_text,
-            flags=re.MULTILINE
-        )
+        clean_text = PATTERNS["trailing_heading_two_lines"].sub('', clean_text)
 
         return clean_text.strip()
 
@@ -171,7 +195,7 @@ class EpcParser(BaseParser):
         text = last_para.get("text", "")
 
         # "IN WITNESS WHEREOF"로 시작하는 부분 찾기
-        match = re.search(r'(.*?)\s+(IN WITNESS WHEREOF.*)', text, re.DOTALL)
+        match = PATTERNS["witness_clause"].search(text)
         if match:
             # 마지막 항의 텍스트 업데이트 (서명 부분 제거)
             last_para["text"] = match.group(1).strip()
@@ -180,7 +204,7 @@ class EpcParser(BaseParser):
             signature_text = match.group(2).strip()
 
             # "Done at Munich..."을 별도로 분리
-            sig_parts = re.split(r'\s+(Done at Munich.*)', signature_text, maxsplit=1)
+            sig_parts = PATTERNS["done_at_munich"].split(signature_text, maxsplit=1)
 
             if len(sig_parts) == 1:
                 # "Done at Munich" 없음, 서명만
@@ -607,12 +631,12 @@ def _parse_paragraphs_english(text: str) -> list[dict]:
 
     # Paragraph: (1), (2)...
     # 줄 시작, 줄바꿈, 또는 문장 끝(마침표/느낌표/물음표) 후에 오는 (숫자)
-    para_pattern = re.compile(r"(?:^|\n|[.!?])\s*\((\d+)\)\s+")
+    para_pattern = PATTERNS["paragraph_number"]
     paragraphs = list(para_pattern.finditer(text))
 
     # 항 번호가 없으면 (a), (b), (c) 항목만 파싱
     if not paragraphs:
-        item_pattern = re.compile(r"(?:^|\n)\s*\(([a-hj-uw-z])\)\s+")
+        item_pattern = PATTERNS["item_letter"]
         items = list(item_pattern.finditer(text))
 
         if not items:
@@ -653,7 +677,7 @@ def _parse_paragraphs_english(text: str) -> list[dict]:
 
     # 정의 조항 감지
     def _is_definition_paragraph(para_text: str) -> bool:
-        means_count = len(re.findall(r'\bmeans\b', para_text))
+        means_count = len(PATTERNS["means_word"].findall(para_text))
         if means_count >= 3:
             return True
         if "unless the context otherwise requires" in para_text.lower():
@@ -678,7 +702,7 @@ def _parse_paragraphs_english(text: str) -> list[dict]:
             continue
 
         # Item: (a), (b), (c)... (i, v, x 제외 - 로마 숫자와 구분)
-        item_pattern = re.compile(r"(?:^|\n)\s*\(([a-hj-uw-z])\)\s+")
+        item_pattern = PATTERNS["item_letter"]
         items = list(item_pattern.finditer(para_text))
 
         if not items:
@@ -708,7 +732,7 @@ def _parse_paragraphs_english(text: str) -> list[dict]:
                 item_text = para_text[item_start:item_end].strip()
 
                 # Subitem: (i), (ii), (iii), (iv)... (로마 숫자)
-                subitem_pattern = re.compile(r"(?:^|\n)\s*\(([ivxlcdm]+)\)\s+")
+                subitem_pattern = PATTERNS["subitem_roman"]
                 subitems = list(subitem_pattern.finditer(item_text))
 
                 if not subitems:
@@ -7,11 +7,30 @@ import xml.etree.ElementTree as ET
 from pathlib import Path
 from html import unescape
 import re
+from types import MappingProxyType
 from typing import List, Tuple
 import pandas as pd
 from parsers.base import BaseParser
 
 
+# ══════════════════════════════════════════════════════════════
+# 정규식 패턴 (import 시 한 번 컴파일, 읽기 전용)
+# ══════════════════════════════════════════════════════════════
+
+PATTERNS = MappingProxyType({
+    "partie": re.compile(r"(première|deuxième|troisième|quatrième|cinquième)\s+partie"),
+    "livre": re.compile(r"livre\s+([ivxlcdm]+)"),
+    "titre": re.compile(r"titre\s+([ivxlcdm]+)"),
+    "chapitre": re.compile(r"chapitre\s+([ivxlcdm]+)"),
+    "section": re.compile(r"section\s+(\d+)"),
+    "sous_section": re.compile(r"sous-section\s+(\d+)"),
+    "whitespace": re.compile(r'\s+'),
+    "item_degree": re.compile(r'^\s*(\d+)°\s+(.+)', re.DOTALL),
+    "item_roman": re.compile(r'^\s*(I{1,3}|IV|V|VI{0,3}|IX|X)[\s.\-]+(.+)', re.DOTALL),
+    "item_letter": re.compile(r'^\s*([a-z])\)\s+(.+)', re.DOTALL),
+})
+
+
 class FranceParser(BaseParser):
     """프랑스 LEGI XML 파서 (XML 디렉토리 전용)."""
 
@@ -47,28 +66,28 @@ def detect_section_type(title: str) -> tuple:
     if "partie législative" in title_lower or "partie réglementaire" in title_lower:
         return ("part", "")
 
-    partie_match = re.match(r"(première|deuxième|troisième|quatrième|cinquième)\s+partie", title_lower)
+    partie_match = PATTERNS["partie"].match(title_lower)
     if partie_match:
         num_map = {"première": "1", "deuxième": "2", "troisième": "3", "quatrième": "4", "cinquième": "5"}
         return ("part", num_map.get(partie_match.group(1), ""))
 
-    livre_match = re.match(r"livre\s+([ivxlcdm]+)", title_lower)
+    livre_match = PATTERNS["livre"].match(title_lower)
     if livre_match:
         return ("book", livre_match.group(1).upper())
 
-    titre_match = re.match(r"titre\s+([ivxlcdm]+)", title_lower)
+    titre_match = PATTERNS["titre"].match(title_lower)
     if titre_match:
         return ("title", titre_match.group(1).upper())
 
-    chapitre_match = re.match(r"chapitre\s+([ivxlcdm]+)", title_lower)
+    chapitre_match = PATTERNS["chapitre"].match(title_lower)
     if chapitre_match:
         return ("chapter", chapitre_match.group(1).upper())
 
-    section_match = re.match(r"section\s+(\d+)", title_lower)
+    section_match = PATTERNS["section"].match(title_lower)
     if section_match:
         return ("section", section_match.group(1))
 
-    subsection_match = re.match(r"sous-section\s+(\d+)", title_lower)
+    subsection_match = PATTERNS["sous_section"].match(title_lower)
     if subsection_match:
         return ("subsection", subsection_match.group(1))
 
@@ -116,7 +135,7 @@ def extract_paragraphs_from_element(elem) -> List[str]:
 
         para_text = ''.join(text_parts)
         para_text = unescape(para_text)
-        para_text = re.sub(r'\s+', ' ', para_text)
+        para_text = PATTERNS["whitespace"].sub(' ', para_text)
         para_text = para_text.strip()
 
         if para_text:
@@ -134,7 +153,7 @@ def extract_paragraphs_from_element(elem) -> List[str]:
                 text_parts.append(child.tail)
         full_text = ''.join(text_parts)
         full_text = unescape(full_text)
-        full_text = re.sub(r'\s+', ' ', full_text)
+        full_text = PATTERNS["whitespace"].sub(' ', full_text)
         full_text = full_text.strip()
         if full_text:
             paragraphs.append(full_text)
@@ -149,21 +168,21 @@ def find_item_in_paragraph(para: str) -> Tuple[str, str, str]:
         (type, number, rest_of_text) - 항목이 없으면 ('none', '', para)
     """
     # 1°, 2°, 3° 형식 (문단 시작)
-    degree_match = re.match(r'^\s*(\d+)°\s+(.+)', para, re.DOTALL)
+    degree_match = PATTERNS["item_degree"].match(para)
     if degree_match:
         context_before = para[:degree_match.start(1)]
         if not any(kw in context_before.lower() for kw in ['au ', 'du ', 'le ', 'article', 'visé']):
             return ('degree', degree_match.group(1) + '°', degree_match.group(2))
 
     # I, II, III 로마 숫자 (문단 시작)
-    roman_match = re.match(r'^\s*(I{1,3}|IV|V|VI{0,3}|IX|X)[\s.\-]+(.+)', para, re.DOTALL)
+    roman_match = PATTERNS["item_roman"].match(para)
     if roman_match:
         context_before = para[:roman_match.start(1)]
         if not any(kw in context_before.lower() for kw in ['au ', 'du ', 'le ', 'article', 'visé', 'livre']):
             return ('roman', roman_match.group(1), roman_match.group(2))
 
     # a), b), c) 형식 (문단 시작)
-    alpha_match = re.match(r'^\s*([a-z])\)\s+(.+)', para, re.DOTALL)
+    alpha_match = PATTERNS["item_letter"].match(para)
     if alpha_match:
         return ('alpha', alpha_match.group(1) + ')', alpha_match.group(2))
 
@@ -0,0 +1,62 @@
+"""문서 계층(편/장/절) 위치 인덱스.
+
+감지된 계층 목록([{'type', 'title', 'start_pos'}, ...])을 문서당 한 번 정리해 두고,
+임의의 텍스트 위치가 속한 (part, chapter, section)을 이진 탐색으로 찾는다.
+조문마다 계층 목록 전체를 훑던 방식(O(n))을 O(log n)으로 줄인다.
+
+규칙 (기존 선형 탐색과 같음):
+- 위치보다 앞에서 시작한(start_pos <= position) 항목 중 레벨별로 가장 마지막 항목을 택한다.
+- 상위 레벨 항목이 나오면 그 이전의 하위 레벨 항목은 무효가 된다
+  (예: 새 Part가 나오면 이전 Chapter는 초기화).
+"""
+
+from bisect import bisect_right
+
+
+class HierarchyIndex:
+    """위치 → 계층 제목 조회용 인덱스.
+
+    Args:
+        hierarchy: [{'type': 'part', 'title': 'PART I ...', 'start_pos': 123}, ...]
+            start_pos 순서가 아니어도 된다 (안정 정렬 후 사용).
+        levels: 상위 → 하위 순서의 레벨 이름. 'type'이 levels에 없는 항목은 무시한다.
+        default_level: 'type' 키가 없는 항목에 적용할 레벨 (None이면 levels[0])
+    """
+
+    def __init__(self, hierarchy: list[dict],
+                 levels: tuple[str, ...] = ("part", "chapter", "section"),
+                 default_level: str | None = None):
+        self.levels = tuple(levels)
+        default_level = default_level or self.levels[0]
+
+        ordered = sorted(hierarchy, key=lambda h: h["start_pos"])
+        self._starts = {level: [] for level in self.levels}
+        self._entries = {level: [] for level in self.levels}  # (목록 내 순서, 제목)
+        for seq, h in enumerate(ordered):
+            level = h.get("type", default_level)
+            if level not in self._starts:
+                continue
+            self._starts[level].append(h["start_pos"])
+            self._entries[level].append((seq, h["title"]))
+
+    def lookup(self, position: int) -> tuple[str, ...]:
+        """position이 속한 레벨별 제목을 levels 순서의 튜플로 반환한다 (없으면 "")."""
+        result = []
+        parent_seq = -1
+        for level in self.levels:
+            i = bisect_right(self._starts[level], position) - 1
+            if i < 0:
+                result.append("")
+                continue
+            seq, title = self._entries[level][i]
+            # 상위 레벨 항목보다 앞에 나온 하위 항목은 초기화된 것으로 본다
+            if seq < parent_seq:
+                result.append("")
+                continue
+            result.append(title)
+            parent_seq = seq
+        return tuple(result)
+
+    def at(self, position: int) -> dict:
+        """position이 속한 레벨별 제목을 {레벨: 제목} 딕셔너리로 반환한다."""
+        return dict(zip(self.levels, self.lookup(position)))
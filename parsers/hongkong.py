@@ -10,9 +10,22 @@
 """
 import os
 import re
+from types import MappingProxyType
 from parsers.base import BaseParser
 
 
+# ══════════════════════════════════════════════════════════════
+# 정규식 패턴 (import 시 한 번 컴파일, 읽기 전용)
+# ══════════════════════════════════════════════════════════════
+
+PATTERNS = MappingProxyType({
+    "subsection": re.compile(r'(?:^|[\n\t])\((\d+[a-zA-Z]?)\)\t+(.*?)(?=(?:^|[\n\t])\(\d+[a-zA-Z]?\)\t+|\Z)', re.DOTALL | re.MULTILINE),
+    "paragraph": re.compile(r'(?:^|[\n\t])\(([a-hj-uwyz])\)\t+(.*?)(?=(?:^|[\n\t])\([a-hj-uwyz]\)\t+|\Z)', re.DOTALL | re.MULTILINE),
+    "subparagraph": re.compile(r'(?:^|[\n\t])\(([ivxlcdm]+)\)\t+(.*?)(?=(?:^|[\n\t])\([ivxlcdm]+\)\t+|\Z)', re.DOTALL | re.MULTILINE),
+    "sub_subparagraph": re.compile(r'(?:^|[\n\t])\(([A-HJ-UW-Z])\)\t+(.*?)(?=(?:^|[\n\t])\([A-HJ-UW-Z]\)\t+|\Z)', re.DOTALL | re.MULTILINE),
+})
+
+
 class HongkongParser(BaseParser):
     """홍콩 법령 RTF 파서"""
 
@@ -353,19 +366,13 @@ def _parse_paragraphs_hongkong(text: str, section_id: str = None) -> list[dict]:
     # 항 앞에 탭 문자가 있을 수 있음: \t(1)\t 또는 \n\t(1)\t
     # 텍스트 시작 부분의 항도 매칭: ^(1)\t
     # 대문자도 매칭: (1A), (1B) 등
-    subsection_pattern = re.compile(
-        r'(?:^|[\n\t])\((\d+[a-zA-Z]?)\)\t+(.*?)(?=(?:^|[\n\t])\(\d+[a-zA-Z]?\)\t+|\Z)',
-        re.DOTALL | re.MULTILINE
-    )
+    subsection_pattern = PATTERNS["subsection"]
     subsections = list(subsection_pattern.finditer(text))
 
     if not subsections:
         # 항이 없으면 (a), (b) 호만 파싱 시도
         # 로마 숫자 (i, v, x)만 제외 (소문자 단일 문자 로마 숫자)
-        para_pattern = re.compile(
-            r'(?:^|[\n\t])\(([a-hj-uwyz])\)\t+(.*?)(?=(?:^|[\n\t])\([a-hj-uwyz]\)\t+|\Z)',
-            re.DOTALL | re.MULTILINE
-        )
+        para_pattern = PATTERNS["paragraph"]
         paras = list(para_pattern.finditer(text))
 
         if not paras:
@@ -398,10 +405,7 @@ def _parse_paragraphs_hongkong(text: str, section_id: str = None) -> list[dict]:
 
                 # 호 안에서 목 (i), (ii), (iii) 찾기
                 # 로마 숫자 패턴
-                subitem_pattern = re.compile(
-                    r'(?:^|[\n\t])\(([ivxlcdm]+)\)\t+(.*?)(?=(?:^|[\n\t])\([ivxlcdm]+\)\t+|\Z)',
-                    re.DOTALL | re.MULTILINE
-                )
+                subitem_pattern = PATTERNS["subparagraph"]
                 subitems = list(subitem_pattern.finditer(para_text))
 
                 if not subitems:
@@ -472,10 +476,7 @@ def _parse_paragraphs_hongkong(text: str, section_id: str = None) -> list[dict]:
         if not is_definition:
             # 호 앞에 탭 문자가 있을 수 있음: \t(a)\t 또는 \n\t(a)\t 또는 ^(a)\t
             # 로마 숫자 i, v, x만 제외 (소문자 단일 문자 로마 숫자)
-            para_pattern = re.compile(
-                r'(?:^|[\n\t])\(([a-hj-uwyz])\)\t+(.*?)(?=(?:^|[\n\t])\([a-hj-uwyz]\)\t+|\Z)',
-                re.DOTALL | re.MULTILINE
-            )
+            para_pattern = PATTERNS["paragraph"]
             paras = list(para_pattern.finditer(subsection_text))
         else:
             # 정의 규정인 경우 호로 파싱하지 않음
@@ -510,10 +511,7 @@ def _parse_paragraphs_hongkong(text: str, section_id: str = None) -> list[dict]:
 
                 # 호 내에서 목 (i), (ii), (iii) 찾기
                 # 목 앞에도 탭 문자가 있을 수 있음 또는 텍스트 시작
-                subitem_pattern = re.compile(
-                    r'(?:^|[\n\t])\(([ivxlcdm]+)\)\t+(.*?)(?=(?:^|[\n\t])\([ivxlcdm]+\)\t+|\Z)',
-                    re.DOTALL | re.MULTILINE
-                )
+                subitem_pattern = PATTERNS["subparagraph"]
                 subitems = list(subitem_pattern.finditer(para_text))
 
                 if not subitems:
@@ -545,10 +543,7 @@ def _parse_paragraphs_hongkong(text: str, section_id: str = None) -> list[dict]:
 
                         # 목 내에서 세목 (A), (B), (C) 찾기
                         # (I), (V), (X) 등 로마 숫자는 제외 (텍스트로 포함)
-                        subsubitem_pattern = re.compile(
-                            r'(?:^|[\n\t])\(([A-HJ-UW-Z])\)\t+(.*?)(?=(?:^|[\n\t])\([A-HJ-UW-Z]\)\t+|\Z)',
-                            re.DOTALL | re.MULTILINE
-                        )
+                        subsubitem_pattern = PATTERNS["sub_subparagraph"]
                         subsubitems = list(subsubitem_pattern.finditer(subitem_text))
 
                         if not subsubitems:
@@ -1,9 +1,32 @@
 """한국 법령 파서."""
 
 import re
+from types import MappingProxyType
 from parsers.base import BaseParser, _extract_article_title
 
 
+# ══════════════════════════════════════════════════════════════
+# 정규식 패턴 (import 시 한 번 컴파일, 읽기 전용)
+# ══════════════════════════════════════════════════════════════
+
+PATTERNS = MappingProxyType({
+    "article_header": re.compile(
+        r"^제\s*\d+\s*조(?:의\s*\d+)?"   # 제N조(의N)
+        r"\s*"
+        r"(?:\(([^)]+)\))?"               # (제목) — 선택
+        r"\s*"
+        r"(?:<[^>]*>\s*)*"
+    ),
+    "article_number": re.compile(r"(\d+(?:의\s*\d+)?)"),
+    "amendment_tag": re.compile(r"\s*<[^>]+>"),
+    "circled_number": re.compile(r"[①②③④⑤⑥⑦⑧⑨⑩⑪⑫⑬⑭⑮⑯⑰⑱⑲⑳]"),
+    "item_number": re.compile(r"(?:^|\n)\s*(?:제\s*)?(\d{1,3})(?:\.\s+|호\s*)"),
+    "item_number_false_positive": re.compile(r'^\s*(?:부터|까지|에|의|를|을|와|과|로|으로|이|가|는|만|도)'),
+    "subitem_hangul": re.compile(r"(?:^|\n)\s*([가-힣])(?:\.\s+|목\s*)"),
+    "subsubitem": re.compile(r"(?:^|\n)\s*(?:(\d{1,2})|([가-힣]))\)\s+"),
+})
+
+
 class KoreaParser(BaseParser):
     """한국 법령 파서."""
 
@@ -128,7 +151,7 @@ def _clean_korean_article(article_id: str, article_text: str) -> tuple[str, str,
     """
     # 삭제 조문
     if "(삭제)" in article_id or article_text == "(삭제)":
-        num_match = re.search(r"(\d+(?:의\s*\d+)?)", article_id)
+        num_match = PATTERNS["article_number"].search(article_id)
         num = num_match.group(1).replace(" ", "") if num_match else article_id
         return num, "(삭제)", "(삭제)"
 
@@ -136,13 +159,7 @@ def _clean_korean_article(article_id: str, article_text: str) -> tuple[str, str,
     clean_id = article_id.replace("제", "").replace("조", "").replace(" ", "")
 
     # 원문에서 제N조(제목) 헤더 분리
-    header_pattern = re.compile(
-        r"^제\s*\d+\s*조(?:의\s*\d+)?"   # 제N조(의N)
-        r"\s*"
-        r"(?:\(([^)]+)\))?"               # (제목) — 선택
-        r"\s*"
-        r"(?:<[^>]*>\s*)*"                # <개정 ...> 태그 — 선택
-    )
+    header_pattern = PATTERNS["article_header"]
     match = header_pattern.match(article_text)
 
     title = ""
@@ -151,7 +168,7 @@ def _clean_korean_article(article_id: str, article_text: str) -> tuple[str, str,
     if match:
         title = match.group(1) or ""
         # 제목에서 <개정...> 태그 제거
-        title = re.sub(r"\s*<[^>]+>", "", title).strip()
+        title = PATTERNS["amendment_tag"].sub("", title).strip()
         # 원문에서 헤더 부분 제거
         clean_text = article_text[match.end():].strip()
 
@@ -167,7 +184,7 @@ def _parse_paragraphs_korean(text: str) -> list[dict]:
     results = []
 
     # ① 항 패턴
-    para_pattern = re.compile(r"[①②③④⑤⑥⑦⑧⑨⑩⑪⑫⑬⑭⑮⑯⑰⑱⑲⑳]")
+    para_pattern = PATTERNS["circled_number"]
     paragraphs = list(para_pattern.finditer(text))
 
     # 항이 없는 경우 전체를 하나의 항으로 간주
@@ -188,7 +205,7 @@ def _parse_paragraphs_korean(text: str) -> list[dict]:
         para_text = para_info["text"]
 
         # 호(1., 2., 3... 또는 제1호, 제2호...) 파싱
-        item_pattern = re.compile(r"(?:^|\n)\s*(?:제\s*)?(\d{1,3})(?:\.\s+|호\s*)")
+        item_pattern = PATTERNS["item_number"]
         items_raw = list(item_pattern.finditer(para_text))
 
         # 괄호 안의 "제N호" 및 참조 "제N호부터/까지/에..." 제외
@@ -199,7 +216,7 @@ def _parse_paragraphs_korean(text: str) -> list[dict]:
 
             # 뒤에 오는 텍스트 확인 (참조 조사 체크)
             suffix = para_text[end:min(end+10, len(para_text))]
-            if re.match(r'^\s*(?:부터|까지|에|의|를|을|와|과|로|으로|이|가|는|만|도)', suffix):
+            if PATTERNS["item_number_false_positive"].match(suffix):
                 continue
 
             # 앞 20자 확인 (괄호 안 제외)
@@ -225,7 +242,7 @@ def _parse_paragraphs_korean(text: str) -> list[dict]:
                 item_text = para_text[item_start:item_end].strip()
 
                 # 목(가., 나., 다... 또는 가목, 나목...) 파싱
-                subitem_pattern = re.compile(r"(?:^|\n)\s*([가-힣])(?:\.\s+|목\s*)")
+                subitem_pattern = PATTERNS["subitem_hangul"]
                 subitems = list(subitem_pattern.finditer(item_text))
 
                 if not subitems:
@@ -244,7 +261,7 @@ def _parse_paragraphs_korean(text: str) -> list[dict]:
                         subitem_text = item_text[subitem_start:subitem_end].strip()
 
                         # 세목(1), 2), 3)... 또는 가), 나), 다)...) 파싱
-                        subsubitem_pattern = re.compile(r"(?:^|\n)\s*(?:(\d{1,2})|([가-힣]))\)\s+")
+                        subsubitem_pattern = PATTERNS["subsubitem"]
                         subsubitems = list(subsubitem_pattern.finditer(subitem_text))
 
                         if not subsubitems:
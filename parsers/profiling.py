@@ -0,0 +1,190 @@
+"""파서 단계별 실행 시간 계측 (선택 사용).
+
+등록된 국가별 파서의 단계(extract_text, split_articles, detect_hierarchy,
+parse_paragraphs, clean_article)마다 호출 횟수, 누적 시간, 입력 크기를 기록한다.
+외부 프로파일러 없이 어느 국가 파서가 느린지 확인하는 용도이다.
+
+켜는 방법:
+1. 컨텍스트 매니저 — 블록 안에서 실행된 단계만 모아 딕셔너리로 돌려준다.
+
+    with profile_parsers() as profile:
+        df = extract_structured_articles(path)
+    profile  # {'KoreaParser': {'split_articles': {'calls': 1, 'seconds': 0.01, 'input_chars': 52000}, ...}}
+
+2. 환경 변수 PARSER_PROFILE=1 — 프로세스 전체에서 기록하며 get_profile()로 조회한다.
+
+꺼져 있으면 단계마다 플래그 확인만 하고 원래 함수를 그대로 호출한다.
+입력 크기는 extract_text는 파일 크기(바이트), 나머지는 가장 긴 문자열 인자의 글자 수이다.
+"""
+
+import functools
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+
+PROFILED_STAGES = (
+    "extract_text",
+    "split_articles",
+    "detect_hierarchy",
+    "parse_paragraphs",
+    "clean_article",
+)
+
+ENV_FLAG = "PARSER_PROFILE"
+
+_ENV_ENABLED = os.environ.get(ENV_FLAG, "").strip().lower() not in ("", "0", "false", "no")
+
+_lock = threading.Lock()
+_global_profile: dict = {}   # 환경 변수로 켠 경우 누적 결과
+_collectors: list[dict] = []  # 실행 중인 profile_parsers() 블록들의 결과
+
+
+# ══════════════════════════════════════════════════════════════
+# 기록
+# ══════════════════════════════════════════════════════════════
+
+def is_enabled() -> bool:
+    """계측이 켜져 있는지 (환경 변수 또는 profile_parsers() 블록 실행 중)."""
+    return _ENV_ENABLED or bool(_collectors)
+
+
+def _input_size(stage: str, args) -> int:
+    if stage == "extract_text":
+        for arg in args:
+            if isinstance(arg, (str, os.PathLike)):
+                try:
+                    return os.path.getsize(arg)
+                except OSError:
+                    return 0
+        return 0
+    return max((len(arg) for arg in args if isinstance(arg, str)), default=0)
+
+
+def _add(profile: dict, parser_name: str, stage: str, seconds: float, size: int):
+    entry = profile.setdefault(parser_name, {}).setdefault(
+        stage, {"calls": 0, "seconds": 0.0, "input_chars": 0}
+    )
+    entry["calls"] += 1
+    entry["seconds"] += seconds
+    entry["input_chars"] += size
+
+
+def record(parser_name: str, stage: str, seconds: float, size: int = 0):
+    """단계 실행 한 번을 기록한다 (켜져 있는 모든 수집 대상에)."""
+    with _lock:
+        if _ENV_ENABLED:
+            _add(_global_profile, parser_name, stage, seconds, size)
+        for collected in _collectors:
+            _add(collected, parser_name, stage, seconds, size)
+
+
+def call(parser, stage: str, fn, *args, **kwargs):
+    """fn(*args, **kwargs)를 실행하고, 계측이 켜져 있으면 parser 이름의 stage로 기록한다.
+
+    parsers 패키지의 모듈 수준 분기 함수(split_articles, _detect_hierarchy 등)처럼
+    파서 메서드를 거치지 않는 단계를 계측할 때 사용한다.
+    """
+    if not is_enabled():
+        return fn(*args, **kwargs)
+    start = time.perf_counter()
+    try:
+        return fn(*args, **kwargs)
+    finally:
+        record(type(parser).__name__, stage, time.perf_counter() - start,
+               _input_size(stage, args))
+
+
+# ══════════════════════════════════════════════════════════════
+# 파서 클래스 계측
+# ══════════════════════════════════════════════════════════════
+
+def _wrap_method(method, stage: str):
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if not is_enabled():
+            return method(self, *args, **kwargs)
+        start = time.perf_counter()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            record(type(self).__name__, stage, time.perf_counter() - start,
+                   _input_size(stage, args))
+
+    wrapper.__profiled__ = True
+    return wrapper
+
+
+def instrument(parser_cls):
+    """파서 클래스의 단계 메서드(PROFILED_STAGES)를 계측 래퍼로 감싼다.
+
+    레지스트리 등록 시(parsers.register) 호출된다. 이미 감싼 메서드는 다시 감싸지 않는다.
+    """
+    for stage in PROFILED_STAGES:
+        method = getattr(parser_cls, stage, None)
+        if method is None or getattr(method, "__profiled__", False):
+            continue
+        setattr(parser_cls, stage, _wrap_method(method, stage))
+    return parser_cls
+
+
+# ══════════════════════════════════════════════════════════════
+# 조회
+# ══════════════════════════════════════════════════════════════
+
+@contextmanager
+def profile_parsers():
+    """블록 안에서 실행된 파서 단계를 계측한다.
+
+    Yields:
+        {파서 클래스 이름: {단계: {'calls', 'seconds', 'input_chars'}}} 딕셔너리
+        (블록이 진행되는 동안 채워진다)
+
+    다른 스레드에서 같은 시간에 실행된 파싱도 함께 기록된다.
+    """
+    collected = {}
+    with _lock:
+        _collectors.append(collected)
+    try:
+        yield collected
+    finally:
+        with _lock:
+            _collectors.remove(collected)
+
+
+def get_profile() -> dict:
+    """환경 변수(PARSER_PROFILE)로 켠 경우 지금까지 누적된 결과의 복사본을 반환한다."""
+    with _lock:
+        return {
+            parser_name: {stage: dict(entry) for stage, entry in stages.items()}
+            for parser_name, stages in _global_profile.items()
+        }
+
+
+def reset_profile():
+    """누적 결과(get_profile)를 비운다."""
+    with _lock:
+        _global_profile.clear()
+
+
+def profile_rows(profile: dict) -> list[dict]:
+    """결과 딕셔너리를 표 형태(행 목록)로 바꾼다 (st.dataframe / pd.DataFrame 용).
+
+    Returns:
+        [{'파서', '단계', '호출 수', '누적 시간(초)', '호출당(ms)', '입력 크기'}, ...]
+        (누적 시간 내림차순)
+    """
+    rows = []
+    for parser_name, stages in profile.items():
+        for stage, entry in stages.items():
+            rows.append({
+                "파서": parser_name,
+                "단계": stage,
+                "호출 수": entry["calls"],
+                "누적 시간(초)": round(entry["seconds"], 4),
+                "호출당(ms)": round(entry["seconds"] * 1000 / entry["calls"], 3) if entry["calls"] else 0.0,
+                "입력 크기": entry["input_chars"],
+            })
+    rows.sort(key=lambda r: r["누적 시간(초)"], reverse=True)
+    return rows
@@ -0,0 +1,139 @@
+"""추출 텍스트 디스크 캐시.
+
+PDF/RTF에서 추출한 원문 텍스트를 파일 내용 해시 + 추출 옵션을 키로 저장한다.
+추출 옵션에는 추출기 버전(parsers.base.TEXT_EXTRACTOR_VERSION)이 들어가므로,
+추출 코드가 바뀌어 버전을 올리면 이전 텍스트는 쓰이지 않는다.
+같은 파일을 다시 구조화할 때 pdfplumber 추출을 건너뛰어
+파서 정규식 수정 후 재실행이 바로 시작되도록 한다.
+
+캐시 총 크기가 TEXT_CACHE_MAX_BYTES를 넘으면
+가장 오래 사용하지 않은 항목부터 삭제한다 (LRU).
+"""
+
+import glob
+import hashlib
+import json
+import os
+
+# 캐시 저장 폴더 (프로젝트 루트)
+_CACHE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".text_cache"
+)
+
+# 캐시 최대 크기 (바이트)
+TEXT_CACHE_MAX_BYTES = 512 * 1024 * 1024
+
+
+def _file_hash(file_path: str) -> str:
+    """파일 내용의 SHA-256 해시를 계산한다."""
+    h = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _make_cache_key(file_hash: str, options: dict) -> str:
+    """파일 해시와 추출 옵션으로 캐시 키를 만든다.
+
+    파일별 무효화를 위해 파일 해시를 키 앞부분에 둔다.
+    """
+    opts = json.dumps(options, sort_keys=True)
+    opts_hash = hashlib.sha256(opts.encode("utf-8")).hexdigest()[:16]
+    return f"{file_hash[:32]}_{opts_hash}"
+
+
+def _cache_path(cache_key: str) -> str:
+    return os.path.join(_CACHE_DIR, f"{cache_key}.txt")
+
+
+def load_cached_text(file_path: str, **options) -> str | None:
+    """캐시된 추출 텍스트를 반환한다. 없으면 None.
+
+    Args:
+        file_path: 원본 파일 경로
+        **options: 추출 옵션 (예: filter_superscript=True, use_layout=False)
+    """
+    cache_path = _cache_path(_make_cache_key(_file_hash(file_path), options))
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            text = f.read()
+    except FileNotFoundError:
+        return None
+    # 사용 시각 갱신 (LRU 기준)
+    try:
+        os.utime(cache_path)
+    except OSError:
+        pass
+    return text
+
+
+def save_cached_text(file_path: str, text: str, **options) -> None:
+    """추출 텍스트를 캐시에 저장하고 크기 제한을 적용한다."""
+    os.makedirs(_CACHE_DIR, exist_ok=True)
+    cache_path = _cache_path(_make_cache_key(_file_hash(file_path), options))
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(text)
+    # 동시 실행 시 반쯤 쓰인 파일을 읽지 않도록 원자적으로 교체
+    os.replace(tmp_path, cache_path)
+    _evict(TEXT_CACHE_MAX_BYTES)
+
+
+def cached_extract(file_path: str, extract_fn, **options) -> str:
+    """캐시에 있으면 캐시 텍스트를, 없으면 extract_fn()을 실행해 저장 후 반환한다."""
+    text = load_cached_text(file_path, **options)
+    if text is None:
+        text = extract_fn()
+        save_cached_text(file_path, text, **options)
+    return text
+
+
+def invalidate_text_cache(file_path: str | None = None) -> int:
+    """캐시 항목을 삭제한다.
+
+    Args:
+        file_path: 지정하면 해당 파일(현재 내용 기준)의 항목만 삭제, None이면 전체 삭제
+
+    Returns:
+        삭제한 항목 수
+    """
+    if file_path is None:
+        pattern = os.path.join(_CACHE_DIR, "*.txt")
+    else:
+        pattern = os.path.join(_CACHE_DIR, f"{_file_hash(file_path)[:32]}_*.txt")
+
+    removed = 0
+    for path in glob.glob(pattern):
+        try:
+            os.remove(path)
+            removed += 1
+        except OSError:
+            pass
+    return removed
+
+
+def _evict(max_bytes: int) -> None:
+    """캐시 총 크기가 max_bytes 이하가 될 때까지 오래된 항목부터 삭제한다."""
+    entries = []
+    total = 0
+    for path in glob.glob(os.path.join(_CACHE_DIR, "*.txt")):
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        entries.append((st.st_mtime, st.st_size, path))
+        total += st.st_size
+
+    if total <= max_bytes:
+        return
+
+    entries.sort()
+    for _, size, path in entries:
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+            total -= size
+        except OSError:
+            pass
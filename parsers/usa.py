@@ -1,9 +1,35 @@
 """미국 법령(Westlaw RTF) 파서."""
 
 import re
+from types import MappingProxyType
 from parsers.base import BaseParser, parse_rtf, _extract_article_title, _clean_english_article
 
 
+# ══════════════════════════════════════════════════════════════
+# 정규식 패턴 (import 시 한 번 컴파일, 읽기 전용)
+# ══════════════════════════════════════════════════════════════
+
+PATTERNS = MappingProxyType({
+    "credit_block": re.compile(r"(?m)^CREDIT\(S\).*?(?=^§\s*\d+|\Z)", re.DOTALL | re.MULTILINE),
+    "notes_of_decisions": re.compile(r"(?m)^Notes of Decisions\s*\(\d+\)\s*$"),
+    "end_of_document": re.compile(r"(?m)^End of Document\s*$"),
+    "copyright_line": re.compile(r"(?m)^©\s*20\d{2}\s+Thomson Reuters.*$"),
+    "currentness": re.compile(r"(?m)^Currentness\s*$"),
+    "effective_line": re.compile(r"(?m)^Effective:.*$"),
+    "keycite_line": re.compile(r"(?m)^KeyCite\s.*$"),
+    "usca_citation": re.compile(r"(?m)^\d+\s+U\.?S\.?C\.?A\.?\s+§\s*\d+.*$"),
+    "usca_citation_short": re.compile(r"(?m)^\d+\s+USCA\s+§\s*\d+.*$"),
+    "current_through": re.compile(r"(?m)^Current through P\.L\..*$"),
+    "refs_annos": re.compile(r"(?m)^Refs & Annos\s*$"),
+    "disposition_table": re.compile(r"(?m)^Disposition Table\s*$"),
+    "blank_lines": re.compile(r"\n{3,}"),
+    "paragraph": re.compile(r"(?:^|\n)\s*\(([a-hj-uw-z])\)\s+"),
+    "subparagraph": re.compile(r"(?:^|\n)\s*\((\d+)\)\s+"),
+    "clause": re.compile(r"(?:^|\n)\s*\(([A-Z])\)\s+"),
+    "subclause": re.compile(r"(?:^|\n)\s*\(([ivxlcdm]+)\)\s+"),
+})
+
+
 class UsaParser(BaseParser):
     """미국 법령 파서."""
 
@@ -43,22 +69,19 @@ class UsaParser(BaseParser):
 
 def _clean_us_westlaw_metadata(text: str) -> str:
     """Westlaw에서 다운로드한 미국법 RTF 텍스트에서 메타데이터를 제거한다."""
-    text = re.sub(
-        r"(?m)^CREDIT\(S\).*?(?=^§\s*\d+|\Z)",
-        "", text, flags=re.DOTALL | re.MULTILINE
-    )
-    text = re.sub(r"(?m)^Notes of Decisions\s*\(\d+\)\s*$", "", text)
-    text = re.sub(r"(?m)^End of Document\s*$", "", text)
-    text = re.sub(r"(?m)^©\s*20\d{2}\s+Thomson Reuters.*$", "", text)
-    text = re.sub(r"(?m)^Currentness\s*$", "", text)
-    text = re.sub(r"(?m)^Effective:.*$", "", text)
-    text = re.sub(r"(?m)^KeyCite\s.*$", "", text)
-    text = re.sub(r"(?m)^\d+\s+U\.?S\.?C\.?A\.?\s+§\s*\d+.*$", "", text)
-    text = re.sub(r"(?m)^\d+\s+USCA\s+§\s*\d+.*$", "", text)
-    text = re.sub(r"(?m)^Current through P\.L\..*$", "", text)
-    text = re.sub(r"(?m)^Refs & Annos\s*$", "", text)
-    text = re.sub(r"(?m)^Disposition Table\s*$", "", text)
-    text = re.sub(r"\n{3,}", "\n\n", text)
+    text = PATTERNS["credit_block"].sub("", text)
+    text = PATTERNS["notes_of_decisions"].sub("", text)
+    text = PATTERNS["end_of_document"].sub("", text)
+    text = PATTERNS["copyright_line"].sub("", text)
+    text = PATTERNS["currentness"].sub("", text)
+    text = PATTERNS["effective_line"].sub("", text)
+    text = PATTERNS["keycite_line"].sub("", text)
+    text = PATTERNS["usca_citation"].sub("", text)
+    text = PATTERNS["usca_citation_short"].sub("", text)
+    text = PATTERNS["current_through"].sub("", text)
+    text = PATTERNS["refs_annos"].sub("", text)
+    text = PATTERNS["disposition_table"].sub("", text)
+    text = PATTERNS["blank_lines"].sub("\n\n", text)
     return text
 
 
@@ -200,7 +223,7 @@ def _parse_paragraphs_us(text: str) -> list[dict]:
     results = []
 
     # 항(paragraph): (a), (b), (c) ... (i, v, x 제외 — 로마 숫자와 혼동 방지)
-    para_pattern = re.compile(r"(?:^|\n)\s*\(([a-hj-uw-z])\)\s+")
+    para_pattern = PATTERNS["paragraph"]
     paragraphs = list(para_pattern.finditer(text))
 
     if not paragraphs:
@@ -224,7 +247,7 @@ def _parse_paragraphs_us(text: str) -> list[dict]:
         para_text = text[start:end].strip()
 
         # 호(item): (1), (2), (3) ...
-        item_pattern = re.compile(r"(?:^|\n)\s*\((\d+)\)\s+")
+        item_pattern = PATTERNS["subparagraph"]
         items = list(item_pattern.finditer(para_text))
 
         if not items:
@@ -254,7 +277,7 @@ def _parse_paragraphs_us(text: str) -> list[dict]:
                 item_text = para_text[item_start:item_end].strip()
 
                 # 목(subitem): (A), (B), (C) ...
-                subitem_pattern = re.compile(r"(?:^|\n)\s*\(([A-Z])\)\s+")
+                subitem_pattern = PATTERNS["clause"]
                 subitems = list(subitem_pattern.finditer(item_text))
 
                 if not subitems:
@@ -273,7 +296,7 @@ def _parse_paragraphs_us(text: str) -> list[dict]:
                         subitem_text = item_text[subitem_start:subitem_end].strip()
 
                         # 세목(subsubitem): (i), (ii), (iii) ...
-                        subsubitem_pattern = re.compile(r"(?:^|\n)\s*\(([ivxlcdm]+)\)\s+")
+                        subsubitem_pattern = PATTERNS["subclause"]
                         subsubitems = list(subsubitem_pattern.finditer(subitem_text))
 
                         if not subsubitems:
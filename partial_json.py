@@ -0,0 +1,143 @@
+"""잘리거나 설명이 섞인 AI 응답에서 JSON을 최대한 복구한다.
+
+배치 번역·배치 매칭 응답이 출력 한도에 걸려 중간에 끊기거나 앞뒤에 설명 문장·```json 울타리가
+붙어도, 끝까지 완성된 항목만 골라 돌려준다. 호출하는 쪽은 빠진 항목만 다시 요청하면 된다.
+
+    >>> parse_partial_json('설명... {"a": "완성", "b": "잘린 번')
+    {'a': '완성'}
+    >>> parse_partial_json('{"matches": [{"id": 1}, {"id": 2}, {"id"')
+    {'matches': [{'id': 1}, {'id': 2}]}
+
+규칙:
+- 객체: 값까지 완성된 키만 넣는다. 값이 잘린 객체·배열이면 그 안에서 완성된 부분만 넣는다.
+- 배열: 완성된 원소만 넣는다 (잘린 마지막 원소는 버린다).
+- 닫는 따옴표가 없는 문자열, 텍스트 끝에 닿은 숫자·리터럴은 잘렸을 수 있으므로 버린다.
+"""
+
+import json
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = " \t\n\r"
+
+
+class _Truncated(Exception):
+    """텍스트 끝에 닿아 값을 완성하지 못함."""
+
+
+def _skip_ws(text: str, pos: int) -> int:
+    while pos < len(text) and text[pos] in _WHITESPACE:
+        pos += 1
+    return pos
+
+
+def _parse_value(text: str, pos: int):
+    """pos의 JSON 값을 읽는다. Returns: (값, 다음 위치, 완성 여부)."""
+    pos = _skip_ws(text, pos)
+    if pos >= len(text):
+        raise _Truncated
+    if text[pos] == "{":
+        return _parse_object(text, pos + 1)
+    if text[pos] == "[":
+        return _parse_array(text, pos + 1)
+    try:
+        value, end = _DECODER.raw_decode(text, pos)
+    except json.JSONDecodeError:
+        raise _Truncated from None
+    if end >= len(text) and not isinstance(value, str):
+        # 끝에 닿은 숫자·리터럴은 더 이어질 수 있음 ("0.9" → "0.95")
+        raise _Truncated
+    return value, end, True
+
+
+def _parse_object(text: str, pos: int):
+    result = {}
+    while True:
+        pos = _skip_ws(text, pos)
+        if pos >= len(text):
+            return result, pos, False
+        if text[pos] == "}":
+            return result, pos + 1, True
+        if text[pos] == ",":
+            pos += 1
+            continue
+        try:
+            key, pos = _DECODER.raw_decode(text, pos)
+        except json.JSONDecodeError:
+            return result, pos, False
+        if not isinstance(key, str):
+            return result, pos, False
+        pos = _skip_ws(text, pos)
+        if pos >= len(text) or text[pos] != ":":
+            return result, pos, False
+        try:
+            value, pos, complete = _parse_value(text, pos + 1)
+        except _Truncated:
+            return result, len(text), False
+        if complete or isinstance(value, (dict, list)):
+            result[key] = value
+        if not complete:
+            return result, pos, False
+
+
+def _parse_array(text: str, pos: int):
+    result = []
+    while True:
+        pos = _skip_ws(text, pos)
+        if pos >= len(text):
+            return result, pos, False
+        if text[pos] == "]":
+            return result, pos + 1, True
+        if text[pos] == ",":
+            pos += 1
+            continue
+        try:
+            value, pos, complete = _parse_value(text, pos)
+        except _Truncated:
+            return result, len(text), False
+        if not complete:
+            return result, pos, False
+        result.append(value)
+
+
+def _candidate_positions(text: str, start: str):
+    """JSON이 시작될 수 있는 위치: ```json 울타리 안을 먼저, 그다음 텍스트 앞부분."""
+    fence = text.find("```json")
+    ranges = [(fence + 7, len(text)), (0, fence)] if fence >= 0 else [(0, len(text))]
+    for lo, hi in ranges:
+        pos = text.find(start, lo, hi)
+        while pos >= 0:
+            yield pos
+            pos = text.find(start, pos + 1, hi)
+
+
+def parse_partial_json(text: str, start: str = "{"):
+    """text에서 JSON 객체(start="{") 또는 배열("[")을 관대하게 읽는다.
+
+    설명 문장 속 괄호("{id: 번역문}")에 걸리지 않도록 각 괄호 위치에서 차례로 읽어 보고,
+    비어 있지 않은 첫 결과를 돌려준다.
+
+        >>> parse_partial_json('형식: {id: 번역문}\\n```json\\n{"translations": []}\\n```')
+        {'translations': []}
+
+    Returns:
+        완성된 부분만 담은 dict/list. 해당 괄호가 없으면 None, 모두 비어 있으면 빈 dict/list.
+    """
+    if not text:
+        return None
+    first = None
+    for pos in _candidate_positions(text, start):
+        value, _, _ = _parse_value(text, pos)
+        if value:
+            return value
+        if first is None:
+            first = value
+    return first
+
+
+def is_complete_json(text: str) -> bool:
+    """text 전체가 완성된 JSON인지 (응답 캐시 저장 여부 판단용)."""
+    try:
+        json.loads(text)
+    except (TypeError, ValueError):
+        return False
+    return True
@@ -0,0 +1,244 @@
+"""API 호출 속도 제한 (토큰 버킷).
+
+고정 time.sleep 대신 초당 rate개씩 토큰이 채워지는 버킷에서 호출마다 토큰을 하나씩 꺼낸다.
+버킷 용량(capacity)만큼은 대기 없이 바로 호출할 수 있어서, 동시 실행하는 배치의 첫 묶음은
+즉시 시작하고 이후 호출은 평균 rate 이하로 유지된다.
+
+여러 스레드(병렬 배치, Streamlit 세션)에서 같은 버킷 인스턴스를 공유해도 안전하다.
+
+AdaptiveRateLimiter는 제공자(Gemini, Claude)별 버킷으로, 성공하면 속도를 올리고
+429/ResourceExhausted를 받으면 속도를 줄인 뒤 Retry-After(또는 지수 백오프 + 지터)만큼 멈춘다.
+"""
+
+import asyncio
+import random
+import re
+import threading
+import time
+
+
+class TokenBucket:
+    """스레드 안전 토큰 버킷.
+
+    Args:
+        rate: 초당 채워지는 토큰 수 (평균 허용 호출 수/초)
+        capacity: 최대 누적 토큰 수 (대기 없이 연속 호출할 수 있는 수)
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        if rate <= 0 or capacity <= 0:
+            raise ValueError("rate와 capacity는 0보다 커야 합니다.")
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        if now < self._updated:
+            return
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_acquire(self, tokens: float = 1.0) -> float:
+        """토큰을 꺼내 본다. 성공하면 0, 부족하면 기다려야 할 초를 반환한다."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return 0.0
+            return (tokens - self._tokens) / self.rate
+
+    def acquire(self, tokens: float = 1.0, cancel_event=None) -> bool:
+        """토큰을 꺼낼 수 있을 때까지 기다린다.
+
+        Args:
+            tokens: 꺼낼 토큰 수
+            cancel_event: set되면 기다리지 않고 False 반환 (threading.Event)
+
+        Returns:
+            토큰을 꺼냈으면 True, 취소되었으면 False
+        """
+        while True:
+            wait = self.try_acquire(tokens)
+            if wait <= 0:
+                return True
+            if cancel_event is not None:
+                if cancel_event.wait(wait):
+                    return False
+            else:
+                time.sleep(wait)
+
+    def set_rate(self, rate: float) -> None:
+        """채워지는 속도를 바꾼다 (지금까지 쌓인 토큰은 유지)."""
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = rate
+
+    async def acquire_async(self, tokens: float = 1.0) -> None:
+        """acquire의 asyncio 버전 (기다리는 동안 이벤트 루프를 막지 않는다)."""
+        while True:
+            wait = self.try_acquire(tokens)
+            if wait <= 0:
+                return
+            await asyncio.sleep(wait)
+
+
+# ══════════════════════════════════════════════════════════════
+# 제공자별 적응형 속도 제한
+# ══════════════════════════════════════════════════════════════
+
+class AdaptiveRateLimiter(TokenBucket):
+    """429/ResourceExhausted 응답에 맞춰 속도를 조절하는 토큰 버킷.
+
+    성공할 때마다 rate를 increase씩 올리고(max_rate까지), 속도 제한 응답을 받으면
+    rate를 decrease배로 줄이고(min_rate까지) Retry-After(없으면 지수 백오프) 동안
+    모든 호출을 멈춘다. 고정 대기 없이 제공자의 실제 한도 근처에서 호출하게 된다.
+
+    Args:
+        rate: 시작 속도 (호출/초)
+        capacity: 대기 없이 연속 호출할 수 있는 수
+        min_rate, max_rate: 속도 범위
+        increase: 성공 1회당 올리는 속도 (호출/초)
+        decrease: 속도 제한 응답 시 곱하는 비율
+        backoff_base, backoff_max: 재시도 대기 (base·2^시도, 최대 backoff_max초, 지터 포함)
+    """
+
+    def __init__(self, rate: float, capacity: float, min_rate: float, max_rate: float,
+                 increase: float = 0.05, decrease: float = 0.5,
+                 backoff_base: float = 1.0, backoff_max: float = 60.0):
+        super().__init__(rate, capacity)
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.decrease = decrease
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self._paused_until = 0.0
+
+    def try_acquire(self, tokens: float = 1.0) -> float:
+        pause = self._paused_until - time.monotonic()
+        if pause > 0:
+            return pause
+        return super().try_acquire(tokens)
+
+    def on_success(self) -> None:
+        """호출 성공: 속도를 조금 올린다."""
+        if self.rate < self.max_rate:
+            self.set_rate(min(self.max_rate, self.rate + self.increase))
+
+    def on_rate_limited(self, attempt: int = 0, retry_after: float | None = None) -> float:
+        """속도 제한 응답: 속도를 줄이고 모든 호출을 잠시 멈춘다.
+
+        Returns:
+            이번 재시도 전 기다릴 초 (backoff_delay)
+        """
+        self.set_rate(max(self.min_rate, self.rate * self.decrease))
+        delay = self.backoff_delay(attempt, retry_after)
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + delay)
+            # 멈춤이 끝나면 재시도 1회는 바로, 나머지는 줄어든 속도로 (채우기는 멈춤이 끝난 뒤부터)
+            self._tokens = 1.0
+            self._updated = self._paused_until
+        return delay
+
+    def on_error(self, error: Exception, attempt: int = 0) -> float:
+        """실패한 호출의 재시도 대기 시간을 반환한다.
+
+        속도 제한 오류(429/ResourceExhausted)이면 on_rate_limited로 속도를 줄이고 Retry-After를 따른다.
+        그 밖의 오류는 지수 백오프 + 지터만 적용한다.
+        """
+        if is_rate_limit_error(error):
+            return self.on_rate_limited(attempt, retry_after_seconds(error))
+        return self.backoff_delay(attempt)
+
+    def backoff_delay(self, attempt: int, retry_after: float | None = None) -> float:
+        """재시도 전 대기 시간. Retry-After가 있으면 그 값, 없으면 지수 백오프 + 지터."""
+        if retry_after is not None and retry_after >= 0:
+            return min(retry_after, self.backoff_max) + random.uniform(0, 0.5)
+        delay = min(self.backoff_max, self.backoff_base * (2 ** attempt))
+        return random.uniform(delay / 2, delay)
+
+
+# 제공자별 기본 한도 (시작 속도, 버킷 용량, 최소·최대 속도)
+PROVIDER_LIMITS = {
+    "gemini": {"rate": 2.0, "capacity": 8, "min_rate": 0.1, "max_rate": 30.0},
+    "claude": {"rate": 1.0, "capacity": 5, "min_rate": 0.1, "max_rate": 15.0},
+}
+
+_limiters: dict[str, AdaptiveRateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_limiter(provider: str) -> AdaptiveRateLimiter:
+    """제공자별 속도 제한기 (프로세스 전체에서 하나, 번역·매칭 호출이 함께 사용)."""
+    with _limiters_lock:
+        limiter = _limiters.get(provider)
+        if limiter is None:
+            limiter = AdaptiveRateLimiter(**PROVIDER_LIMITS.get(provider, PROVIDER_LIMITS["claude"]))
+            _limiters[provider] = limiter
+        return limiter
+
+
+_RATE_LIMIT_STATUS = re.compile(r"\b(?:error code|status(?: code)?)\s*[:=]?\s*429\b", re.IGNORECASE)
+
+
+def is_rate_limit_error(exc: Exception) -> bool:
+    """429 / RateLimitError / ResourceExhausted 계열 예외인지 판별한다."""
+    name = type(exc).__name__
+    if "RateLimit" in name or "ResourceExhausted" in name or "TooManyRequests" in name:
+        return True
+    for attr in ("status_code", "code"):
+        if getattr(exc, attr, None) == 429:
+            return True
+    # 상태 코드 속성이 없는 래핑된 예외: "Error code: 429" 형태만 인정 (토큰 수 등 숫자 속 429는 무시)
+    return _RATE_LIMIT_STATUS.search(str(exc)) is not None
+
+
+# 재시도하면 성공할 수 있는 일시적 오류 (연결 끊김, 시간 초과, 서버 과부하)
+_TRANSIENT_ERROR_NAMES = (
+    "Connection", "Timeout", "Overloaded", "InternalServer", "ServiceUnavailable",
+    "DeadlineExceeded",
+)
+
+
+def is_transient_error(exc: Exception) -> bool:
+    """재시도할 만한 오류인지 판별한다: 속도 제한, 408/409, 5xx(529 과부하 포함), 연결·시간 초과."""
+    if is_rate_limit_error(exc):
+        return True
+    name = type(exc).__name__
+    if any(part in name for part in _TRANSIENT_ERROR_NAMES):
+        return True
+    status = getattr(exc, "status_code", None)
+    return isinstance(status, int) and (status in (408, 409) or status >= 500)
+
+
+def retry_after_seconds(exc: Exception) -> float | None:
+    """예외에서 서버가 알려 준 재시도 대기 시간(초)을 찾는다. 없으면 None.
+
+    - Anthropic: 응답 헤더 retry-after-ms / retry-after
+    - Gemini: 오류 메시지의 "retry in 27.5s" 또는 retry_delay { seconds: 27 }
+    """
+    response = getattr(exc, "response", None)
+    headers = getattr(response, "headers", None)
+    if headers is not None:
+        for header, scale in (("retry-after-ms", 0.001), ("retry-after", 1.0)):
+            value = headers.get(header)
+            if value is None:
+                continue
+            try:
+                return float(value) * scale
+            except (TypeError, ValueError):
+                continue
+
+    message = str(exc)
+    match = re.search(r"retry in ([\d.]+)\s*s", message, re.IGNORECASE)
+    if match is None:
+        match = re.search(r"retry_delay\s*\{\s*seconds:\s*(\d+)", message)
+    if match is not None:
+        try:
+            return float(match.group(1))
+        except ValueError:
+            return None
+    return None
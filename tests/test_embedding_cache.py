@@ -0,0 +1,52 @@
+"""embedding_cache.ArticleEmbeddingStore: 키·임베딩 저장 왕복."""
+
+import hashlib
+import os
+
+import numpy as np
+
+from embedding_cache import ArticleEmbeddingStore, article_embedding_key
+
+
+def _digest_ending_in_nul() -> bytes:
+    i = 0
+    while True:
+        key = hashlib.sha256(str(i).encode()).digest()
+        if key.endswith(b"\0"):
+            return key
+        i += 1
+
+
+def test_round_trip_keeps_trailing_nul(tmp_path):
+    keys = [_digest_ending_in_nul(), article_embedding_key("passage: 제1조", "m"), b"\0" * 32]
+    embeddings = np.arange(9, dtype=np.float32).reshape(3, 3)
+    ArticleEmbeddingStore(str(tmp_path)).add(keys, embeddings)
+
+    # 새 인스턴스는 디스크의 샤드에서 다시 읽는다
+    store = ArticleEmbeddingStore(str(tmp_path))
+    found = store.lookup(keys)
+    assert len(store) == 3
+    for i, key in enumerate(keys):
+        np.testing.assert_array_equal(found[key], embeddings[i])
+
+    # 이미 있는 키는 다시 쓰지 않는다
+    store.add(keys, embeddings)
+    assert len([n for n in os.listdir(tmp_path) if n.endswith(".keys.npy")]) == 1
+
+
+def test_compact_keeps_trailing_nul(tmp_path):
+    store = ArticleEmbeddingStore(str(tmp_path), max_shards=2)
+    keys = [_digest_ending_in_nul()] + [hashlib.sha256(bytes([i])).digest() for i in range(3)]
+    for i, key in enumerate(keys):
+        store.add([key], np.full((1, 2), i, dtype=np.float32))
+
+    reloaded = ArticleEmbeddingStore(str(tmp_path))
+    found = reloaded.lookup(keys)
+    assert [float(found[key][0]) for key in keys] == [0.0, 1.0, 2.0, 3.0]
+
+
+def test_reads_legacy_string_keys(tmp_path):
+    key = _digest_ending_in_nul()
+    np.save(tmp_path / "old.emb.npy", np.ones((1, 2), dtype=np.float32))
+    np.save(tmp_path / "old.keys.npy", np.array([key], dtype="S32"))
+    assert key in ArticleEmbeddingStore(str(tmp_path)).lookup([key])
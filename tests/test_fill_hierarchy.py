@@ -0,0 +1,99 @@
+"""parsers._fill_missing_hierarchy: 예전 행 단위 df.loc 루프와 같은 결과인지 확인."""
+
+import random
+
+import pandas as pd
+import pytest
+
+from parsers import _fill_missing_hierarchy, _fill_missing_hierarchy_stream
+
+
+def _reference_fill(df: pd.DataFrame, window: int = 5) -> pd.DataFrame:
+    """열 단위 처리 이전의 행 단위 루프 (window=5가 원래 동작)."""
+    df = df.copy()
+    for idx in df.index:
+        row = df.loc[idx]
+        # 전문이나 삭제 조문은 건너뛰기
+        if row['조문번호'] == '전문' or '삭제' in str(row['조문번호']):
+            continue
+
+        # 편 정보가 없는 경우
+        if pd.isna(row['편']) or row['편'] == '':
+            # 이전/다음 조문에서 찾기
+            found = False
+            # 먼저 다음 조문 확인 (같은 Part일 가능성 높음)
+            for next_idx in range(idx + 1, min(idx + window, len(df))):
+                next_row = df.loc[next_idx]
+                if next_row['편'] and next_row['편'] != '':
+                    df.loc[idx, '편'] = next_row['편']
+                    df.loc[idx, '장'] = next_row['장']
+                    found = True
+                    break
+
+            # 다음 조문에서 못 찾으면 이전 조문 확인
+            if not found:
+                for prev_idx in range(idx - 1, max(idx - window, -1), -1):
+                    prev_row = df.loc[prev_idx]
+                    if prev_row['편'] and prev_row['편'] != '':
+                        df.loc[idx, '편'] = prev_row['편']
+                        df.loc[idx, '장'] = prev_row['장']
+                        break
+    return df
+
+
+def _random_frame(rng: random.Random) -> pd.DataFrame:
+    n = rng.randint(0, 40)
+    empty_rate = rng.choice([0.1, 0.5, 0.8, 0.95])
+    skip_rate = rng.choice([0.0, 0.1, 0.3])
+    rows = []
+    for i in range(n):
+        r = rng.random()
+        if r < skip_rate / 2:
+            article_id = '전문'
+        elif r < skip_rate:
+            article_id = f'제{i}조(삭제)'
+        else:
+            article_id = str(i + 1)
+        if rng.random() < empty_rate:
+            part, chapter = '', rng.choice(['', '제9장'])
+        else:
+            part, chapter = f'제{rng.randint(1, 3)}편', f'제{rng.randint(1, 5)}장'
+        rows.append({'편': part, '장': chapter, '조문번호': article_id, '원문': f'text{i}'})
+    return pd.DataFrame(rows, columns=['편', '장', '조문번호', '원문'])
+
+
+@pytest.mark.parametrize("window", [1, 2, 3, 4, 5])
+def test_matches_row_loop(window):
+    rng = random.Random(window)
+    for _ in range(120):
+        df = _random_frame(rng)
+        expected = _reference_fill(df, window)
+        actual = _fill_missing_hierarchy(df, window)
+        pd.testing.assert_frame_equal(actual, expected)
+
+
+@pytest.mark.parametrize("window", [1, 2, 3, 4, 5])
+def test_stream_matches_frame(window):
+    rng = random.Random(100 + window)
+    for _ in range(300):
+        df = _random_frame(rng)
+        rows = df.to_dict("records")
+        streamed = pd.DataFrame(list(_fill_missing_hierarchy_stream(rows, window)), columns=df.columns)
+        pd.testing.assert_frame_equal(streamed, _fill_missing_hierarchy(df, window))
+
+
+def test_does_not_modify_input():
+    df = pd.DataFrame({'편': ['', '제1편'], '장': ['', '제1장'], '조문번호': ['1', '2']})
+    filled = _fill_missing_hierarchy(df)
+    assert list(df['편']) == ['', '제1편']
+    assert list(filled['편']) == ['제1편', '제1편']
+
+
+def test_skips_preamble_and_deleted():
+    df = pd.DataFrame({
+        '편': ['', '제1편', '', ''],
+        '장': ['', '제1장', '', ''],
+        '조문번호': ['전문', '1', '제2조(삭제)', '3'],
+    })
+    filled = _fill_missing_hierarchy(df)
+    assert list(filled['편']) == ['', '제1편', '', '제1편']
@@ -0,0 +1,113 @@
+"""parsers.hierarchy_index.HierarchyIndex: 예전 선형 탐색과 같은 결과인지 확인."""
+
+import random
+
+import pytest
+
+from parsers.hierarchy_index import HierarchyIndex
+
+
+def _linear_part_chapter(hierarchy: list[dict], position: int) -> tuple[str, str]:
+    """html_parser._find_hierarchy_at_position의 예전 선형 탐색."""
+    current_part = ""
+    current_chapter = ""
+
+    for h in hierarchy:
+        if h['start_pos'] > position:
+            break
+        if h['type'] == 'part':
+            current_part = h['title']
+            current_chapter = ""  # 새 Part에서 Chapter 초기화
+        elif h['type'] == 'chapter':
+            current_chapter = h['title']
+
+    return current_part, current_chapter
+
+
+def _linear_chapter(hierarchy: list[dict], position: int) -> str:
+    """html_parser._find_china_chapter_at_position의 예전 선형 탐색."""
+    current_chapter = ""
+
+    for h in hierarchy:
+        if h['start_pos'] > position:
+            break
+        if h['type'] == 'chapter':
+            current_chapter = h['title']
+
+    return current_chapter
+
+
+def _linear_three_levels(hierarchy: list[dict], position: int) -> tuple[str, str, str]:
+    """상위 레벨이 나오면 하위 레벨을 모두 초기화하는 3단계 선형 탐색."""
+    levels = ("part", "chapter", "section")
+    current = dict.fromkeys(levels, "")
+    for h in hierarchy:
+        if h['start_pos'] > position:
+            break
+        depth = levels.index(h['type'])
+        current[h['type']] = h['title']
+        for lower in levels[depth + 1:]:
+            current[lower] = ""
+    return tuple(current[level] for level in levels)
+
+
+def _random_hierarchy(rng: random.Random, types: tuple[str, ...]) -> list[dict]:
+    """start_pos 순서로 정렬된 계층 목록 (같은 위치에서 시작하는 항목 포함)."""
+    positions = sorted(rng.choices(range(200), k=rng.randint(0, 25)))
+    return [
+        {'type': rng.choice(types), 'title': f'{i}', 'start_pos': pos}
+        for i, pos in enumerate(positions)
+    ]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_part_chapter_matches_linear_scan(seed):
+    rng = random.Random(seed)
+    for _ in range(200):
+        hierarchy = _random_hierarchy(rng, ("part", "chapter"))
+        index = HierarchyIndex(hierarchy)
+        for position in range(-1, 202):
+            part, chapter, section = index.lookup(position)
+            assert (part, chapter) == _linear_part_chapter(hierarchy, position)
+            assert section == ""
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_chapter_only_matches_linear_scan(seed):
+    rng = random.Random(100 + seed)
+    for _ in range(200):
+        hierarchy = _random_hierarchy(rng, ("chapter",))
+        index = HierarchyIndex(hierarchy)
+        for position in range(-1, 202):
+            assert index.at(position)['chapter'] == _linear_chapter(hierarchy, position)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_three_levels_reset_lower_levels(seed):
+    rng = random.Random(200 + seed)
+    for _ in range(200):
+        hierarchy = _random_hierarchy(rng, ("part", "chapter", "section"))
+        index = HierarchyIndex(hierarchy)
+        for position in range(-1, 202):
+            assert index.lookup(position) == _linear_three_levels(hierarchy, position)
+
+
+def test_unsorted_input_and_unknown_types():
+    hierarchy = [
+        {'type': 'chapter', 'title': 'CH 2', 'start_pos': 50},
+        {'type': 'part', 'title': 'PART I', 'start_pos': 0},
+        {'type': 'annex', 'title': 'ANNEX', 'start_pos': 60},
+        {'type': 'chapter', 'title': 'CH 1', 'start_pos': 10},
+        {'type': 'part', 'title': 'PART II', 'start_pos': 70},
+    ]
+    index = HierarchyIndex(hierarchy)
+    assert index.lookup(5) == ("PART I", "", "")
+    assert index.lookup(55) == ("PART I", "CH 2", "")
+    assert index.lookup(65) == ("PART I", "CH 2", "")
+    assert index.lookup(70) == ("PART II", "", "")
+
+
+def test_default_level_for_untyped_items():
+    hierarchy = [{'title': '第一章', 'start_pos': 0}, {'title': '第二章', 'start_pos': 30}]
+    index = HierarchyIndex(hierarchy, levels=("title",))
+    assert [index.lookup(p)[0] for p in (-1, 0, 29, 30)] == ["", "第一章", "第一章", "第二章"]
@@ -0,0 +1,65 @@
+"""partial_json: 잘리거나 설명이 섞인 배치 응답 복구."""
+
+import doctest
+import json
+
+import partial_json
+from partial_json import is_complete_json, parse_partial_json
+
+PAYLOAD = {"translations": [
+    {"id": "제1조", "translation": "번역1"},
+    {"id": "제2조", "translation": "번역2"},
+]}
+
+
+def test_doctests():
+    assert doctest.testmod(partial_json).failed == 0
+
+
+def test_complete_json():
+    text = json.dumps(PAYLOAD, ensure_ascii=False)
+    assert parse_partial_json(text) == PAYLOAD
+    assert is_complete_json(text)
+
+
+def test_brace_in_prose_before_fence():
+    text = ("Sure. Format used: {id: translation}\n```json\n"
+            + json.dumps(PAYLOAD, ensure_ascii=False) + "\n```")
+    assert parse_partial_json(text) == PAYLOAD
+
+
+def test_brace_in_prose_without_fence():
+    text = "형식은 {조문ID: 번역문} 입니다. " + json.dumps(PAYLOAD, ensure_ascii=False) + " 끝."
+    assert parse_partial_json(text) == PAYLOAD
+
+
+def test_truncated_inside_string_drops_entry():
+    text = json.dumps(PAYLOAD, ensure_ascii=False)
+    cut = text[:text.index("번역2") + 2]
+    assert parse_partial_json(cut) == {"translations": [PAYLOAD["translations"][0]]}
+    assert not is_complete_json(cut)
+
+
+def test_truncated_between_entries():
+    text = json.dumps(PAYLOAD, ensure_ascii=False)
+    cut = text[:text.index('{"id": "제2조"') + 3]
+    assert parse_partial_json(cut) == {"translations": [PAYLOAD["translations"][0]]}
+
+
+def test_truncated_number_is_dropped():
+    assert parse_partial_json('{"matches": [{"foreign_id": "1", "score": 0.9') == {"matches": []}
+    assert parse_partial_json('{"a": "x", "score": 0.9') == {"a": "x"}
+
+
+def test_truncated_legacy_dict():
+    assert parse_partial_json('설명... {"a": "완성", "b": "잘린 번') == {"a": "완성"}
+
+
+def test_no_json():
+    assert parse_partial_json("") is None
+    assert parse_partial_json("JSON 없음") is None
+    assert parse_partial_json("{}") == {}
+
+
+def test_array_start():
+    assert parse_partial_json('결과: [1, 2, {"a": 3}, 4', start="[") == [1, 2, {"a": 3}]
@@ -0,0 +1,60 @@
+"""rate_limit: 오류 분류와 적응형 제한기."""
+
+import pytest
+
+from rate_limit import AdaptiveRateLimiter, is_rate_limit_error, is_transient_error
+
+
+def _error(name: str, message: str = "", status_code=None) -> Exception:
+    exc = type(name, (Exception,), {})(message)
+    if status_code is not None:
+        exc.status_code = status_code
+    return exc
+
+
+@pytest.mark.parametrize("exc", [
+    _error("RateLimitError", status_code=429),
+    _error("ResourceExhausted", "quota"),
+    _error("APIStatusError", "Error code: 429 - rate limited"),
+])
+def test_rate_limit_errors(exc):
+    assert is_rate_limit_error(exc)
+    assert is_transient_error(exc)
+
+
+def test_429_inside_other_numbers_is_not_rate_limit():
+    exc = _error("BadRequestError", "prompt is too long: 204290 tokens > 200000", 400)
+    assert not is_rate_limit_error(exc)
+    assert not is_transient_error(exc)
+
+
+@pytest.mark.parametrize("exc", [
+    _error("OverloadedError", status_code=529),
+    _error("InternalServerError", status_code=500),
+    _error("APIStatusError", status_code=503),
+    _error("APIConnectionError", "connection reset"),
+    _error("APITimeoutError"),
+    _error("DeadlineExceeded"),
+])
+def test_transient_errors(exc):
+    assert not is_rate_limit_error(exc)
+    assert is_transient_error(exc)
+
+
+@pytest.mark.parametrize("exc", [
+    _error("AuthenticationError", status_code=401),
+    _error("ValueError", "bad input"),
+])
+def test_permanent_errors(exc):
+    assert not is_transient_error(exc)
+
+
+def test_rate_limited_slows_down_and_pauses():
+    limiter = AdaptiveRateLimiter(rate=2.0, capacity=2, min_rate=0.5, max_rate=4.0)
+    delay = limiter.on_error(_error("RateLimitError", status_code=429))
+    assert limiter.rate == 1.0
+    assert delay > 0 and limiter.try_acquire() > 0
+
+    other = AdaptiveRateLimiter(rate=2.0, capacity=2, min_rate=0.5, max_rate=4.0)
+    other.on_error(_error("OverloadedError", status_code=529))
+    assert other.rate == 2.0
@@ -0,0 +1,35 @@
+"""parsers.text_cache: 추출 텍스트 캐시 키와 무효화."""
+
+import parsers
+from parsers import text_cache
+
+
+def test_extractor_version_bump_invalidates(tmp_path, monkeypatch):
+    monkeypatch.setattr(text_cache, "_CACHE_DIR", str(tmp_path / "cache"))
+    source = tmp_path / "law.rtf"
+    source.write_text("{\\rtf1 Article 1}", encoding="utf-8")
+    calls = []
+
+    def extract():
+        calls.append(1)
+        return f"text v{len(calls)}"
+
+    options = {"format": "rtf", "extractor_version": 1}
+    assert text_cache.cached_extract(str(source), extract, **options) == "text v1"
+    assert text_cache.cached_extract(str(source), extract, **options) == "text v1"
+
+    options["extractor_version"] = 2
+    assert text_cache.cached_extract(str(source), extract, **options) == "text v2"
+    assert len(calls) == 2
+
+
+def test_load_text_uses_current_extractor_version(tmp_path, monkeypatch):
+    monkeypatch.setattr(text_cache, "_CACHE_DIR", str(tmp_path / "cache"))
+    source = tmp_path / "law.rtf"
+    source.write_text("{\\rtf1 Article 1}", encoding="utf-8")
+    # 이전 버전으로 저장된 텍스트는 쓰지 않는다
+    stale = {"format": "rtf", "extractor_version": parsers.TEXT_EXTRACTOR_VERSION - 1}
+    text_cache.save_cached_text(str(source), "stale text", **stale)
+    monkeypatch.setattr(parsers, "parse_rtf", lambda path: "fresh text")
+    assert parsers._load_text(str(source)) == "fresh text"
+    assert parsers._load_text(str(source)) == "fresh text"
@@ -0,0 +1,59 @@
+"""vector_index: 검색 결과와 저장·불러오기."""
+
+import os
+
+import numpy as np
+import pytest
+
+from vector_index import BruteForceIndex, IVFIndex, VectorIndex, load_vector_index
+
+
+def _corpus(rows: int = 2000, dim: int = 16, seed: int = 0) -> np.ndarray:
+    matrix = np.random.default_rng(seed).standard_normal((rows, dim)).astype(np.float32)
+    return matrix / np.linalg.norm(matrix, axis=1, keepdims=True)
+
+
+def test_base_class_is_abstract():
+    with pytest.raises(TypeError):
+        VectorIndex(_corpus(10))
+
+
+def test_ivf_with_all_probes_matches_brute_force():
+    corpus = _corpus()
+    brute, _ = BruteForceIndex(corpus).search(corpus[:50], 5)
+    ivf = IVFIndex(corpus, nlist=32)
+    found, _ = ivf.search(corpus[:50], 5, nprobe=ivf.nlist)
+    np.testing.assert_array_equal(found, brute)
+
+
+@pytest.mark.parametrize("index_cls", [BruteForceIndex, IVFIndex])
+def test_save_and_load(tmp_path, index_cls):
+    corpus = _corpus()
+    index = index_cls(corpus)
+    directory = str(tmp_path / "vector_index")
+    index.save(directory)
+
+    loaded = load_vector_index(directory, corpus)
+    assert type(loaded) is index_cls
+    np.testing.assert_array_equal(loaded.search(corpus[:20], 5)[0], index.search(corpus[:20], 5)[0])
+    assert os.listdir(tmp_path) == ["vector_index"]
+
+
+def test_overwrite_keeps_open_mmap_readable(tmp_path):
+    corpus = _corpus()
+    directory = str(tmp_path / "vector_index")
+    IVFIndex(corpus, nlist=32, seed=0).save(directory)
+    opened = load_vector_index(directory, corpus)
+    expected = np.array(opened.vectors)
+
+    # 다시 저장해도 먼저 연 mmap 파일은 잘리지 않는다
+    IVFIndex(corpus, nlist=16, seed=1).save(directory)
+    np.testing.assert_array_equal(np.array(opened.vectors), expected)
+    assert load_vector_index(directory, corpus).nlist == 16
+    assert os.listdir(tmp_path) == ["vector_index"]
+
+
+def test_load_rejects_row_mismatch(tmp_path):
+    directory = str(tmp_path / "vector_index")
+    BruteForceIndex(_corpus(100)).save(directory)
+    assert load_vector_index(directory, _corpus(99)) is None
@@ -1,5 +1,8 @@
+import asyncio
+import concurrent.futures
+import queue
 import re
-import time
+import threading
 import os
 import warnings
 import streamlit as st
@@ -12,6 +15,10 @@ warnings.filterwarnings('ignore', category=FutureWarning)
 import google.generativeai as genai
 import anthropic
 
+from llm_cache import load_cached_response, make_cache_key, save_cached_response
+from partial_json import is_complete_json, parse_partial_json
+from rate_limit import get_limiter, is_rate_limit_error
+
 
 # AI 사고 과정 누출 패턴
 _THINKING_MARKERS = [
@@ -215,25 +222,178 @@ def _get_diff_prompt() -> str:
 
 MAX_RETRIES = 3
 
+GEMINI_MODEL = "gemini-2.5-flash"
+CLAUDE_MODEL = "claude-sonnet-4-5-20250929"
+CLAUDE_MAX_TOKENS = 8192
 
-def _call_gemini_with_retry(text: str, system_prompt: str) -> str:
-    """Gemini API를 재시도 포함하여 호출한다."""
-    api_key = st.secrets.get("GOOGLE_API_KEY", "")
-    if not api_key or api_key == "your-key-here":
-        return ""
+# 제공자별 동시 요청 수 (API 할당량에 맞춰 환경 변수 또는 set_concurrency_limits로 조정)
+GEMINI_MAX_CONCURRENCY = int(os.environ.get("GEMINI_MAX_CONCURRENCY", 8))
+CLAUDE_MAX_CONCURRENCY = int(os.environ.get("CLAUDE_MAX_CONCURRENCY", 5))
 
-    genai.configure(api_key=api_key)
-    model = genai.GenerativeModel(
-        "gemini-2.5-flash",
-        system_instruction=system_prompt,
-    )
+# 조문 그룹 번역 시 요청 하나의 최대 시간 (초, 동시 요청 대기 시간 제외)
+_CALL_TIMEOUT = 120
+
+
+class _TranslationEngine:
+    """번역 API 호출용 asyncio 이벤트 루프 (백그라운드 스레드 하나, 프로세스 전체 공유).
+
+    비동기 클라이언트(AsyncAnthropic, Gemini GenerativeModel)를 루프 안에서 한 번만 만들어
+    연결을 재사용하고, 제공자별 세마포어로 동시 요청 수를 제한한다.
+    Streamlit 재실행·세션이 바뀌어도 모듈과 함께 유지된다.
+    """
+
+    def __init__(self):
+        self._loop = None
+        self._lock = threading.Lock()
+        self._claude_clients = {}
+        self._gemini_models = {}
+        self._gemini_key = None
+        self._limits = {"gemini": GEMINI_MAX_CONCURRENCY, "claude": CLAUDE_MAX_CONCURRENCY}
+        self._semaphores = {}
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever, name="translation-engine", daemon=True
+                ).start()
+                self._loop = loop
+            return self._loop
+
+    def submit(self, coro) -> concurrent.futures.Future:
+        """코루틴을 엔진 루프에서 실행하고 concurrent.futures.Future를 반환한다."""
+        return asyncio.run_coroutine_threadsafe(coro, self._ensure_loop())
+
+    def run(self, coro):
+        """코루틴을 엔진 루프에서 실행하고 결과를 기다린다 (동기 호출용)."""
+        return self.submit(coro).result()
+
+    def set_limits(self, gemini: int | None = None, claude: int | None = None) -> None:
+        for provider, limit in (("gemini", gemini), ("claude", claude)):
+            if limit is not None:
+                self._limits[provider] = max(1, int(limit))
+                # 새 한도는 새 세마포어로 (진행 중인 요청은 이전 세마포어로 끝남)
+                self._semaphores.pop(provider, None)
+
+    def semaphore(self, provider: str) -> asyncio.Semaphore:
+        """제공자별 동시 요청 세마포어 (엔진 루프 안에서만 호출)."""
+        semaphore = self._semaphores.get(provider)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self._limits[provider])
+            self._semaphores[provider] = semaphore
+        return semaphore
+
+    def claude_client(self, api_key: str):
+        # SDK 자체 재시도는 끄고 429 재시도·대기는 rate_limit 제한기가 맡는다
+        client = self._claude_clients.get(api_key)
+        if client is None:
+            client = anthropic.AsyncAnthropic(api_key=api_key, max_retries=0)
+            self._claude_clients[api_key] = client
+        return client
+
+    def gemini_model(self, api_key: str, system_prompt: str):
+        if api_key != self._gemini_key:
+            genai.configure(api_key=api_key)
+            self._gemini_key = api_key
+            self._gemini_models.clear()
+        model = self._gemini_models.get(system_prompt)
+        if model is None:
+            model = genai.GenerativeModel(GEMINI_MODEL, system_instruction=system_prompt)
+            self._gemini_models[system_prompt] = model
+        return model
+
+
+_engine = _TranslationEngine()
+
+
+def set_concurrency_limits(gemini: int | None = None, claude: int | None = None) -> None:
+    """제공자별 동시 요청 수를 바꾼다 (None이면 그대로)."""
+    _engine.set_limits(gemini=gemini, claude=claude)
+
+
+def _iter_engine_results(start, total: int, progress_callback=None, cancel_event=None):
+    """코루틴을 엔진에서 실행하면서 완료 항목을 호출한 스레드에서 차례로 돌려준다.
+
+    start(report)는 코루틴을 반환하고, 코루틴은 작업 하나가 끝날 때마다 report(item)을 호출한다.
+    항목마다 progress_callback(완료 수, total)을 호출하고, cancel_event가 set되면
+    진행 중인 요청을 취소하고 멈춘다 (Streamlit 콜백은 호출한 스레드에서만 실행).
+    """
+    done = queue.Queue()
+    future = _engine.submit(start(done.put))
+    completed = 0
+    while completed < total:
+        if cancel_event and cancel_event.is_set():
+            future.cancel()  # 진행 중인 API 요청까지 취소
+            return
+        try:
+            item = done.get(timeout=0.2)
+        except queue.Empty:
+            if future.done() and done.empty():
+                break
+            continue
+        completed += 1
+        if progress_callback:
+            progress_callback(completed, total)
+        yield item
+    # 코루틴에서 처리하지 못한 예외는 호출한 쪽으로 전달
+    future.result()
+
+
+def _api_key(name: str) -> str:
+    api_key = st.secrets.get(name, "")
+    return "" if api_key == "your-key-here" else api_key
+
+
+def _is_cacheable_translation(result: str) -> bool:
+    """오류·빈 응답("[...]" 형태)은 캐시에 저장하지 않는다."""
+    return bool(result) and not result.startswith("[")
+
+
+async def _cached_request(provider: str, model: str, system_prompt: str, text: str,
+                          request, timeout: float | None = None,
+                          cacheable=_is_cacheable_translation, **params) -> str:
+    """llm_cache에 있으면 캐시 응답을, 없으면 제공자 세마포어 안에서 request()를 실행한다."""
+    key = make_cache_key(provider, model, system_prompt, text, **params)
+    cached = await asyncio.to_thread(load_cached_response, key)
+    if cached is not None:
+        return cached
+
+    async with _engine.semaphore(provider):
+        if timeout is None:
+            result = await request()
+        else:
+            result = await asyncio.wait_for(request(), timeout)
+
+    if cacheable(result):
+        await asyncio.to_thread(save_cached_response, key, result, provider, model)
+    return result
+
+
+async def _request_gemini(api_key: str, text: str, system_prompt: str,
+                          response_schema: dict | None = None) -> str:
+    """Gemini API 호출 (캐시 없음, 속도는 rate_limit.get_limiter("gemini")로 조절).
+
+    response_schema를 주면 JSON 모드(response_schema)로 요청하고 JSON 텍스트를 그대로 반환한다.
+    """
+    model = _engine.gemini_model(api_key, system_prompt)
+    limiter = get_limiter("gemini")
+    generation_config = None
+    if response_schema is not None:
+        generation_config = {
+            "response_mime_type": "application/json",
+            "response_schema": response_schema,
+        }
 
     for attempt in range(MAX_RETRIES):
         try:
-            response = model.generate_content(
+            await limiter.acquire_async()
+            response = await model.generate_content_async(
                 text,
+                generation_config=generation_config,
                 request_options={"timeout": 120},
             )
+            limiter.on_success()
             # 응답이 차단되었거나 빈 경우 안전하게 처리
             if not response.candidates:
                 return "[Gemini 응답 없음]"
@@ -241,54 +401,120 @@ def _call_gemini_with_retry(text: str, system_prompt: str) -> str:
             if not candidate.content or not candidate.content.parts:
                 return "[Gemini 응답 없음]"
             raw = candidate.content.parts[0].text.strip()
+            if response_schema is not None:
+                return raw
             return _clean_translation_output(raw)
         except Exception as e:
+            wait = limiter.on_error(e, attempt)
             if attempt < MAX_RETRIES - 1:
-                wait = 3 * (attempt + 1)
-                time.sleep(wait)
+                await asyncio.sleep(wait)
             else:
                 error_name = type(e).__name__
-                if "ResourceExhausted" in error_name or "429" in str(e):
+                if is_rate_limit_error(e):
                     return "[Gemini 오류: API 할당량 초과 - 잠시 후 재시도]"
                 return f"[Gemini 오류: {error_name}]"
 
 
-def translate_gemini(text: str, system_prompt: str) -> str:
-    """Gemini API로 번역한다."""
-    api_key = st.secrets.get("GOOGLE_API_KEY", "")
-    if not api_key or api_key == "your-key-here":
-        return "[Gemini API 키 미설정]"
-    result = _call_gemini_with_retry(text, system_prompt)
-    return result if result else "[Gemini 번역 실패]"
+async def _request_claude(api_key: str, text: str, system_prompt: str,
+                          tool: dict | None = None) -> str:
+    """Claude API 호출 (캐시 없음, 속도는 rate_limit.get_limiter("claude")로 조절).
 
-
-def translate_claude(text: str, system_prompt: str) -> str:
-    """Claude API로 번역한다."""
-    api_key = st.secrets.get("ANTHROPIC_API_KEY", "")
-    if not api_key or api_key == "your-key-here":
-        return "[Claude API 키 미설정]"
+    tool을 주면 그 도구 호출을 강제하고(tool_choice), 스트리밍으로 받은 도구 입력 JSON
+    텍스트를 그대로 반환한다. 출력 한도에서 끊겨도 받은 만큼은 돌려준다.
+    """
+    client = _engine.claude_client(api_key)
+    limiter = get_limiter("claude")
 
     for attempt in range(MAX_RETRIES):
         try:
-            client = anthropic.Anthropic(api_key=api_key)
-            message = client.messages.create(
-                model="claude-sonnet-4-5-20250929",
-                max_tokens=8192,
+            await limiter.acquire_async()
+            if tool is not None:
+                raw = await _stream_tool_input(client, text, system_prompt, tool)
+                limiter.on_success()
+                return raw
+            message = await client.messages.create(
+                model=CLAUDE_MODEL,
+                max_tokens=CLAUDE_MAX_TOKENS,
                 system=system_prompt,
                 messages=[{"role": "user", "content": text}],
             )
+            limiter.on_success()
             raw = message.content[0].text.strip()
             return _clean_translation_output(raw)
         except Exception as e:
+            wait = limiter.on_error(e, attempt)
             if attempt < MAX_RETRIES - 1:
-                wait = 3 * (attempt + 1)
-                time.sleep(wait)
+                await asyncio.sleep(wait)
             else:
                 error_name = type(e).__name__
                 error_msg = str(e)[:200]
                 return f"[Claude 오류: {error_name} — {error_msg}]"
 
 
+async def _stream_tool_input(client, text: str, system_prompt: str, tool: dict) -> str:
+    """도구 호출을 강제한 Claude 요청을 스트리밍하고 도구 입력 JSON 조각을 이어 붙인다."""
+    raw = ""
+    async with client.messages.stream(
+        model=CLAUDE_MODEL,
+        max_tokens=CLAUDE_MAX_TOKENS,
+        system=system_prompt,
+        messages=[{"role": "user", "content": text}],
+        tools=[tool],
+        tool_choice={"type": "tool", "name": tool["name"]},
+    ) as stream:
+        async for event in stream:
+            if event.type == "content_block_delta" and event.delta.type == "input_json_delta":
+                raw += event.delta.partial_json
+    return raw
+
+
+async def translate_gemini_async(text: str, system_prompt: str, api_key: str,
+                                 timeout: float | None = None) -> str:
+    """Gemini API로 번역한다 (엔진 루프 안에서 await)."""
+    if not api_key:
+        return "[Gemini API 키 미설정]"
+    result = await _cached_request(
+        "gemini", GEMINI_MODEL, system_prompt, text,
+        lambda: _request_gemini(api_key, text, system_prompt),
+        timeout=timeout,
+    )
+    return result if result else "[Gemini 번역 실패]"
+
+
+async def translate_claude_async(text: str, system_prompt: str, api_key: str,
+                                 timeout: float | None = None) -> str:
+    """Claude API로 번역한다 (엔진 루프 안에서 await)."""
+    if not api_key:
+        return "[Claude API 키 미설정]"
+    return await _cached_request(
+        "claude", CLAUDE_MODEL, system_prompt, text,
+        lambda: _request_claude(api_key, text, system_prompt),
+        timeout=timeout,
+        max_tokens=CLAUDE_MAX_TOKENS,
+    )
+
+
+def _call_gemini_with_retry(text: str, system_prompt: str) -> str:
+    """Gemini API를 재시도 포함하여 호출한다 (같은 요청은 llm_cache 응답 재사용)."""
+    api_key = _api_key("GOOGLE_API_KEY")
+    if not api_key:
+        return ""
+    return _engine.run(_cached_request(
+        "gemini", GEMINI_MODEL, system_prompt, text,
+        lambda: _request_gemini(api_key, text, system_prompt),
+    ))
+
+
+def translate_gemini(text: str, system_prompt: str) -> str:
+    """Gemini API로 번역한다."""
+    return _engine.run(translate_gemini_async(text, system_prompt, _api_key("GOOGLE_API_KEY")))
+
+
+def translate_claude(text: str, system_prompt: str) -> str:
+    """Claude API로 번역한다 (같은 요청은 llm_cache 응답 재사용)."""
+    return _engine.run(translate_claude_async(text, system_prompt, _api_key("ANTHROPIC_API_KEY")))
+
+
 def summarize_diff(gemini_result: str, claude_result: str) -> str:
     """두 번역문의 해석 차이를 1문장으로 요약한다."""
     if gemini_result.startswith("[") or claude_result.startswith("["):
@@ -319,7 +545,7 @@ def translate_batch(
     Args:
         articles: [{'id': ..., 'text': ..., '조문번호': ...}, ...]
         source_lang: 'english' 또는 'chinese'
-        batch_size: 배치 크기 (rate limit 방지)
+        batch_size: 사용하지 않음 (호출 속도는 rate_limit의 제공자별 제한기가 조절)
         progress_callback: 진행률 콜백 함수 (current, total)
         group_by_article: True이면 조문 단위로 그룹화해서 번역 (빠름)
         use_gemini: Gemini 번역 사용 여부
@@ -365,14 +591,12 @@ def translate_batch(
         # Gemini 번역
         if use_gemini:
             gemini_text = translate_gemini(text, system_prompt)
-            time.sleep(1)
         else:
             gemini_text = "(Gemini 미사용)"
 
         # Claude 번역
         if use_claude:
             claude_text = translate_claude(text, system_prompt)
-            time.sleep(1)
         else:
             claude_text = "(Claude 미사용)"
 
@@ -390,10 +614,6 @@ def translate_batch(
                 result[key] = article[key]
         results.append(result)
 
-        # 배치 간 대기 (rate limit 방지)
-        if (i + 1) % batch_size == 0:
-            time.sleep(2)
-
         if progress_callback:
             progress_callback(i + 1, total)
 
@@ -410,24 +630,28 @@ def _translate_by_article_group(
 ) -> list[dict]:
     """조문 단위로 그룹화해서 동시 번역한다 (빠른 번역).
 
-    조문 간 동시 처리(max_workers=5)로 번역 속도를 크게 개선한다.
-    각 조문 내부에서는 Gemini+Claude 병렬 번역을 유지한다.
+    모든 조문 그룹을 번역 엔진(asyncio 루프)에서 동시에 실행한다.
+    동시 요청 수는 제공자별 세마포어(GEMINI_MAX_CONCURRENCY, CLAUDE_MAX_CONCURRENCY)로 제한하고,
+    각 조문 안에서는 Gemini와 Claude를 함께 요청한다.
+    progress_callback 호출과 cancel_event 확인은 호출한 스레드에서 한다.
 
     Args:
         articles: [{'id': ..., 'text': ..., '조문번호': ...}, ...]
         source_lang: 'english' 또는 'chinese'
-        progress_callback: 진행률 콜백
+        progress_callback: 진행률 콜백 (완료 조문 수, 전체 조문 수)
         use_gemini: Gemini 번역 사용 여부
         use_claude: Claude 번역 사용 여부
+        cancel_event: set되면 진행 중인 요청을 취소하고 그때까지의 결과만 반환
 
     Returns:
         [{'id', 'original', 'gemini', 'claude', 'diff_summary'}, ...]
     """
-    import threading
     from collections import defaultdict
-    from concurrent.futures import ThreadPoolExecutor, as_completed
 
     system_prompt = _get_system_prompt(source_lang)
+    # st.secrets는 호출한 스레드에서 읽어 엔진에 넘긴다
+    gemini_key = _api_key("GOOGLE_API_KEY") if use_gemini else ""
+    claude_key = _api_key("ANTHROPIC_API_KEY") if use_claude else ""
 
     # 조문 번호별로 그룹화
     groups = defaultdict(list)
@@ -435,167 +659,174 @@ def _translate_by_article_group(
         article_num = article.get('조문번호', article['id'])
         groups[article_num].append(article)
 
-    total_groups = len(groups)
-
-    # 단일 조문 그룹 번역 내부 함수
-    def _translate_one(article_num, group):
-        """단일 조문 그룹을 번역하여 결과 리스트를 반환한다."""
-        group_results = []
+    group_items = list(groups.items())
+    total_groups = len(group_items)
+    if total_groups == 0:
+        return []
 
-        # 삭제 조문 처리 (전문은 정상 번역)
-
-        if article_num.endswith("(삭제)"):
+    async def _translate_one(idx, article_num, group, report):
+        try:
+            group_results = await _translate_group_async(
+                article_num, group, system_prompt,
+                gemini_key, claude_key, use_gemini, use_claude,
+            )
+        except Exception as e:
+            # 예외 발생 시 해당 그룹의 모든 항목에 오류 결과 할당
+            group_results = []
             for article in group:
                 result = {
                     "id": article["id"],
-                    "original": "(삭제)",
-                    "gemini": "(삭제)",
-                    "claude": "(삭제)",
+                    "original": article.get("text", ""),
+                    "gemini": f"(번역 오류: {e})",
+                    "claude": f"(번역 오류: {e})",
                     "diff_summary": "-",
                 }
                 for key in ["편", "장", "절", "조문번호", "조문제목", "항", "호"]:
                     if key in article:
                         result[key] = article[key]
                 group_results.append(result)
-            return group_results
-
-        # 조문 전체 텍스트 합치기 (항/호/목/세목 번호 포함, 들여쓰기로 계층 구조 표현)
-        combined_parts = []
-        for art in group:
-            text = str(art.get("text", "")).strip()
-            if not text:
-                continue
-
-            prefix = ""
-            indent = ""
-            항 = art.get("항", "")
-            호 = art.get("호", "")
-            목 = art.get("목", "")
-            세목 = art.get("세목", "")
-
-            # 계층 구조: 항 → 호(2칸 들여쓰기) → 목(4칸 들여쓰기) → 세목(6칸 들여쓰기)
-            if 세목 and str(세목).strip():
-                # 세목이 있으면 6칸 들여쓰기
-                indent = "      "
-                세목_val = str(세목).strip()
-                # 이미 괄호가 있으면 그대로, 없으면 괄호 추가
-                prefix = f"{세목_val} " if (세목_val.startswith('(') and 세목_val.endswith(')')) else f"({세목_val}) "
-            elif 목 and str(목).strip():
-                # 목이 있으면 4칸 들여쓰기
-                indent = "    "
-                prefix = f"({목}) "
-            elif 호 and str(호).strip():
-                # 호가 있으면 2칸 들여쓰기
-                indent = "  "
-                try:
-                    호_num = int(float(호))
-                    prefix = f"{호_num}. "
-                except:
-                    prefix = f"({호}) "
-            elif 항 and str(항).strip():
-                # 항만 있으면 들여쓰기 없음
-                try:
-                    항_num = int(float(항))
-                    prefix = f"({항_num}) "
-                except:
-                    prefix = f"({항}) "
-
-            combined_parts.append(indent + prefix + text)
-
-        combined_text = "\n\n".join(combined_parts)
-
-        # 병렬 번역 (Gemini와 Claude를 동시에 실행)
-        gemini_text = "(Gemini 미사용)"
-        claude_text = "(Claude 미사용)"
-
-        futures = {}
-        with ThreadPoolExecutor(max_workers=2) as executor:
-            if use_gemini:
-                futures['gemini'] = executor.submit(translate_gemini, combined_text, system_prompt)
-            if use_claude:
-                futures['claude'] = executor.submit(translate_claude, combined_text, system_prompt)
-
-            for service, future in futures.items():
-                try:
-                    if service == 'gemini':
-                        gemini_text = future.result(timeout=120)
-                    elif service == 'claude':
-                        claude_text = future.result(timeout=120)
-                except Exception as e:
-                    if service == 'gemini':
-                        gemini_text = f"(번역 실패: {e})"
-                    elif service == 'claude':
-                        claude_text = f"(번역 실패: {e})"
+        report((idx, group_results))
 
-        # 차이 요약 단계 제거 (바로 매칭으로)
+    async def _translate_all(report):
+        await asyncio.gather(*(
+            _translate_one(idx, article_num, group, report)
+            for idx, (article_num, group) in enumerate(group_items)
+        ))
 
-        # 조 단위로 각 항목에 전체 번역 결과 할당
-        for i, article in enumerate(group):
+    ordered_results = [None] * total_groups
+    for idx, group_results in _iter_engine_results(
+        _translate_all, total_groups, progress_callback, cancel_event
+    ):
+        ordered_results[idx] = group_results
+
+    # 순서대로 결과 조립
+    results = []
+    for group_results in ordered_results:
+        if group_results:
+            results.extend(group_results)
+
+    return results
+
+
+def _combine_group_text(group: list[dict], parenthesize_sub_items: bool = True) -> str:
+    """조문 전체 텍스트 합치기 (항/호/목/세목 번호 포함, 들여쓰기로 계층 구조 표현).
+
+    parenthesize_sub_items가 False이면 세목 번호를 괄호 없이 그대로 쓴다 (배치 번역 형식).
+    """
+    combined_parts = []
+    for art in group:
+        text = str(art.get("text", "")).strip()
+        if not text:
+            continue
+
+        prefix = ""
+        indent = ""
+        항 = art.get("항", "")
+        호 = art.get("호", "")
+        목 = art.get("목", "")
+        세목 = art.get("세목", "")
+
+        # 계층 구조: 항 → 호(2칸 들여쓰기) → 목(4칸 들여쓰기) → 세목(6칸 들여쓰기)
+        if 세목 and str(세목).strip():
+            # 세목이 있으면 6칸 들여쓰기
+            indent = "      "
+            세목_val = str(세목).strip()
+            if not parenthesize_sub_items:
+                prefix = f"{세목} "
+            # 이미 괄호가 있으면 그대로, 없으면 괄호 추가
+            elif 세목_val.startswith('(') and 세목_val.endswith(')'):
+                prefix = f"{세목_val} "
+            else:
+                prefix = f"({세목_val}) "
+        elif 목 and str(목).strip():
+            # 목이 있으면 4칸 들여쓰기
+            indent = "    "
+            prefix = f"({목}) "
+        elif 호 and str(호).strip():
+            # 호가 있으면 2칸 들여쓰기
+            indent = "  "
+            try:
+                호_num = int(float(호))
+                prefix = f"{호_num}. "
+            except:
+                prefix = f"({호}) "
+        elif 항 and str(항).strip():
+            # 항만 있으면 들여쓰기 없음
+            try:
+                항_num = int(float(항))
+                prefix = f"({항_num}) "
+            except:
+                prefix = f"({항}) "
+
+        combined_parts.append(indent + prefix + text)
+
+    return "\n\n".join(combined_parts)
+
+
+async def _translate_group_async(
+    article_num: str,
+    group: list[dict],
+    system_prompt: str,
+    gemini_key: str,
+    claude_key: str,
+    use_gemini: bool,
+    use_claude: bool,
+) -> list[dict]:
+    """단일 조문 그룹을 번역하여 결과 리스트를 반환한다 (엔진 루프 안에서 실행)."""
+    group_results = []
+
+    # 삭제 조문 처리 (전문은 정상 번역)
+
+    if article_num.endswith("(삭제)"):
+        for article in group:
             result = {
                 "id": article["id"],
-                "original": combined_text if i == 0 else article["text"],
-                "gemini": gemini_text,
-                "claude": claude_text,
-                "diff_summary": "",  # 사용하지 않음
+                "original": "(삭제)",
+                "gemini": "(삭제)",
+                "claude": "(삭제)",
+                "diff_summary": "-",
             }
-            for key in ["편", "장", "절", "조문번호", "조문제목", "항", "호", "목", "세목"]:
+            for key in ["편", "장", "절", "조문번호", "조문제목", "항", "호"]:
                 if key in article:
                     result[key] = article[key]
             group_results.append(result)
-
         return group_results
 
-    # 동시 실행 (max_workers=5: 동시 5개 조문 처리)
-    lock = threading.Lock()
-    current = [0]
-    ordered_results = [None] * total_groups
+    combined_text = _combine_group_text(group)
 
-    with ThreadPoolExecutor(max_workers=5) as executor:
-        future_to_idx = {}
-        for idx, (article_num, group) in enumerate(groups.items()):
-            if cancel_event and cancel_event.is_set():
-                break  # 취소 시 새 작업 제출 중단
-            f = executor.submit(_translate_one, article_num, group)
-            future_to_idx[f] = idx
-
-        for future in as_completed(future_to_idx):
-            if cancel_event and cancel_event.is_set():
-                for f in future_to_idx:
-                    f.cancel()
-                break  # 취소 시 결과 처리 중단
-            idx = future_to_idx[future]
-            try:
-                ordered_results[idx] = future.result()
-            except Exception as e:
-                # 예외 발생 시 해당 그룹의 모든 항목에 오류 결과 할당
-                article_num, group = list(groups.items())[idx]
-                error_results = []
-                for article in group:
-                    result = {
-                        "id": article["id"],
-                        "original": article.get("text", ""),
-                        "gemini": f"(번역 오류: {e})",
-                        "claude": f"(번역 오류: {e})",
-                        "diff_summary": "-",
-                    }
-                    for key in ["편", "장", "절", "조문번호", "조문제목", "항", "호"]:
-                        if key in article:
-                            result[key] = article[key]
-                    error_results.append(result)
-                ordered_results[idx] = error_results
-
-            with lock:
-                current[0] += 1
-                if progress_callback:
-                    progress_callback(current[0], total_groups)
+    # 병렬 번역 (Gemini와 Claude를 동시에 요청)
+    async def _run(translate, api_key):
+        try:
+            return await translate(combined_text, system_prompt, api_key, timeout=_CALL_TIMEOUT)
+        except Exception as e:
+            return f"(번역 실패: {str(e) or type(e).__name__})"
 
-    # 순서대로 결과 조립
-    results = []
-    for group_results in ordered_results:
-        if group_results:
-            results.extend(group_results)
+    translations = {"gemini": "(Gemini 미사용)", "claude": "(Claude 미사용)"}
+    requests = {}
+    if use_gemini:
+        requests["gemini"] = _run(translate_gemini_async, gemini_key)
+    if use_claude:
+        requests["claude"] = _run(translate_claude_async, claude_key)
+    translations.update(zip(requests, await asyncio.gather(*requests.values())))
+    gemini_text, claude_text = translations["gemini"], translations["claude"]
 
-    return results
+    # 차이 요약 단계 제거 (바로 매칭으로)
+
+    # 조 단위로 각 항목에 전체 번역 결과 할당
+    for i, article in enumerate(group):
+        result = {
+            "id": article["id"],
+            "original": combined_text if i == 0 else article["text"],
+            "gemini": gemini_text,
+            "claude": claude_text,
+            "diff_summary": "",  # 사용하지 않음
+        }
+        for key in ["편", "장", "절", "조문번호", "조문제목", "항", "호", "목", "세목"]:
+            if key in article:
+                result[key] = article[key]
+        group_results.append(result)
+
+    return group_results
 
 
 def _detect_number_pattern(original_texts: list[str]) -> str | None:
@@ -719,29 +950,246 @@ def _split_translation(
     return [text] * expected_count
 
 
+# 배치 번역 토큰 예산 (제공자별 요청 하나 기준)
+#   input: 프롬프트에 들어가는 조문 토큰 합, output: 응답(번역 JSON) 토큰 합
+BATCH_TOKEN_BUDGETS = {
+    "gemini": {"input": 24000, "output": 24000},
+    "claude": {"input": 24000, "output": int(CLAUDE_MAX_TOKENS * 0.8)},
+}
+
+# 번역문(한국어) 토큰 ≈ 원문 토큰 × 이 비율 (여유 있게 잡음)
+_OUTPUT_TOKEN_RATIO = 2.0
+
+# 조문마다 붙는 JSON 키·따옴표·줄바꿈 이스케이프 토큰
+_BATCH_ITEM_OVERHEAD = 16
+
+_CJK_CHARS = re.compile(r"[ᄀ-ᇿ぀-ヿ㄰-㆏㐀-鿿가-힯豈-﫿]")
+
+
+def _estimate_tokens(text: str) -> int:
+    """토큰 수 추정 (한중일 문자 1자 ≈ 1토큰, 그 밖의 문자 4자 ≈ 1토큰)."""
+    cjk = len(_CJK_CHARS.findall(text))
+    return cjk + (len(text) - cjk + 3) // 4
+
+
+def _pack_batches(
+    item_tokens: dict[str, int],
+    input_budget: int,
+    output_budget: int,
+    max_items: int | None = None,
+) -> list[list[str]]:
+    """조문을 토큰 예산 안에서 최소 개수의 배치로 묶는다 (first-fit-decreasing).
+
+    토큰이 큰 조문부터 예산이 남는 첫 배치에 넣고, 들어갈 배치가 없으면 새 배치를 만든다.
+    혼자서 예산을 넘는 조문은 단독 배치가 된다.
+    배치 안 조문 순서와 배치 순서는 원래 순서(item_tokens의 순서)로 되돌린다.
+
+    Args:
+        item_tokens: {조문번호: 입력 토큰 추정치} (원래 순서)
+        input_budget: 배치당 입력 토큰 예산
+        output_budget: 배치당 출력 토큰 예산 (입력 × _OUTPUT_TOKEN_RATIO로 추정)
+        max_items: 배치당 최대 조문 수 (None이면 제한 없음)
+    """
+    position = {key: i for i, key in enumerate(item_tokens)}
+    bins = []  # [입력 합, 출력 합, 조문 목록]
+    for key in sorted(item_tokens, key=lambda k: (-item_tokens[k], position[k])):
+        tokens_in = item_tokens[key] + _BATCH_ITEM_OVERHEAD
+        tokens_out = int(item_tokens[key] * _OUTPUT_TOKEN_RATIO) + _BATCH_ITEM_OVERHEAD
+        for b in bins:
+            if (b[0] + tokens_in <= input_budget and b[1] + tokens_out <= output_budget
+                    and (max_items is None or len(b[2]) < max_items)):
+                b[0] += tokens_in
+                b[1] += tokens_out
+                b[2].append(key)
+                break
+        else:
+            bins.append([tokens_in, tokens_out, [key]])
+
+    batches = [sorted(b[2], key=position.__getitem__) for b in bins]
+    batches.sort(key=lambda batch: position[batch[0]])
+    return batches
+
+
+# 배치 번역 응답 스키마 (Claude 도구 입력 / Gemini response_schema)
+_BATCH_TRANSLATION_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "translations": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "id": {"type": "string"},
+                    "translation": {"type": "string"},
+                },
+                "required": ["id", "translation"],
+            },
+        },
+    },
+    "required": ["translations"],
+}
+
+_BATCH_TRANSLATION_TOOL = {
+    "name": "record_translations",
+    "description": "조문별 한국어 번역문을 기록한다.",
+    "input_schema": _BATCH_TRANSLATION_SCHEMA,
+}
+
+
+def _batch_prompt(batch_texts: dict[str, str]) -> str:
+    """배치 번역 프롬프트를 만든다."""
+    import json
+
+    texts_json = json.dumps(batch_texts, ensure_ascii=False, indent=2)
+    return f"""다음은 여러 조문의 텍스트입니다. 각 조문을 개별적으로 번역하여 JSON 형식으로 응답해주세요.
+
+**입력:**
+{texts_json}
+
+**응답 형식 (JSON만):**
+```json
+{{
+  "translations": [
+    {{"id": "조문ID1", "translation": "번역문1"}},
+    {{"id": "조문ID2", "translation": "번역문2"}}
+  ]
+}}
+```"""
+
+
+def _parse_batch_translations(response: str) -> dict[str, str]:
+    """배치 번역 응답에서 {조문ID: 번역문}을 꺼낸다.
+
+    구조화 출력({"translations": [{"id", "translation"}, ...]})과 예전 형식({"조문ID": "번역문"})을
+    모두 읽는다. 응답이 잘렸거나 앞뒤에 설명이 붙어도 완성된 항목만 돌려준다 (partial_json).
+    해석할 수 없으면 빈 dict.
+    """
+    parsed = parse_partial_json(response or "")
+    if not isinstance(parsed, dict):
+        return {}
+
+    entries = parsed.get("translations")
+    if isinstance(entries, list):
+        return {
+            str(entry["id"]): entry["translation"]
+            for entry in entries
+            if isinstance(entry, dict)
+            and isinstance(entry.get("translation"), str) and "id" in entry
+        }
+    return {str(key): value for key, value in parsed.items() if isinstance(value, str)}
+
+
+async def _request_batch(provider: str, prompt: str, system_prompt: str, api_key: str) -> str:
+    """구조화 출력으로 배치 번역을 요청하고 JSON 텍스트를 반환한다 (엔진 루프 안에서 await).
+
+    완성된 JSON 응답만 캐시에 저장한다.
+    """
+    if not api_key:
+        return ""
+    if provider == "gemini":
+        return await _cached_request(
+            "gemini", GEMINI_MODEL, system_prompt, prompt,
+            lambda: _request_gemini(api_key, prompt, system_prompt,
+                                    response_schema=_BATCH_TRANSLATION_SCHEMA),
+            cacheable=is_complete_json,
+            schema=_BATCH_TRANSLATION_TOOL["name"],
+        )
+    return await _cached_request(
+        "claude", CLAUDE_MODEL, system_prompt, prompt,
+        lambda: _request_claude(api_key, prompt, system_prompt, tool=_BATCH_TRANSLATION_TOOL),
+        cacheable=is_complete_json,
+        max_tokens=CLAUDE_MAX_TOKENS,
+        tool=_BATCH_TRANSLATION_TOOL["name"],
+    )
+
+
+async def _translate_batches_async(
+    provider: str,
+    batches: list[list[str]],
+    texts: dict[str, str],
+    system_prompt: str,
+    api_key: str,
+    report=None,
+) -> dict[str, str]:
+    """한 제공자로 배치들을 동시에 번역하고 {조문번호: 번역문}을 반환한다 (엔진 루프 안에서 실행).
+
+    배치는 구조화 출력(JSON 스키마)으로 요청하고, 응답이 잘렸거나 일부 조문이 빠졌으면
+    빠진 조문만 동시에 하나씩 번역한다.
+    모든 요청은 제공자 세마포어·속도 제한기를 거친다.
+    report를 주면 배치가 끝날 때마다 report((provider, 그 배치의 번역))을 호출한다.
+    """
+    label, translate = {
+        "gemini": ("Gemini", translate_gemini_async),
+        "claude": ("Claude", translate_claude_async),
+    }[provider]
+
+    async def _translate_batch(batch_idx, batch_article_nums):
+        batch_texts = {article_num: texts[article_num] for article_num in batch_article_nums}
+        try:
+            response = await _request_batch(provider, _batch_prompt(batch_texts), system_prompt, api_key)
+        except Exception as e:
+            print(f"⚠️ {label} 배치 {batch_idx+1} 번역 실패: {e}")
+            response = ""
+        parsed = _parse_batch_translations(response)
+        translations = {
+            article_num: parsed[str(article_num)]
+            for article_num in batch_article_nums
+            if str(article_num) in parsed
+        }
+
+        missing = [article_num for article_num in batch_article_nums if article_num not in translations]
+        if missing:
+            print(f"⚠️ {label} 배치 {batch_idx+1}: {len(missing)}/{len(batch_article_nums)}개 조문 누락 → 개별 번역")
+            # 빠진 조문만 개별 번역으로 폴백 (조문들을 동시에 요청)
+            fallback = await asyncio.gather(*(
+                translate(batch_texts[article_num], system_prompt, api_key)
+                for article_num in missing
+            ))
+            translations.update(zip(missing, fallback))
+        if report:
+            report((provider, translations))
+        return translations
+
+    translations = {}
+    # 결과는 배치 순서대로 합친다
+    for batch_translations in await asyncio.gather(*(
+        _translate_batch(batch_idx, batch_article_nums)
+        for batch_idx, batch_article_nums in enumerate(batches)
+    )):
+        translations.update(batch_translations)
+    return translations
+
+
 def translate_batch_smart(
     articles: list[dict],
     source_lang: str,
     progress_callback=None,
     use_gemini: bool = True,
     use_claude: bool = True,
-    batch_size: int = 15,
+    batch_size: int | None = None,
+    token_budgets: dict | None = None,
+    cancel_event=None,
 ) -> list[dict]:
-    """스마트 배치 번역: 조문들을 적절한 크기로 묶어서 일괄 번역한다.
+    """스마트 배치 번역: 조문들을 토큰 예산에 맞게 묶어서 일괄 번역한다.
+
+    제공자마다 BATCH_TOKEN_BUDGETS(입력/출력 토큰 예산) 안에서 가능한 한 적은 배치로 묶는다
+    (_pack_batches). 짧은 조문은 한 요청에 많이, 긴 조문은 적게 들어가서
+    출력 한도 초과로 개별 번역에 폴백하는 일을 줄인다.
+    Gemini·Claude의 모든 배치는 번역 엔진에서 동시에 실행한다.
 
     Args:
         articles: [{'id': ..., 'text': ..., '조문번호': ...}, ...]
         source_lang: 'english', 'chinese', 'german' 등
-        progress_callback: 진행률 콜백
+        progress_callback: 진행률 콜백 (완료 배치 수, 전체 배치 수)
         use_gemini: Gemini 번역 사용 여부
         use_claude: Claude 번역 사용 여부
-        batch_size: 한 번에 번역할 조문 수 (기본 15개)
+        batch_size: 한 번에 번역할 최대 조문 수 (None이면 토큰 예산만 적용)
+        token_budgets: 제공자별 예산 덮어쓰기 (예: {"claude": {"output": 4000}})
+        cancel_event: set되면 진행 중인 요청을 취소하고 그때까지 받은 번역만 사용
 
     Returns:
         [{'id', 'original', 'gemini', 'claude', 'diff_summary'}, ...]
     """
-    import json
-
     system_prompt = _get_system_prompt(source_lang)
 
     # 조문 번호별로 그룹화
@@ -764,144 +1212,67 @@ def translate_batch_smart(
     if not valid_groups:
         return _translate_by_article_group(articles, source_lang, progress_callback, use_gemini, use_claude)
 
-    # 조문을 배치로 나누기
-    article_nums = list(valid_groups.keys())
-    batches = [article_nums[i:i + batch_size] for i in range(0, len(article_nums), batch_size)]
-
-    results = []
-    total_batches = len(batches)
-
-    for batch_idx, batch_article_nums in enumerate(batches):
-        # 배치 내 조문 텍스트 구성
-        batch_texts = {}
-        for article_num in batch_article_nums:
-            group = valid_groups[article_num]
-            combined_parts = []
-
-            for art in group:
-                text = str(art.get("text", "")).strip()
-                if not text:
-                    continue
+    # 조문별 텍스트 구성 (항/호/목/세목 번호 추가, 들여쓰기로 계층 구조 표현)
+    texts = {
+        article_num: _combine_group_text(group, parenthesize_sub_items=False)
+        for article_num, group in valid_groups.items()
+    }
+    item_tokens = {article_num: _estimate_tokens(text) for article_num, text in texts.items()}
+
+    # 제공자별로 토큰 예산에 맞춰 배치 구성
+    provider_batches = {}
+    for provider, used in (("gemini", use_gemini), ("claude", use_claude)):
+        if not used:
+            continue
+        budget = {**BATCH_TOKEN_BUDGETS[provider], **(token_budgets or {}).get(provider, {})}
+        provider_batches[provider] = _pack_batches(
+            item_tokens, budget["input"], budget["output"], max_items=batch_size
+        )
 
-                # 항/호/목/세목 번호 추가 (들여쓰기로 계층 구조 표현)
-                prefix = ""
-                indent = ""
-                항 = art.get("항", "")
-                호 = art.get("호", "")
-                목 = art.get("목", "")
-                세목 = art.get("세목", "")
-
-                # 계층 구조: 항 → 호(2칸 들여쓰기) → 목(4칸 들여쓰기) → 세목(6칸 들여쓰기)
-                if 세목 and str(세목).strip():
-                    # 세목이 있으면 6칸 들여쓰기
-                    indent = "      "
-                    prefix = f"{세목} "
-                elif 목 and str(목).strip():
-                    # 목이 있으면 4칸 들여쓰기
-                    indent = "    "
-                    prefix = f"({목}) "
-                elif 호 and str(호).strip():
-                    # 호가 있으면 2칸 들여쓰기
-                    indent = "  "
-                    try:
-                        호_num = int(float(호))
-                        prefix = f"{호_num}. "
-                    except:
-                        prefix = f"({호}) "
-                elif 항 and str(항).strip():
-                    # 항만 있으면 들여쓰기 없음
-                    try:
-                        항_num = int(float(항))
-                        prefix = f"({항_num}) "
-                    except:
-                        prefix = f"({항}) "
-
-                combined_parts.append(indent + prefix + text)
-
-            batch_texts[article_num] = "\n\n".join(combined_parts)
-
-        # 배치 프롬프트 구성
-        texts_json = json.dumps(batch_texts, ensure_ascii=False, indent=2)
-        batch_content = f"""다음은 여러 조문의 텍스트입니다. 각 조문을 개별적으로 번역하여 JSON 형식으로 응답해주세요.
+    total_batches = sum(len(batches) for batches in provider_batches.values())
+    # st.secrets는 호출한 스레드에서 읽어 엔진에 넘긴다
+    api_keys = {"gemini": _api_key("GOOGLE_API_KEY"), "claude": _api_key("ANTHROPIC_API_KEY")}
 
-**입력:**
-{texts_json}
+    async def _translate_all(report):
+        # Gemini와 Claude 배치를 함께 실행
+        await asyncio.gather(*(
+            _translate_batches_async(
+                provider, batches, texts, system_prompt, api_keys[provider], report
+            )
+            for provider, batches in provider_batches.items()
+        ))
+
+    translations = {provider: {} for provider in provider_batches}
+    for provider, batch_translations in _iter_engine_results(
+        _translate_all, total_batches, progress_callback, cancel_event
+    ):
+        translations[provider].update(batch_translations)
+    gemini_translations = translations.get("gemini", {})
+    claude_translations = translations.get("claude", {})
+
+    # 결과는 원래 조문 순서로 구성
+    results = []
+    for article_num, group in valid_groups.items():
+        combined_text = texts[article_num]
 
-**응답 형식 (JSON만):**
-```json
-{{
-  "조문ID1": "번역문1",
-  "조문ID2": "번역문2"
-}}
-```"""
+        gemini_text = _clean_translation_output(gemini_translations.get(str(article_num), "(Gemini 미사용)"))
+        claude_text = _clean_translation_output(claude_translations.get(str(article_num), "(Claude 미사용)"))
 
-        # Gemini 배치 번역
-        gemini_translations = {}
-        if use_gemini:
-            try:
-                gemini_response = translate_gemini(batch_content, system_prompt)
-                if "```json" in gemini_response:
-                    json_start = gemini_response.find("```json") + 7
-                    json_end = gemini_response.find("```", json_start)
-                    json_text = gemini_response[json_start:json_end].strip()
-                else:
-                    json_text = gemini_response
-                gemini_translations = json.loads(json_text)
-            except Exception as e:
-                print(f"⚠️ Gemini 배치 {batch_idx+1} 번역 실패: {e}")
-                # 실패 시 이 배치는 개별 번역으로 폴백
-                for article_num in batch_article_nums:
-                    text = batch_texts[article_num]
-                    gemini_translations[article_num] = translate_gemini(text, system_prompt)
-                    time.sleep(0.5)
-
-        # Claude 배치 번역
-        claude_translations = {}
-        if use_claude:
-            try:
-                claude_response = translate_claude(batch_content, system_prompt)
-                if "```json" in claude_response:
-                    json_start = claude_response.find("```json") + 7
-                    json_end = claude_response.find("```", json_start)
-                    json_text = claude_response[json_start:json_end].strip()
-                else:
-                    json_text = claude_response
-                claude_translations = json.loads(json_text)
-            except Exception as e:
-                print(f"⚠️ Claude 배치 {batch_idx+1} 번역 실패: {e}")
-                # 실패 시 이 배치는 개별 번역으로 폴백
-                for article_num in batch_article_nums:
-                    text = batch_texts[article_num]
-                    claude_translations[article_num] = translate_claude(text, system_prompt)
-                    time.sleep(0.5)
-
-        # 배치 결과 구성
-        for article_num in batch_article_nums:
-            group = valid_groups[article_num]
-            combined_text = batch_texts[article_num]
-
-            gemini_text = _clean_translation_output(gemini_translations.get(str(article_num), "(Gemini 미사용)"))
-            claude_text = _clean_translation_output(claude_translations.get(str(article_num), "(Claude 미사용)"))
-
-            # 차이 요약 단계 제거 (바로 매칭으로)
-
-            # 각 항목에 결과 할당
-            for i, article in enumerate(group):
-                result = {
-                    "id": article["id"],
-                    "original": combined_text if i == 0 else article["text"],
-                    "gemini": gemini_text,
-                    "claude": claude_text,
-                    "diff_summary": "",  # 사용하지 않음
-                }
-                for key in ["편", "장", "절", "조문번호", "조문제목", "항", "호", "목", "세목"]:
-                    if key in article:
-                        result[key] = article[key]
-                results.append(result)
+        # 차이 요약 단계 제거 (바로 매칭으로)
 
-        # 진행률 업데이트
-        if progress_callback:
-            progress_callback(batch_idx + 1, total_batches)
+        # 각 항목에 결과 할당
+        for i, article in enumerate(group):
+            result = {
+                "id": article["id"],
+                "original": combined_text if i == 0 else article["text"],
+                "gemini": gemini_text,
+                "claude": claude_text,
+                "diff_summary": "",  # 사용하지 않음
+            }
+            for key in ["편", "장", "절", "조문번호", "조문제목", "항", "호", "목", "세목"]:
+                if key in article:
+                    result[key] = article[key]
+            results.append(result)
 
     # 스킵된 조문 처리 (삭제 조문만)
     for article_num, group in skip_groups.items():
@@ -0,0 +1,279 @@
+"""한국법 조문 임베딩 벡터 인덱스.
+
+정규화된 임베딩 행렬에서 질의별 상위 k개 조문(내적 = 코사인 유사도)을 찾는다.
+
+- BruteForceIndex: 전체 행렬곱 (정확, 조문 수천 개까지 충분히 빠름)
+- IVFIndex: k-means 군집(역색인)으로 질의와 가까운 군집 nprobe개만 검색 (근사, NumPy만 사용)
+  한국 지식재산권법·민법 전체처럼 수만 조문을 대상으로 할 때 사용한다.
+
+인덱스는 임베딩 캐시 폴더 안(<cache_key>/vector_index/)에 저장하고 mmap으로 연다.
+IVF는 군집 순서로 다시 배열한 임베딩 사본(vectors.npy)을 함께 저장한다.
+"""
+
+import json
+import os
+import shutil
+import threading
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+
+# 조문 수가 이 값 이상이면 build_vector_index("auto")가 IVF를 선택한다
+IVF_MIN_ROWS = 20000
+
+INDEX_META_FILE = "index.json"
+
+
+def _top_k(scores: np.ndarray, k: int) -> tuple[np.ndarray, np.ndarray]:
+    """행마다 상위 k개 (열 번호, 점수)를 점수 내림차순으로 반환한다 (np.argpartition)."""
+    n = scores.shape[1]
+    k = min(k, n)
+    if k <= 0:
+        empty = np.empty((scores.shape[0], 0))
+        return empty.astype(np.intp), empty.astype(np.float32)
+    if k < n:
+        candidates = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    else:
+        candidates = np.tile(np.arange(n), (scores.shape[0], 1))
+    candidate_scores = np.take_along_axis(scores, candidates, axis=1)
+    order = np.argsort(-candidate_scores, axis=1, kind="stable")
+    return (np.take_along_axis(candidates, order, axis=1),
+            np.take_along_axis(candidate_scores, order, axis=1))
+
+
+def _as_float32(embeddings) -> np.ndarray:
+    # float32 mmap은 복사하지 않고, float16 캐시는 한 번만 변환한다
+    return np.asarray(embeddings, dtype=np.float32)
+
+
+class VectorIndex(ABC):
+    """벡터 인덱스 기본 클래스."""
+
+    kind = ""
+
+    def __init__(self, embeddings):
+        self.embeddings = _as_float32(embeddings)
+
+    def __len__(self) -> int:
+        return self.embeddings.shape[0]
+
+    @abstractmethod
+    def search(self, queries, k: int) -> tuple[np.ndarray, np.ndarray]:
+        """질의별 상위 k개 행 번호와 점수를 반환한다.
+
+        Args:
+            queries: (질의 수, 차원) 정규화된 질의 임베딩
+            k: 질의당 결과 수
+
+        Returns:
+            (indices, scores) — 모두 (질의 수, min(k, 행 수)), 점수 내림차순
+        """
+
+    def _params(self) -> dict:
+        return {}
+
+    def _save_arrays(self, directory: str) -> None:
+        """index.json 외에 필요한 배열 파일을 directory에 쓴다."""
+
+    def save(self, directory: str) -> None:
+        """인덱스 구조를 directory에 저장한다 (원래 임베딩 행렬은 캐시의 것을 사용).
+
+        임시 폴더에 모두 쓴 뒤 폴더째 교체한다 (embedding_cache.save_index와 같은 방식).
+        다른 프로세스가 mmap으로 열어 둔 기존 파일을 덮어쓰지 않는다.
+        """
+        parent = os.path.dirname(os.path.abspath(directory))
+        os.makedirs(parent, exist_ok=True)
+        tmp_dir = f"{os.path.abspath(directory)}.{os.getpid()}.{threading.get_ident()}.tmp"
+        os.makedirs(tmp_dir, exist_ok=True)
+        try:
+            self._save_arrays(tmp_dir)
+            # index.json을 마지막에 써서, 이것이 있으면 완전한 인덱스로 본다
+            with open(os.path.join(tmp_dir, INDEX_META_FILE), "w", encoding="utf-8") as f:
+                json.dump({"kind": self.kind, "rows": len(self), **self._params()}, f)
+
+            if os.path.isdir(directory):
+                shutil.rmtree(directory, ignore_errors=True)
+            try:
+                os.replace(tmp_dir, directory)
+            except OSError:
+                # 다른 프로세스가 먼저 저장한 경우 (같은 임베딩으로 만든 인덱스이므로 그대로 사용)
+                pass
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+class BruteForceIndex(VectorIndex):
+    """전체 행렬곱으로 정확한 상위 k개를 찾는다."""
+
+    kind = "brute"
+
+    def search(self, queries, k: int) -> tuple[np.ndarray, np.ndarray]:
+        queries = np.asarray(queries, dtype=np.float32)
+        return _top_k(queries @ self.embeddings.T, k)
+
+
+class IVFIndex(VectorIndex):
+    """역색인(IVF) 근사 검색.
+
+    구면 k-means로 행을 nlist개 군집에 나누고, 질의마다 중심과 가장 가까운 nprobe개 군집의 행만
+    점수를 계산한다. nprobe를 늘리면 재현율이 오르고 속도는 느려진다.
+    군집별 행을 연속 메모리(vectors)에 모아 두고, 질의 묶음을 군집 단위 행렬곱으로 처리한다.
+
+    Args:
+        embeddings: (행 수, 차원) 정규화된 임베딩
+        nlist: 군집 수 (None이면 4·√행 수)
+        nprobe: 검색할 군집 수 (None이면 nlist/8)
+        train_size: k-means 학습 표본 수 (군집당 최대 이 배수)
+        iterations: k-means 반복 횟수
+        seed: 난수 시드 (같은 입력이면 같은 인덱스)
+    """
+
+    kind = "ivf"
+
+    # 한 번에 처리하는 질의 수 (후보 점수 행렬 메모리 제한)
+    query_chunk = 256
+
+    def __init__(self, embeddings, nlist: int | None = None, nprobe: int | None = None,
+                 train_size: int = 64, iterations: int = 10, seed: int = 0,
+                 _centroids=None, _order=None, _offsets=None, _vectors=None):
+        super().__init__(embeddings)
+        n = len(self)
+        self.nlist = max(1, min(nlist or int(4 * np.sqrt(n)), n))
+        self.nprobe = max(1, min(nprobe or max(1, self.nlist // 8), self.nlist))
+        if _centroids is not None:
+            self.centroids = _centroids
+            self.order = _order
+            self.offsets = _offsets
+            self.vectors = _vectors
+            return
+        self.centroids = self._train(train_size, iterations, seed)
+        assignment = self._assign(self.embeddings)
+        # 군집 번호로 정렬한 행 순서 + 군집별 시작 위치 (CSR 형태 역색인)
+        self.order = np.argsort(assignment, kind="stable").astype(np.int64)
+        counts = np.bincount(assignment, minlength=self.nlist)
+        self.offsets = np.concatenate([[0], np.cumsum(counts)]).astype(np.int64)
+        self.vectors = np.ascontiguousarray(self.embeddings[self.order])
+
+    def _train(self, train_size: int, iterations: int, seed: int) -> np.ndarray:
+        rng = np.random.default_rng(seed)
+        n = len(self)
+        sample_size = min(n, self.nlist * train_size)
+        sample = self.embeddings[np.sort(rng.choice(n, sample_size, replace=False))]
+        centroids = sample[rng.choice(sample_size, self.nlist, replace=False)].copy()
+        for _ in range(iterations):
+            assignment = np.argmax(sample @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assignment, sample)
+            counts = np.bincount(assignment, minlength=self.nlist)
+            empty = counts == 0
+            # 빈 군집은 임의 표본으로 다시 시작
+            if empty.any():
+                sums[empty] = sample[rng.choice(sample_size, int(empty.sum()), replace=False)]
+            norms = np.linalg.norm(sums, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            centroids = (sums / norms).astype(np.float32)
+        return centroids
+
+    def _assign(self, matrix: np.ndarray, chunk: int = 8192) -> np.ndarray:
+        assignment = np.empty(matrix.shape[0], dtype=np.int64)
+        for start in range(0, matrix.shape[0], chunk):
+            block = matrix[start:start + chunk]
+            assignment[start:start + chunk] = np.argmax(block @ self.centroids.T, axis=1)
+        return assignment
+
+    def search(self, queries, k: int, nprobe: int | None = None) -> tuple[np.ndarray, np.ndarray]:
+        queries = np.asarray(queries, dtype=np.float32)
+        nprobe = max(1, min(nprobe or self.nprobe, self.nlist))
+        k = min(k, len(self))
+        indices = np.empty((len(queries), k), dtype=np.intp)
+        scores = np.empty((len(queries), k), dtype=np.float32)
+        for start in range(0, len(queries), self.query_chunk):
+            chunk = slice(start, start + self.query_chunk)
+            indices[chunk], scores[chunk] = self._search_chunk(queries[chunk], k, nprobe)
+        return indices, scores
+
+    def _search_chunk(self, queries: np.ndarray, k: int, nprobe: int):
+        probes, _ = _top_k(queries @ self.centroids.T, nprobe)
+        sizes = np.diff(self.offsets)[probes]
+        # 질의마다 고른 군집의 후보를 한 행에 이어 붙인다: slot_start = 행 안에서의 시작 위치
+        slot_start = np.cumsum(sizes, axis=1) - sizes
+        width = max(int(sizes.sum(axis=1).max()), k)
+        candidate_scores = np.full((len(queries), width), -np.inf, dtype=np.float32)
+        candidate_rows = np.zeros((len(queries), width), dtype=np.int64)
+
+        # (질의, 군집) 쌍을 군집별로 묶어 군집마다 행렬곱 한 번
+        flat = probes.ravel()
+        by_cluster = np.argsort(flat, kind="stable")
+        bounds = np.searchsorted(flat[by_cluster], np.arange(self.nlist + 1))
+        for cluster in np.unique(flat):
+            lo, hi = self.offsets[cluster], self.offsets[cluster + 1]
+            if lo == hi:
+                continue
+            pairs = by_cluster[bounds[cluster]:bounds[cluster + 1]]
+            q_idx = pairs // nprobe
+            cols = slot_start.ravel()[pairs][None, :] + np.arange(hi - lo)[:, None]
+            candidate_scores[q_idx[None, :], cols] = self.vectors[lo:hi] @ queries[q_idx].T
+            candidate_rows[q_idx[None, :], cols] = np.arange(lo, hi)[:, None]
+
+        top, top_scores = _top_k(candidate_scores, k)
+        indices = self.order[np.take_along_axis(candidate_rows, top, axis=1)]
+
+        # 고른 군집의 행이 k개보다 적은 질의는 전체 검색
+        short = sizes.sum(axis=1) < k
+        if short.any():
+            exact, exact_scores = _top_k(queries[short] @ self.embeddings.T, k)
+            indices[short], top_scores[short] = exact, exact_scores
+        return indices, top_scores
+
+    def _params(self) -> dict:
+        return {"nlist": self.nlist, "nprobe": self.nprobe}
+
+    def _save_arrays(self, directory: str) -> None:
+        np.save(os.path.join(directory, "centroids.npy"), self.centroids)
+        np.save(os.path.join(directory, "order.npy"), self.order)
+        np.save(os.path.join(directory, "offsets.npy"), self.offsets)
+        np.save(os.path.join(directory, "vectors.npy"), self.vectors)
+
+
+def build_vector_index(embeddings, kind: str = "auto", **params) -> VectorIndex:
+    """임베딩 행렬로 벡터 인덱스를 만든다.
+
+    Args:
+        embeddings: (행 수, 차원) 정규화된 임베딩
+        kind: "brute", "ivf", "auto" (행 수가 IVF_MIN_ROWS 이상이면 IVF)
+        **params: IVFIndex 인자 (nlist, nprobe, ...)
+    """
+    if kind == "auto":
+        kind = "ivf" if len(embeddings) >= IVF_MIN_ROWS else "brute"
+    if kind == "brute":
+        return BruteForceIndex(embeddings)
+    if kind == "ivf":
+        return IVFIndex(embeddings, **params)
+    raise ValueError(f"지원하지 않는 벡터 인덱스 종류: {kind}")
+
+
+def load_vector_index(directory: str, embeddings) -> VectorIndex | None:
+    """save()로 저장한 인덱스를 불러온다. 없거나 임베딩 행 수가 다르면 None."""
+    try:
+        with open(os.path.join(directory, INDEX_META_FILE), "r", encoding="utf-8") as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if meta.get("rows") != len(embeddings):
+        return None
+
+    if meta.get("kind") == "brute":
+        return BruteForceIndex(embeddings)
+    if meta.get("kind") == "ivf":
+        try:
+            return IVFIndex(
+                embeddings, nlist=meta["nlist"], nprobe=meta["nprobe"],
+                _centroids=np.load(os.path.join(directory, "centroids.npy")),
+                _order=np.load(os.path.join(directory, "order.npy"), mmap_mode="r"),
+                _offsets=np.load(os.path.join(directory, "offsets.npy")),
+                _vectors=np.load(os.path.join(directory, "vectors.npy"), mmap_mode="r"),
+            )
+        except (OSError, ValueError, KeyError):
+            return None
+    return None